@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections, models
+from django.db.models.functions import Concat
 
 
 User = get_user_model()
@@ -48,6 +50,78 @@ class Department(models.Model):
         return f'{self.name}'
 
 
+NAME_FIELDS = ('last_name', 'first_name', 'second_name')
+
+
+def get_name_condition(word, prefix=''):
+    """Условие вхождения слова в фамилию, имя или отчество пользователя."""
+
+    condition = models.Q()
+    for field in NAME_FIELDS:
+        condition |= models.Q(**{f'{prefix}{field}__icontains': word})
+    return condition
+
+
+class EmployeeQuerySet(models.QuerySet):
+    """QuerySet Сотрудников."""
+
+    def assignable_by(self, employee):
+        """Сотрудники, которых сотрудник может назначить исполнителями."""
+
+        if employee.is_director():
+            return self.exclude(pk=employee.id, role=DIRECTOR)
+        elif employee.is_head_department():
+            return self.filter(
+                department=employee.department_id
+            ).exclude(
+                pk=employee.id
+            )
+        elif employee.is_deputy_head_department():
+            return self.filter(
+                department=employee.department_id,
+                role=EMPLOYEE
+            ).exclude(
+                pk=employee.id
+            )
+        return self.all()
+
+    def lookup(self, value):
+        """
+        Поиск сотрудников по частям ФИО: каждое слово строки поиска
+        должно входить в фамилию, имя или отчество.
+        В PostgreSQL условия icontains (UPPER(поле) LIKE UPPER(слово))
+        используют триграммный индекс GIN по UPPER(поле),
+        а результаты сортируются по сходству с полным именем.
+        """
+
+        is_postgresql = connections[self.db].vendor == 'postgresql'
+        queryset = self
+        for word in value.split():
+            # В SQLite LIKE не учитывает регистр только для латиницы.
+            words = {word} if is_postgresql else {
+                word, word.lower(), word.capitalize()
+            }
+            condition = models.Q()
+            for variant in words:
+                condition |= get_name_condition(variant, 'user__')
+            queryset = queryset.filter(condition)
+
+        if value.strip() and is_postgresql:
+            return queryset.annotate(
+                similarity=TrigramSimilarity(
+                    Concat(
+                        'user__last_name',
+                        models.Value(' '),
+                        'user__first_name',
+                        models.Value(' '),
+                        'user__second_name'
+                    ),
+                    value
+                )
+            ).order_by('-similarity', 'user__last_name', 'id')
+        return queryset.order_by('user__last_name', 'user__first_name', 'id')
+
+
 class Employee(models.Model):
     """Модель Сотрудника."""
 
@@ -71,6 +145,8 @@ class Employee(models.Model):
         default=ROLE_CHOICES[4][0]
     )
 
+    objects = EmployeeQuerySet.as_manager()
+
     class Meta:
         ordering = ['user']
         verbose_name = 'Сотрудник'
@@ -1,6 +1,12 @@
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.urls import reverse
+
 from rest_framework import serializers
 
 from departments.models import Department, Employee
+from tasks.fieldsets import SparseFieldsetSerializerMixin
 from users.serializers import CustomUserSerializer
 
 
@@ -16,12 +22,27 @@ class EmployeeCreateSerializer(serializers.ModelSerializer):
         )
     
 
-class EmployeeGetSerializer(serializers.ModelSerializer):
-    """Сериализатор профиля Сотрудника."""
+class EmployeeGetSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer
+):
+    """
+    Сериализатор профиля Сотрудника.
+
+    Количество поручений берется из аннотаций queryset, вложенные
+    списки ограничены последними поручениями, полные списки
+    доступны по ссылкам на постраничный список поручений.
+    """
+
+    expandable_fields = ('user', 'department')
 
     user = CustomUserSerializer(read_only=True)
+    initiator_tasks = serializers.SerializerMethodField()
+    execution_tasks = serializers.SerializerMethodField()
     initiator_tasks_count = serializers.SerializerMethodField()
     execution_tasks_count = serializers.SerializerMethodField()
+    initiator_tasks_url = serializers.SerializerMethodField()
+    execution_tasks_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Employee
@@ -32,47 +53,79 @@ class EmployeeGetSerializer(serializers.ModelSerializer):
             'initiator_tasks',
             'execution_tasks',
             'initiator_tasks_count',
-            'execution_tasks_count'
+            'execution_tasks_count',
+            'initiator_tasks_url',
+            'execution_tasks_url'
         )
 
     def get_initiator_tasks_count(self, employee):
+        if hasattr(employee, 'initiator_tasks_count'):
+            return employee.initiator_tasks_count
         return employee.initiator_tasks.count()
     
     def get_execution_tasks_count(self, employee):
+        if hasattr(employee, 'execution_tasks_count'):
+            return employee.execution_tasks_count
         return employee.execution_tasks.count()
 
+    def get_tasks_url(self, filter_name, employee):
+        url = reverse('tasks:task-list')
+        request = self.context.get('request')
+        if request is not None:
+            url = request.build_absolute_uri(url)
+        return f'{url}?{urlencode({filter_name: employee.id})}'
+
+    def get_initiator_tasks_url(self, employee):
+        return self.get_tasks_url('initiator', employee)
+
+    def get_execution_tasks_url(self, employee):
+        return self.get_tasks_url('executors', employee)
+
+    def get_recent_tasks(self, employee, name):
+        """Последние поручения: из prefetch или отдельным запросом."""
+
+        recent_tasks = getattr(employee, f'recent_{name}', None)
+        if recent_tasks is not None:
+            return recent_tasks
+        return getattr(employee, name).select_related(
+            'group', 'initiator__user'
+        ).order_by(
+            '-assignment_date', '-id'
+        )[:settings.EMPLOYEE_RECENT_TASKS_LIMIT]
+
+    def get_initiator_tasks(self, employee):
+        return [
+            {
+                'group': task.group.name if task.group else None,
+                'title': task.title,
+                'number': task.number,
+                'assignment_date': task.assignment_date,
+                'execution_date': task.execution_date,
+                'is_closed': task.is_closed,
+                'is_completed': task.is_completed
+            }
+            for task in self.get_recent_tasks(employee, 'initiator_tasks')
+        ]
+
+    def get_execution_tasks(self, employee):
+        return [
+            {
+                'group': task.group.name if task.group else None,
+                'title': task.title,
+                'number': task.number,
+                'initiator': f'{task.initiator.user.last_name} {task.initiator.user.first_name}',
+                'assignment_date': task.assignment_date,
+                'execution_date': task.execution_date,
+                'is_closed': task.is_closed,
+                'is_completed': task.is_completed
+            }
+            for task in self.get_recent_tasks(employee, 'execution_tasks')
+        ]
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        if data['department']:
+        if data.get('department') and self.is_expanded('department'):
             data['department'] = instance.department.name
-        data['initiator_tasks'] = []
-        for task in instance.initiator_tasks.all():
-            data['initiator_tasks'].append(
-                {
-                    'group': task.group.name,
-                    'title': task.title,
-                    'number': task.number,
-                    'assignment_date': task.assignment_date,
-                    'execution_date': task.execution_date,
-                    'is_closed': task.is_closed,
-                    'is_completed': task.is_completed
-                }
-            )
-        data['execution_tasks'] = []
-        for task in instance.execution_tasks.all():
-            data['execution_tasks'].append(
-                {
-                    'group': task.group.name,
-                    'title': task.title,
-                    'number': task.number,
-                    'initiator': f'{task.initiator.user.last_name} {task.initiator.user.first_name}',
-                    'assignment_date': task.assignment_date,
-                    'execution_date': task.execution_date,
-                    'is_closed': task.is_closed,
-                    'is_completed': task.is_completed
-                }
-            )
-
         return data
 
 
@@ -92,8 +145,42 @@ class EmployeeContextSerializer(serializers.ModelSerializer):
         )
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
-    """Сериализатор Подразделения."""
+class EmployeeLookupSerializer(serializers.Serializer):
+    """Краткий сериализатор Сотрудника для выбора исполнителей."""
+
+    id = serializers.IntegerField()
+    full_name = serializers.SerializerMethodField()
+    department = serializers.CharField(source='department__name', allow_null=True)
+    role = serializers.CharField()
+
+    def get_full_name(self, employee):
+        return ' '.join(
+            name for name in (
+                employee['user__last_name'],
+                employee['user__first_name'],
+                employee['user__second_name']
+            )
+            if name
+        )
+
+
+EMPLOYEES_COUNT = 'count'
+EMPLOYEES_IDS = 'ids'
+EMPLOYEES_FULL = 'full'
+
+EMPLOYEES_MODES = (EMPLOYEES_COUNT, EMPLOYEES_IDS, EMPLOYEES_FULL)
+
+
+class DepartmentSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer
+):
+    """
+    Сериализатор Подразделения.
+
+    Представление сотрудников задается в контексте ключом
+    employees_mode: количество, идентификаторы или полные данные.
+    """
 
     employees = EmployeeContextSerializer(
         read_only=True,
@@ -108,3 +195,18 @@ class DepartmentSerializer(serializers.ModelSerializer):
             'curator',
             'employees'
         )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        mode = self.context.get('employees_mode', EMPLOYEES_FULL)
+        if 'employees' not in fields:
+            return fields
+        if mode == EMPLOYEES_COUNT:
+            del fields['employees']
+            fields['employees_count'] = serializers.IntegerField(read_only=True)
+        elif mode == EMPLOYEES_IDS:
+            fields['employees'] = serializers.PrimaryKeyRelatedField(
+                read_only=True,
+                many=True
+            )
+        return fields
@@ -1,9 +1,22 @@
+import json
+from datetime import date, timedelta
+from unittest import skipUnless
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
-from departments.models import Employee, Department, ROLE_CHOICES
+from departments.models import (
+    Employee,
+    Department,
+    ROLE_CHOICES,
+    get_name_condition
+)
+from tasks.models import Group, Task
 
 
 User = get_user_model()
@@ -413,3 +426,295 @@ class EmployeeTests(APITestCase):
                 response_status[1],
                 f'Статус запроса для "{response_status[0]}" не соответствует ожидаемому!'
             )
+
+
+    def test_conditional_get(self):
+        """Проверка условных запросов к подразделениям и сотрудникам."""
+
+        urls = [
+            EmployeeTests.department_url,
+            EmployeeTests.department_url + f'{EmployeeTests.department.id}/',
+            EmployeeTests.employee_url,
+            EmployeeTests.employee_url + f'{EmployeeTests.head_department_employee.id}/'
+        ]
+
+        for url in urls:
+            response = EmployeeTests.auth_admin.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                EmployeeTests.auth_admin.get(
+                    url, HTTP_IF_NONE_MATCH=response['ETag']
+                ).status_code,
+                status.HTTP_304_NOT_MODIFIED,
+                f'Неизмененный ресурс "{url}" передан повторно!'
+            )
+            self.assertEqual(
+                EmployeeTests.auth_admin.get(
+                    url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+                ).status_code,
+                status.HTTP_304_NOT_MODIFIED,
+                f'If-Modified-Since не обработан для "{url}"!'
+            )
+
+        etags = [EmployeeTests.auth_admin.get(url)['ETag'] for url in urls]
+        EmployeeTests.department.name = 'Измененный отдел'
+        EmployeeTests.department.save()
+        for url, etag in zip(urls, etags):
+            self.assertEqual(
+                EmployeeTests.auth_admin.get(
+                    url, HTTP_IF_NONE_MATCH=etag
+                ).status_code,
+                status.HTTP_200_OK,
+                f'Измененный ресурс "{url}" не передан!'
+            )
+
+
+    def test_ndjson_list(self):
+        """Проверка потоковой выдачи списков в формате NDJSON."""
+
+        for url in (EmployeeTests.employee_url, EmployeeTests.department_url):
+            response = EmployeeTests.auth_admin.get(url, {'format': 'ndjson'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            lines = b''.join(response.streaming_content).decode().splitlines()
+            self.assertEqual(
+                [json.loads(line) for line in lines],
+                json.loads(json.dumps(EmployeeTests.auth_admin.get(url).data['results'])),
+                f'Строки NDJSON для "{url}" не соответствуют списку!'
+            )
+
+        self.assertEqual(
+            EmployeeTests.auth_director.get(
+                EmployeeTests.employee_url, {'format': 'ndjson'}
+            ).status_code,
+            status.HTTP_403_FORBIDDEN
+        )
+
+
+    def test_employee_lookup(self):
+        """
+        Проверка поиска исполнителей по ФИО с учетом
+        сотрудников, которых пользователь может назначить.
+        """
+
+        url = EmployeeTests.employee_url + 'lookup/'
+
+        response = EmployeeTests.auth_head_department.get(url, {'q': 'борис'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [{
+                'id': EmployeeTests.employee.id,
+                'full_name': 'Борисов Борис Борисович',
+                'department': 'test department',
+                'role': ROLE_CHOICES[4][0]
+            }]
+        )
+        self.assertEqual(
+            EmployeeTests.auth_head_department.get(url, {'q': 'Глеб Глебович'}).data[0]['id'],
+            EmployeeTests.deputy_head_department_employee.id,
+            'Поиск не учитывает несколько слов ФИО!'
+        )
+
+        lookup_ids = {
+            'director': (EmployeeTests.auth_director, 'иван', []),
+            'head_department': (EmployeeTests.auth_head_department, 'петр', []),
+            'deputy_head_department': (
+                EmployeeTests.auth_deputy_head_department,
+                'ов',
+                [EmployeeTests.admin_employee.id, EmployeeTests.employee.id]
+            ),
+            'employee': (
+                EmployeeTests.auth_employee,
+                'петров',
+                [EmployeeTests.deputy_director_employee.id]
+            )
+        }
+        for role, (client, query, expected_ids) in lookup_ids.items():
+            with self.subTest(role=role):
+                response = client.get(url, {'q': query})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [employee['id'] for employee in response.data],
+                    expected_ids,
+                    f'Поиск для "{role}" возвращает недоступных исполнителей!'
+                )
+
+        self.assertEqual(
+            EmployeeTests.guest_client.get(url, {'q': 'борис'}).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+
+    @skipUnless(
+        connection.vendor == 'postgresql',
+        'Триграммный индекс создается только в PostgreSQL.'
+    )
+    def test_employee_lookup_index(self):
+        """
+        Проверка плана (EXPLAIN) условия поиска по ФИО:
+        используется триграммный индекс по UPPER(поле).
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_indexscan = off')
+
+        self.assertIn(
+            'user_name_trgm_idx',
+            User.objects.filter(get_name_condition('Борис')).explain(),
+            'Поиск по ФИО не использует триграммный индекс!'
+        )
+
+
+    @override_settings(EMPLOYEE_RECENT_TASKS_LIMIT=2)
+    def test_employee_tasks_summary(self):
+        """
+        Проверка количества и последних поручений сотрудников
+        без запросов на каждое поручение или сотрудника.
+        """
+
+        group = Group.objects.create(name='test group')
+
+        def create_tasks(count):
+            for number in range(count):
+                task = Task.objects.create(
+                    title=f'summary task {Task.objects.count()}',
+                    initiator=EmployeeTests.head_department_employee,
+                    group=group,
+                    execution_date=date.today() + timedelta(days=10),
+                    resolution='test resolution'
+                )
+                task.executors.set(
+                    [EmployeeTests.employee, EmployeeTests.admin_employee]
+                )
+
+        create_tasks(3)
+        with CaptureQueriesContext(connection) as queries:
+            response = EmployeeTests.auth_admin.get(EmployeeTests.employee_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        employees = {
+            employee['user']['email']: employee
+            for employee in response.data['results']
+        }
+        head_department = employees[EmployeeTests.head_department_user.email]
+        self.assertEqual(head_department['initiator_tasks_count'], 3)
+        self.assertEqual(
+            [task['title'] for task in head_department['initiator_tasks']],
+            ['summary task 2', 'summary task 1'],
+            'Вложенный список не ограничен последними поручениями!'
+        )
+        employee = employees[EmployeeTests.employee_user.email]
+        self.assertEqual(employee['execution_tasks_count'], 3)
+        self.assertEqual(len(employee['execution_tasks']), 2)
+        self.assertEqual(
+            employee['execution_tasks'][0]['initiator'],
+            f'{EmployeeTests.head_department_user.last_name} '
+            f'{EmployeeTests.head_department_user.first_name}'
+        )
+
+        tasks_response = EmployeeTests.auth_admin.get(
+            employee['execution_tasks_url']
+        )
+        self.assertEqual(tasks_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            tasks_response.data['count'],
+            3,
+            'Ссылка на поручения исполнителя не фильтрует список!'
+        )
+        self.assertEqual(
+            EmployeeTests.auth_admin.get(
+                head_department['initiator_tasks_url']
+            ).data['count'],
+            3
+        )
+
+        create_tasks(5)
+        with CaptureQueriesContext(connection) as more_queries:
+            EmployeeTests.auth_admin.get(EmployeeTests.employee_url)
+        self.assertEqual(
+            len(more_queries),
+            len(queries),
+            'Число запросов зависит от количества поручений!'
+        )
+
+
+    def test_department_employees_modes(self):
+        """
+        Проверка режимов представления сотрудников подразделения
+        и загрузки сотрудников одним запросом.
+        """
+
+        department = Department.objects.create(name='org chart department')
+        url = EmployeeTests.department_url + f'{department.id}/'
+
+        def create_employees(count):
+            for number in range(count):
+                Employee.objects.create(
+                    user=User.objects.create(
+                        email=f'org{Employee.objects.count()}@mail.ru',
+                        first_name='Имя',
+                        second_name='Отчество',
+                        last_name=f'Фамилия {Employee.objects.count()}'
+                    ),
+                    department=department
+                )
+
+        create_employees(2)
+        with CaptureQueriesContext(connection) as queries:
+            response = EmployeeTests.auth_admin.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['employees']), 2)
+        self.assertEqual(
+            set(response.data['employees'][0]),
+            {'user', 'department', 'role'}
+        )
+
+        create_employees(3)
+        with CaptureQueriesContext(connection) as more_queries:
+            response = EmployeeTests.auth_admin.get(url)
+        self.assertEqual(len(response.data['employees']), 5)
+        self.assertEqual(
+            len(more_queries),
+            len(queries),
+            'Число запросов зависит от количества сотрудников!'
+        )
+
+        response = EmployeeTests.auth_admin.get(url, {'employees': 'count'})
+        self.assertEqual(response.data['employees_count'], 5)
+        self.assertNotIn('employees', response.data)
+
+        response = EmployeeTests.auth_admin.get(
+            EmployeeTests.department_url, {'employees': 'count'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [department['name'] for department in response.data['results']],
+            list(Department.objects.values_list('name', flat=True)),
+            'Подразделения в режиме count не отсортированы по наименованию!'
+        )
+
+        response = EmployeeTests.auth_admin.get(url, {'employees': 'ids'})
+        self.assertEqual(
+            response.data['employees'],
+            list(
+                Employee.objects.filter(
+                    department=department
+                ).order_by('id').values_list('id', flat=True)
+            )
+        )
+
+        self.assertEqual(
+            EmployeeTests.auth_admin.get(url, {'employees': 'all'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+        response = EmployeeTests.auth_admin.patch(
+            f'{url}?employees=all', {'name': 'renamed department'}
+        )
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_200_OK,
+            'Режим сотрудников проверяется при изменении подразделения!'
+        )
+        self.assertEqual(len(response.data['employees']), 5)
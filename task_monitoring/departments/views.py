@@ -1,17 +1,87 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from django.conf import settings
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 
-from rest_framework import permissions, viewsets
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view
+)
+
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
 from departments.models import Employee, Department
 
 from departments.serializers import (
+    EMPLOYEES_COUNT,
+    EMPLOYEES_FULL,
+    EMPLOYEES_IDS,
+    EMPLOYEES_MODES,
     EmployeeCreateSerializer,
     EmployeeGetSerializer,
+    EmployeeLookupSerializer,
     DepartmentSerializer
 )
 
 from departments.permissions import IsAdminOrDirectorOrCurrentUser
 
+from tasks.cache import (
+    get_directory_modified,
+    get_directory_version,
+    get_tasks_modified,
+    get_tasks_version
+)
+from tasks.conditional import ConditionalGetMixin, get_etag, get_timestamp
+from tasks.fieldsets import SparseFieldsetMixin
+from tasks.models import Task
+from tasks.renderers import NDJSONListMixin
+
+
+RECENT_TASK_FIELDS = (
+    'id',
+    'group__name',
+    'title',
+    'number',
+    'assignment_date',
+    'execution_date',
+    'is_closed',
+    'is_completed'
+)
+
+
+def count_subquery(queryset, field):
+    """Количество строк queryset для сотрудника коррелированным подзапросом."""
+
+    return Coalesce(
+        Subquery(
+            queryset.filter(
+                **{field: OuterRef('pk')}
+            ).order_by().values(field).annotate(
+                count=Count('*')
+            ).values('count')
+        ),
+        0
+    )
+
+
+def get_recent_tasks_prefetch(name, *fields, select_related=()):
+    """Prefetch последних поручений сотрудника с проекцией полей."""
+
+    return Prefetch(
+        name,
+        queryset=Task.objects.select_related(
+            'group', *select_related
+        ).only(
+            *RECENT_TASK_FIELDS, *fields
+        ).order_by(
+            '-assignment_date', '-id'
+        )[:settings.EMPLOYEE_RECENT_TASKS_LIMIT],
+        to_attr=f'recent_{name}'
+    )
+
 
 @extend_schema(tags=['Подразделения'])
 @extend_schema_view(
@@ -22,12 +92,84 @@ from departments.permissions import IsAdminOrDirectorOrCurrentUser
     partial_update=extend_schema(summary='Частичное изменение данных данных подразделения'),
     destroy=extend_schema(summary='Удаление данных подразделения'),
 )
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(
+    SparseFieldsetMixin,
+    NDJSONListMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     """Вьюсет Подразделения."""
 
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = (permissions.IsAdminUser,)
+    employees_query_param = 'employees'
+
+    def get_employees_mode(self):
+        """
+        Режим представления сотрудников (?employees=) для чтения
+        подразделений. Остальные действия представляют сотрудников полностью.
+        """
+
+        if self.action not in ('list', 'retrieve'):
+            return EMPLOYEES_FULL
+        mode = self.request.query_params.get(
+            self.employees_query_param, EMPLOYEES_FULL
+        )
+        if mode not in EMPLOYEES_MODES:
+            raise ValidationError({
+                self.employees_query_param: [
+                    'Допустимые значения: {}.'.format(', '.join(EMPLOYEES_MODES))
+                ]
+            })
+        return mode
+
+    def get_queryset(self):
+        queryset = self.defer_sparse_columns(super().get_queryset())
+        if not self.is_field_requested('employees'):
+            return queryset
+        mode = self.get_employees_mode()
+        if mode == EMPLOYEES_COUNT:
+            # GROUP BY отменяет сортировку из Meta.ordering.
+            return queryset.annotate(
+                employees_count=Count('employees')
+            ).order_by(*Department._meta.ordering)
+        if mode == EMPLOYEES_IDS:
+            return queryset.prefetch_related(
+                Prefetch(
+                    'employees',
+                    queryset=Employee.objects.order_by('id').only(
+                        'id', 'department_id'
+                    )
+                )
+            )
+        return queryset.prefetch_related(
+            Prefetch(
+                'employees',
+                queryset=Employee.objects.select_related('user', 'department')
+            )
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['employees_mode'] = self.get_employees_mode()
+        return context
+
+    def get_list_validators(self, queryset):
+        return (
+            get_etag(
+                'departments',
+                self.request.get_full_path(),
+                get_directory_version()
+            ),
+            get_timestamp(get_directory_modified())
+        )
+
+    def get_object_validators(self, instance):
+        return (
+            get_etag('department', instance.pk, get_directory_version()),
+            get_timestamp(get_directory_modified())
+        )
 
 
 @extend_schema(tags=['Сотрудники'])
@@ -39,7 +181,12 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary='Частичное изменение данных данных сотрудника'),
     destroy=extend_schema(summary='Удаление данных сотрудника'),
 )
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(
+    SparseFieldsetMixin,
+    NDJSONListMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     """Вьюсет профиля Сотрудника."""
 
     queryset = Employee.objects.select_related('user', 'department').all()
@@ -48,13 +195,118 @@ class EmployeeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve']:
+            queryset = self.get_profile_queryset(queryset)
         if (self.action == 'list'
             and not self.request.user.is_staff
             and not self.request.user.employee.is_director()):
             queryset = queryset.filter(pk=self.request.user.employee.id)
         return queryset
 
+    def get_profile_queryset(self, queryset):
+        """
+        Аннотации и prefetch профиля только для запрошенных полей
+        (?fields=); пользователь и подразделение присоединяются
+        только при развертывании (?expand=).
+        """
+
+        if self.get_sparse_fieldset() is not None:
+            queryset = self.defer_sparse_columns(
+                queryset.select_related(None)
+            )
+            for name in ('user', 'department'):
+                if self.is_field_expanded(name):
+                    queryset = queryset.select_related(name)
+
+        for name, queryset_count, field in (
+            ('initiator_tasks_count', Task.objects, 'initiator'),
+            (
+                'execution_tasks_count',
+                Task.executors.through.objects,
+                'employee'
+            )
+        ):
+            if self.is_field_requested(name):
+                queryset = queryset.annotate(
+                    **{name: count_subquery(queryset_count, field)}
+                )
+        if self.is_field_requested('initiator_tasks'):
+            queryset = queryset.prefetch_related(
+                get_recent_tasks_prefetch('initiator_tasks', 'initiator_id')
+            )
+        if self.is_field_requested('execution_tasks'):
+            queryset = queryset.prefetch_related(
+                get_recent_tasks_prefetch(
+                    'execution_tasks',
+                    'initiator__user__last_name',
+                    'initiator__user__first_name',
+                    select_related=('initiator__user',)
+                )
+            )
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ['list', 'retrieve']:
             return EmployeeGetSerializer
         return super().get_serializer_class()
+
+    def get_list_validators(self, queryset):
+        if (self.request.user.is_staff
+            or self.request.user.employee.is_director()):
+            employee_id = None
+        else:
+            employee_id = self.request.user.employee.id
+        return (
+            get_etag(
+                'employees',
+                self.request.user.pk,
+                self.request.get_full_path(),
+                get_tasks_version(employee_id),
+                get_directory_version()
+            ),
+            get_timestamp(
+                get_tasks_modified(employee_id),
+                get_directory_modified()
+            )
+        )
+
+    def get_object_validators(self, instance):
+        return (
+            get_etag(
+                'employee',
+                instance.pk,
+                get_tasks_version(instance.id),
+                get_directory_version()
+            ),
+            get_timestamp(
+                get_tasks_modified(instance.id),
+                get_directory_modified()
+            )
+        )
+
+    @extend_schema(
+        summary='Поиск исполнителей по ФИО',
+        parameters=[OpenApiParameter('q', description='Часть ФИО')],
+        responses=EmployeeLookupSerializer(many=True)
+    )
+    @action(
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def lookup(self, request):
+        employees = Employee.objects.assignable_by(
+            request.user.employee
+        ).lookup(
+            request.query_params.get('q', '')
+        ).values(
+            'id',
+            'user__last_name',
+            'user__first_name',
+            'user__second_name',
+            'department__name',
+            'role'
+        )[:settings.EMPLOYEE_LOOKUP_LIMIT]
+        return Response(
+            EmployeeLookupSerializer(employees, many=True).data,
+            status=status.HTTP_200_OK
+        )
@@ -0,0 +1,32 @@
+from django_filters.rest_framework import (
+    FilterSet,
+    DateFromToRangeFilter,
+    ModelMultipleChoiceFilter
+)
+
+from departments.models import Department
+from reports.models import DepartmentStatistics
+from tasks.models import Group
+
+
+class DepartmentStatisticsFilterSet(FilterSet):
+
+    assignment_date = DateFromToRangeFilter(
+        label='Дата поручения'
+    )
+    department = ModelMultipleChoiceFilter(
+        label='Подразделение',
+        queryset=Department.objects.all()
+    )
+    group = ModelMultipleChoiceFilter(
+        label='Тип поручения',
+        queryset=Group.objects.all()
+    )
+
+    class Meta:
+        model = DepartmentStatistics
+        fields = (
+            'assignment_date',
+            'department',
+            'group'
+        )
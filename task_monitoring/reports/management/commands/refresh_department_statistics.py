@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from reports.rollup import refresh_department_statistics
+
+
+class Command(BaseCommand):
+    """
+    Инкрементальное обновление сводной статистики подразделений.
+
+    Пересчитывает показатели только за даты поручений, измененных
+    после предыдущего запуска. Запускается периодически после
+    пересчета статусов поручений; после перевода сотрудников между
+    подразделениями - с параметром --all.
+    """
+
+    help = 'Обновление сводной статистики исполнения поручений.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Пересчитать статистику за все даты.'
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_department_statistics(full=options['all'])
+        if refreshed is None:
+            self.stdout.write('Статистика пересчитана полностью')
+        else:
+            self.stdout.write(f'Пересчитано дат статистики: {refreshed}')
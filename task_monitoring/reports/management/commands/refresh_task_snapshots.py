@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from reports.snapshots import refresh_task_snapshots
+
+
+class Command(BaseCommand):
+    """
+    Ежедневный снимок количества поручений на исполнении,
+    срочных и просроченных по подразделениям, типам поручений
+    и исполнителям. Запускается раз в сутки после пересчета
+    статусов поручений (update_task_statuses).
+    """
+
+    help = 'Снимок поручений на исполнении за текущую дату.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Пересобрать состояния всех поручений.'
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_task_snapshots(full=options['all'])
+        self.stdout.write(f'Обработано поручений: {refreshed}')
@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-18 09:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('tasks', '0007_task_completed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RefreshMark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True, verbose_name='Отчетная таблица')),
+                ('refreshed_at', models.DateTimeField(verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Отметка обновления отчета',
+                'verbose_name_plural': 'Отметки обновления отчетов',
+            },
+        ),
+        migrations.CreateModel(
+            name='DepartmentStatistics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('assignment_date', models.DateField(verbose_name='Дата поручения')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Всего поручений')),
+                ('open', models.PositiveIntegerField(default=0, verbose_name='На исполнении')),
+                ('overdue', models.PositiveIntegerField(default=0, verbose_name='Просрочено')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='Исполнено')),
+                ('completed_on_time', models.PositiveIntegerField(default=0, verbose_name='Исполнено в срок')),
+                ('delay_days', models.PositiveIntegerField(default=0, verbose_name='Суммарная задержка исполнения, дней')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departments.department', verbose_name='Подразделение')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tasks.group', verbose_name='Тип поручения')),
+            ],
+            options={
+                'verbose_name': 'Статистика подразделения',
+                'verbose_name_plural': 'Статистика подразделений',
+                'indexes': [models.Index(fields=['assignment_date', 'department'], name='department_statistics_date_idx')],
+            },
+        ),
+    ]
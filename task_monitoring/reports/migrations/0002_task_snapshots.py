@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-18 09:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('reports', '0001_initial'),
+        ('tasks', '0007_task_completed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskStateEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('on_execution', 'На исполнении'), ('urgent', 'Срочные'), ('overdue', 'Просроченные'), ('completed', 'Исполненные'), ('closed', 'Закрытые')], max_length=16, verbose_name='Статус исполнения')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='departments.department', verbose_name='Подразделение')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departments.employee', verbose_name='Исполнитель')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tasks.group', verbose_name='Тип поручения')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tasks.task', verbose_name='Поручение')),
+            ],
+            options={
+                'verbose_name': 'Состояние поручения',
+                'verbose_name_plural': 'Состояния поручений',
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата снимка')),
+                ('open', models.PositiveIntegerField(default=0, verbose_name='На исполнении')),
+                ('urgent', models.PositiveIntegerField(default=0, verbose_name='Срочные')),
+                ('overdue', models.PositiveIntegerField(default=0, verbose_name='Просроченные')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departments.department', verbose_name='Подразделение')),
+                ('employee', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='departments.employee', verbose_name='Исполнитель')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tasks.group', verbose_name='Тип поручения')),
+            ],
+            options={
+                'verbose_name': 'Снимок поручений',
+                'verbose_name_plural': 'Снимки поручений',
+                'indexes': [models.Index(fields=['department', 'employee', 'date'], name='task_snapshot_department_idx'), models.Index(fields=['employee', 'date'], name='task_snapshot_employee_idx'), models.Index(fields=['date'], name='task_snapshot_date_idx')],
+            },
+        ),
+    ]
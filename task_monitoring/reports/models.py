@@ -0,0 +1,216 @@
+from django.db import models
+
+from departments.models import Department, Employee
+from tasks.models import STATUS_CHOICES, Group, Task
+
+
+class RefreshMark(models.Model):
+    """
+    Модель отметки последнего обновления отчетной таблицы.
+
+    Следующее обновление обрабатывает только поручения,
+    измененные или удаленные после отметки.
+    """
+
+    name = models.CharField(
+        verbose_name='Отчетная таблица',
+        max_length=64,
+        unique=True
+    )
+    refreshed_at = models.DateTimeField(
+        verbose_name='Дата обновления'
+    )
+
+    class Meta:
+        verbose_name = 'Отметка обновления отчета'
+        verbose_name_plural = 'Отметки обновления отчетов'
+
+    def __str__(self):
+        return f'{self.name} - {self.refreshed_at}'
+
+
+class DepartmentStatistics(models.Model):
+    """
+    Модель сводной статистики исполнения поручений
+    по подразделению исполнителей, типу поручения и дате поручения.
+
+    Заполняется командой refresh_department_statistics.
+    """
+
+    department = models.ForeignKey(
+        Department,
+        verbose_name='Подразделение',
+        related_name='+',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True
+    )
+    group = models.ForeignKey(
+        Group,
+        verbose_name='Тип поручения',
+        related_name='+',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True
+    )
+    assignment_date = models.DateField(
+        verbose_name='Дата поручения'
+    )
+    total = models.PositiveIntegerField(
+        verbose_name='Всего поручений',
+        default=0
+    )
+    open = models.PositiveIntegerField(
+        verbose_name='На исполнении',
+        default=0
+    )
+    overdue = models.PositiveIntegerField(
+        verbose_name='Просрочено',
+        default=0
+    )
+    completed = models.PositiveIntegerField(
+        verbose_name='Исполнено',
+        default=0
+    )
+    completed_on_time = models.PositiveIntegerField(
+        verbose_name='Исполнено в срок',
+        default=0
+    )
+    delay_days = models.PositiveIntegerField(
+        verbose_name='Суммарная задержка исполнения, дней',
+        default=0
+    )
+
+    class Meta:
+        verbose_name = 'Статистика подразделения'
+        verbose_name_plural = 'Статистика подразделений'
+        indexes = [
+            models.Index(
+                fields=['assignment_date', 'department'],
+                name='department_statistics_date_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.department_id} - {self.group_id} - {self.assignment_date}'
+
+
+class TaskStateEntry(models.Model):
+    """
+    Модель текущего вклада поручения на исполнении в показатели
+    сотрудника-исполнителя.
+
+    Обновляется только для поручений, измененных после предыдущего
+    снимка; исполненные и закрытые поручения удаляются.
+    """
+
+    task = models.ForeignKey(
+        Task,
+        verbose_name='Поручение',
+        related_name='+',
+        on_delete=models.CASCADE
+    )
+    employee = models.ForeignKey(
+        Employee,
+        verbose_name='Исполнитель',
+        related_name='+',
+        on_delete=models.CASCADE
+    )
+    department = models.ForeignKey(
+        Department,
+        verbose_name='Подразделение',
+        related_name='+',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True
+    )
+    group = models.ForeignKey(
+        Group,
+        verbose_name='Тип поручения',
+        related_name='+',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True
+    )
+    status = models.CharField(
+        verbose_name='Статус исполнения',
+        max_length=16,
+        choices=STATUS_CHOICES
+    )
+
+    class Meta:
+        verbose_name = 'Состояние поручения'
+        verbose_name_plural = 'Состояния поручений'
+
+    def __str__(self):
+        return f'{self.task_id} - {self.employee_id} - {self.status}'
+
+
+class TaskSnapshot(models.Model):
+    """
+    Модель ежедневного снимка количества поручений на исполнении.
+
+    Строки с исполнителем - показатели сотрудника, без исполнителя -
+    показатели подразделения (поручение учитывается один раз).
+    """
+
+    date = models.DateField(
+        verbose_name='Дата снимка'
+    )
+    department = models.ForeignKey(
+        Department,
+        verbose_name='Подразделение',
+        related_name='+',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True
+    )
+    group = models.ForeignKey(
+        Group,
+        verbose_name='Тип поручения',
+        related_name='+',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True
+    )
+    employee = models.ForeignKey(
+        Employee,
+        verbose_name='Исполнитель',
+        related_name='+',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True
+    )
+    open = models.PositiveIntegerField(
+        verbose_name='На исполнении',
+        default=0
+    )
+    urgent = models.PositiveIntegerField(
+        verbose_name='Срочные',
+        default=0
+    )
+    overdue = models.PositiveIntegerField(
+        verbose_name='Просроченные',
+        default=0
+    )
+
+    class Meta:
+        verbose_name = 'Снимок поручений'
+        verbose_name_plural = 'Снимки поручений'
+        indexes = [
+            models.Index(
+                fields=['department', 'employee', 'date'],
+                name='task_snapshot_department_idx'
+            ),
+            models.Index(
+                fields=['employee', 'date'],
+                name='task_snapshot_employee_idx'
+            ),
+            models.Index(
+                fields=['date'],
+                name='task_snapshot_date_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.date} - {self.department_id} - {self.employee_id}'
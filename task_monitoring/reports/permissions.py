@@ -0,0 +1,13 @@
+from rest_framework import permissions
+
+
+class IsAdminOrDirectorate(permissions.BasePermission):
+    """Администратор, директор или заместитель директора."""
+
+    def has_permission(self, request, view):
+        return (
+            request.user.is_authenticated
+            and (request.user.is_staff
+                 or request.user.employee.is_director()
+                 or request.user.employee.is_deputy_director())
+        )
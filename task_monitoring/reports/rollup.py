@@ -0,0 +1,176 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from departments.models import Employee
+from reports.models import DepartmentStatistics, RefreshMark
+from tasks.models import OVERDUE, Task, TaskTombstone
+
+
+DEPARTMENT_STATISTICS = 'department_statistics'
+
+DATES_CHUNK_SIZE = 500
+
+STATISTICS_SQL = '''
+SELECT
+    pairs.department_id,
+    pairs.group_id,
+    pairs.assignment_date,
+    COUNT(*),
+    SUM(CASE WHEN NOT pairs.is_completed AND NOT pairs.is_closed
+        THEN 1 ELSE 0 END),
+    SUM(CASE WHEN pairs.status = %s THEN 1 ELSE 0 END),
+    SUM(CASE WHEN pairs.is_completed THEN 1 ELSE 0 END),
+    SUM(CASE WHEN pairs.is_completed
+        AND pairs.completed_date <= pairs.execution_date
+        THEN 1 ELSE 0 END),
+    SUM(CASE WHEN pairs.is_completed
+        AND pairs.completed_date > pairs.execution_date
+        THEN {delay} ELSE 0 END)
+FROM (
+    SELECT DISTINCT
+        employee.department_id,
+        task.id,
+        task.group_id,
+        task.assignment_date,
+        task.execution_date,
+        task.is_completed,
+        task.is_closed,
+        task.status,
+        {completed_date} AS completed_date
+    FROM {task} task
+    INNER JOIN {executors} executors ON executors.task_id = task.id
+    INNER JOIN {employee} employee ON employee.id = executors.employee_id
+    WHERE {where}
+) pairs
+GROUP BY pairs.department_id, pairs.group_id, pairs.assignment_date
+'''
+
+
+def get_delay_sql():
+    """Задержка исполнения в днях: разность дат средствами СУБД."""
+
+    if connection.vendor == 'postgresql':
+        return 'pairs.completed_date - pairs.execution_date'
+    return (
+        'CAST(julianday(pairs.completed_date) '
+        '- julianday(pairs.execution_date) AS INTEGER)'
+    )
+
+
+def get_statistics_rows(dates=None):
+    """
+    Сводные показатели исполнения поручений одним агрегирующим
+    запросом. Поручение учитывается в подразделении один раз,
+    сколько бы исполнителей подразделения в нем ни было.
+    """
+
+    quote_name = connection.ops.quote_name
+    completed_date, params = connection.ops.datetime_cast_date_sql(
+        'task.completed_at', (), timezone.get_current_timezone_name()
+    )
+    if dates is None:
+        where, where_params = '1 = 1', []
+    else:
+        where = 'task.assignment_date IN ({})'.format(
+            ', '.join(['%s'] * len(dates))
+        )
+        where_params = list(dates)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            STATISTICS_SQL.format(
+                delay=get_delay_sql(),
+                completed_date=completed_date,
+                task=quote_name(Task._meta.db_table),
+                executors=quote_name(Task.executors.through._meta.db_table),
+                employee=quote_name(Employee._meta.db_table),
+                where=where
+            ),
+            [OVERDUE, *params, *where_params]
+        )
+        return cursor.fetchall()
+
+
+def get_changed_dates(since):
+    """Даты поручений, измененных или удаленных после отметки."""
+
+    dates = set(
+        Task.objects.filter(
+            updated_at__gte=since
+        ).order_by().values_list('assignment_date', flat=True).distinct()
+    )
+    dates.update(
+        TaskTombstone.objects.filter(
+            deleted_at__gte=since,
+            assignment_date__isnull=False
+        ).order_by().values_list('assignment_date', flat=True).distinct()
+    )
+    return sorted(dates)
+
+
+def write_statistics(rows):
+    DepartmentStatistics.objects.bulk_create(
+        DepartmentStatistics(
+            department_id=department_id,
+            group_id=group_id,
+            assignment_date=assignment_date,
+            total=total,
+            open=open_count,
+            overdue=overdue,
+            completed=completed,
+            completed_on_time=completed_on_time,
+            delay_days=delay_days
+        )
+        for (
+            department_id,
+            group_id,
+            assignment_date,
+            total,
+            open_count,
+            overdue,
+            completed,
+            completed_on_time,
+            delay_days
+        ) in rows
+    )
+
+
+def refresh_department_statistics(full=False):
+    """
+    Обновление сводной статистики подразделений.
+
+    Пересчитываются только даты поручений, измененных или удаленных
+    после предыдущего обновления за вычетом TASK_CHANGES_SAFETY_LAG
+    (изменения долгих транзакций фиксируются позже начала запуска);
+    при full или первом запуске - вся таблица. Повторный запуск безопасен.
+    Возвращает количество пересчитанных дат или None при полном пересчете.
+    """
+
+    started_at = timezone.now()
+    with transaction.atomic():
+        mark = RefreshMark.objects.select_for_update().filter(
+            name=DEPARTMENT_STATISTICS
+        ).first()
+
+        if full or mark is None:
+            DepartmentStatistics.objects.all().delete()
+            write_statistics(get_statistics_rows())
+            refreshed = None
+        else:
+            dates = get_changed_dates(
+                mark.refreshed_at - settings.TASK_CHANGES_SAFETY_LAG
+            )
+            for start in range(0, len(dates), DATES_CHUNK_SIZE):
+                chunk = dates[start:start + DATES_CHUNK_SIZE]
+                DepartmentStatistics.objects.filter(
+                    assignment_date__in=chunk
+                ).delete()
+                write_statistics(get_statistics_rows(chunk))
+            refreshed = len(dates)
+
+        RefreshMark.objects.update_or_create(
+            name=DEPARTMENT_STATISTICS,
+            defaults={'refreshed_at': started_at}
+        )
+    return refreshed
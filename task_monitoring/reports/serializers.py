@@ -0,0 +1,59 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+
+class TaskTrendQuerySerializer(serializers.Serializer):
+    """Параметры запроса динамики поручений."""
+
+    department = serializers.IntegerField(required=False)
+    group = serializers.IntegerField(required=False)
+    employee = serializers.IntegerField(required=False)
+    days = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.REPORT_TREND_MAX_DAYS,
+        default=settings.REPORT_TREND_MAX_DAYS
+    )
+
+
+class IndicatorsSerializer(serializers.Serializer):
+    """Показатели исполнения поручений."""
+
+    total = serializers.IntegerField()
+    open = serializers.IntegerField()
+    overdue = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    completed_on_time = serializers.IntegerField()
+    on_time_rate = serializers.FloatField(allow_null=True)
+    average_delay = serializers.FloatField(allow_null=True)
+
+
+class GroupStatisticsSerializer(IndicatorsSerializer):
+    """Показатели исполнения по типу поручения."""
+
+    group = serializers.IntegerField(allow_null=True)
+    group_name = serializers.CharField(allow_null=True)
+
+
+class DepartmentStatisticsSerializer(IndicatorsSerializer):
+    """Показатели исполнения подразделения."""
+
+    department = serializers.IntegerField(allow_null=True)
+    department_name = serializers.CharField(allow_null=True)
+    groups = GroupStatisticsSerializer(many=True)
+
+
+class DepartmentReportSerializer(serializers.Serializer):
+    """Отчет по подразделениям."""
+
+    refreshed_at = serializers.DateTimeField(allow_null=True)
+    results = DepartmentStatisticsSerializer(many=True)
+
+
+class TaskTrendSerializer(serializers.Serializer):
+    """Показатели поручений на исполнении за день."""
+
+    date = serializers.DateField()
+    open = serializers.IntegerField()
+    urgent = serializers.IntegerField()
+    overdue = serializers.IntegerField()
@@ -0,0 +1,128 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from reports.models import RefreshMark, TaskSnapshot, TaskStateEntry
+from tasks.models import OVERDUE, URGENT, Task
+
+
+TASK_SNAPSHOTS = 'task_snapshots'
+
+TASKS_CHUNK_SIZE = 1000
+
+
+def build_state_entries(task_ids):
+    """Вклад поручений на исполнении по каждому исполнителю."""
+
+    return [
+        TaskStateEntry(
+            task_id=task_id,
+            employee_id=employee_id,
+            department_id=department_id,
+            group_id=group_id,
+            status=status
+        )
+        for task_id, employee_id, department_id, group_id, status in (
+            Task.executors.through.objects.filter(
+                task_id__in=task_ids,
+                task__is_completed=False,
+                task__is_closed=False
+            ).values_list(
+                'task_id',
+                'employee_id',
+                'employee__department_id',
+                'task__group_id',
+                'task__status'
+            )
+        )
+    ]
+
+
+def refresh_state_entries(since=None):
+    """
+    Обновление состояний поручений, измененных после отметки
+    (при since=None - всех поручений). Удаленные поручения
+    удаляются из состояний каскадно.
+    Возвращает количество обработанных поручений.
+    """
+
+    queryset = Task.objects.order_by('id')
+    if since is None:
+        TaskStateEntry.objects.all().delete()
+        queryset = queryset.filter(is_completed=False, is_closed=False)
+    else:
+        queryset = queryset.filter(updated_at__gte=since)
+
+    task_ids = list(queryset.values_list('id', flat=True))
+    for start in range(0, len(task_ids), TASKS_CHUNK_SIZE):
+        chunk = task_ids[start:start + TASKS_CHUNK_SIZE]
+        TaskStateEntry.objects.filter(task_id__in=chunk).delete()
+        TaskStateEntry.objects.bulk_create(build_state_entries(chunk))
+    return len(task_ids)
+
+
+def get_snapshot_counts(distinct):
+    return {
+        'open': Count('task_id', distinct=distinct),
+        'urgent': Count('task_id', distinct=distinct, filter=Q(status=URGENT)),
+        'overdue': Count('task_id', distinct=distinct, filter=Q(status=OVERDUE))
+    }
+
+
+def write_snapshot(date):
+    """
+    Снимок за дату из текущих состояний поручений двумя
+    агрегирующими запросами: по сотрудникам и по подразделениям.
+    """
+
+    TaskSnapshot.objects.filter(date=date).delete()
+    employees = TaskStateEntry.objects.values(
+        'department', 'group', 'employee'
+    ).annotate(**get_snapshot_counts(distinct=False)).order_by()
+    departments = TaskStateEntry.objects.values(
+        'department', 'group'
+    ).annotate(**get_snapshot_counts(distinct=True)).order_by()
+
+    TaskSnapshot.objects.bulk_create(
+        TaskSnapshot(
+            date=date,
+            department_id=row['department'],
+            group_id=row['group'],
+            employee_id=row.get('employee'),
+            open=row['open'],
+            urgent=row['urgent'],
+            overdue=row['overdue']
+        )
+        for rows in (employees, departments)
+        for row in rows
+    )
+
+
+def refresh_task_snapshots(full=False):
+    """
+    Ежедневный снимок поручений на исполнении.
+
+    Состояния обновляются только для поручений, измененных
+    после предыдущего запуска за вычетом TASK_CHANGES_SAFETY_LAG
+    (изменения долгих транзакций фиксируются позже начала запуска),
+    снимок за текущую дату перезаписывается, поэтому повторный
+    запуск безопасен.
+    Возвращает количество обработанных поручений.
+    """
+
+    started_at = timezone.now()
+    with transaction.atomic():
+        mark = RefreshMark.objects.select_for_update().filter(
+            name=TASK_SNAPSHOTS
+        ).first()
+        refreshed = refresh_state_entries(
+            None if full or mark is None
+            else mark.refreshed_at - settings.TASK_CHANGES_SAFETY_LAG
+        )
+        write_snapshot(timezone.localdate(started_at))
+        RefreshMark.objects.update_or_create(
+            name=TASK_SNAPSHOTS,
+            defaults={'refreshed_at': started_at}
+        )
+    return refreshed
@@ -0,0 +1,321 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from departments.models import Employee, Department, ROLE_CHOICES
+from reports.models import RefreshMark, TaskSnapshot
+from reports.rollup import DEPARTMENT_STATISTICS
+from reports.snapshots import TASK_SNAPSHOTS
+from tasks.models import Task, Group
+
+
+User = get_user_model()
+
+
+class ReportTests(APITestCase):
+    """Тестирование кейса отчетов."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.department_1 = Department.objects.create(
+            name='test department_1'
+        )
+        cls.department_2 = Department.objects.create(
+            name='test department_2'
+        )
+        cls.group = Group.objects.create(
+            name='test group'
+        )
+
+        cls.director_user = User.objects.create(
+            email='director@mail.ru',
+            first_name='Иван',
+            second_name='Иванович',
+            last_name='Иванов'
+        )
+        cls.employee_users = [
+            User.objects.create(
+                email=f'employee{number}@mail.ru',
+                first_name=f'Сотрудник {number}',
+                second_name='Сотрудникович',
+                last_name='Сотрудников'
+            )
+            for number in range(3)
+        ]
+
+        cls.director_employee = Employee.objects.create(
+            user=cls.director_user,
+            role=ROLE_CHOICES[0][0]
+        )
+        cls.employees = [
+            Employee.objects.create(
+                user=user,
+                department=department
+            )
+            for user, department in zip(
+                cls.employee_users,
+                (cls.department_1, cls.department_1, cls.department_2)
+            )
+        ]
+
+        cls.auth_director = APIClient()
+        cls.auth_employee = APIClient()
+        cls.auth_director.force_authenticate(cls.director_user)
+        cls.auth_employee.force_authenticate(cls.employee_users[0])
+
+        cls.report_url = '/api/reports/departments/'
+        cls.trend_url = '/api/reports/trends/'
+
+
+    def create_task(self, title, executors, execution_date, **kwargs):
+        task = Task.objects.create(
+            title=title,
+            initiator=ReportTests.director_employee,
+            group=ReportTests.group,
+            execution_date=execution_date,
+            resolution='test resolution',
+            **kwargs
+        )
+        task.executors.set(executors)
+        return task
+
+    def get_report(self):
+        response = ReportTests.auth_director.get(ReportTests.report_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            department['department']: department
+            for department in response.data['results']
+        }
+
+
+    def test_department_report(self):
+        """
+        Проверка отчета по подразделениям из сводной таблицы
+        и ее инкрементального обновления.
+        """
+
+        today = timezone.localdate()
+        employee_1, employee_2, employee_3 = ReportTests.employees
+        task_1 = self.create_task(
+            'open task', [employee_1, employee_2], today + timedelta(days=10)
+        )
+        self.create_task(
+            'late task', [employee_1, employee_3], today - timedelta(days=5),
+            is_completed=True
+        )
+        task_3 = self.create_task(
+            'overdue task', [employee_3], today - timedelta(days=1)
+        )
+
+        call_command('refresh_department_statistics', stdout=StringIO())
+
+        with CaptureQueriesContext(connection) as queries:
+            report = self.get_report()
+        self.assertFalse(
+            any(Task._meta.db_table in query['sql'] for query in queries),
+            'Отчет обращается к таблице поручений!'
+        )
+
+        department_1 = report[ReportTests.department_1.id]
+        self.assertEqual(
+            (
+                department_1['total'],
+                department_1['open'],
+                department_1['completed'],
+                department_1['completed_on_time'],
+                department_1['average_delay']
+            ),
+            (2, 1, 1, 0, 5.0),
+            'Поручение учтено в подразделении несколько раз!'
+        )
+        department_2 = report[ReportTests.department_2.id]
+        self.assertEqual(
+            (department_2['total'], department_2['overdue']),
+            (2, 1)
+        )
+        self.assertEqual(
+            department_2['groups'][0]['group_name'],
+            ReportTests.group.name
+        )
+
+        task_1.is_completed = True
+        task_1.save()
+        task_3.delete()
+        call_command('refresh_department_statistics', stdout=StringIO())
+
+        report = self.get_report()
+        self.assertEqual(
+            (
+                report[ReportTests.department_1.id]['completed'],
+                report[ReportTests.department_1.id]['on_time_rate']
+            ),
+            (2, 0.5),
+            'Измененное поручение не учтено в статистике!'
+        )
+        self.assertEqual(
+            (
+                report[ReportTests.department_2.id]['total'],
+                report[ReportTests.department_2.id]['overdue']
+            ),
+            (1, 0),
+            'Удаленное поручение не исключено из статистики!'
+        )
+
+        self.assertEqual(
+            ReportTests.auth_employee.get(ReportTests.report_url).status_code,
+            status.HTTP_403_FORBIDDEN
+        )
+
+
+    def test_department_statistics_safety_lag(self):
+        """
+        Проверка пересчета статистики по изменениям, зафиксированным
+        после начала предыдущего обновления (долгие транзакции).
+        """
+
+        employee_1 = ReportTests.employees[0]
+        call_command('refresh_department_statistics', stdout=StringIO())
+        refreshed_at = RefreshMark.objects.get(
+            name=DEPARTMENT_STATISTICS
+        ).refreshed_at
+
+        task = self.create_task(
+            'late commit task', [employee_1], timezone.localdate()
+        )
+        Task.objects.filter(pk=task.pk).update(
+            updated_at=refreshed_at - timedelta(seconds=30)
+        )
+
+        with override_settings(TASK_CHANGES_SAFETY_LAG=timedelta(0)):
+            call_command('refresh_department_statistics', stdout=StringIO())
+        self.assertNotIn(ReportTests.department_1.id, self.get_report())
+
+        RefreshMark.objects.filter(name=DEPARTMENT_STATISTICS).update(
+            refreshed_at=refreshed_at
+        )
+        call_command('refresh_department_statistics', stdout=StringIO())
+        self.assertEqual(
+            self.get_report()[ReportTests.department_1.id]['total'],
+            1,
+            'Изменение долгой транзакции не учтено в статистике!'
+        )
+
+
+    @override_settings(TASK_CHANGES_SAFETY_LAG=timedelta(0))
+    def test_task_trends(self):
+        """
+        Проверка ежедневных снимков поручений на исполнении
+        и динамики по подразделению и исполнителю.
+        """
+
+        today = timezone.localdate()
+        employee_1, employee_2, employee_3 = ReportTests.employees
+        self.create_task(
+            'open task', [employee_1, employee_2], today + timedelta(days=10)
+        )
+        self.create_task('urgent task', [employee_3], today + timedelta(days=1))
+        overdue_task = self.create_task(
+            'overdue task', [employee_1], today - timedelta(days=1)
+        )
+        TaskSnapshot.objects.create(
+            date=today - timedelta(days=1),
+            department=ReportTests.department_1,
+            group=ReportTests.group,
+            open=5
+        )
+
+        output = StringIO()
+        call_command('refresh_task_snapshots', stdout=output)
+        self.assertIn('Обработано поручений: 3', output.getvalue())
+
+        def get_trend(**params):
+            response = ReportTests.auth_director.get(ReportTests.trend_url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return [
+                (
+                    date.fromisoformat(row['date']),
+                    row['open'],
+                    row['urgent'],
+                    row['overdue']
+                )
+                for row in response.data
+            ]
+
+        self.assertEqual(
+            get_trend(department=ReportTests.department_1.id),
+            [(today - timedelta(days=1), 5, 0, 0), (today, 2, 0, 1)],
+            'Поручение учтено в подразделении несколько раз!'
+        )
+        self.assertEqual(
+            get_trend(employee=employee_1.id),
+            [(today, 2, 0, 1)]
+        )
+        self.assertEqual(get_trend(), [(today - timedelta(days=1), 5, 0, 0), (today, 3, 1, 1)])
+        self.assertEqual(get_trend(days=1), [(today, 3, 1, 1)])
+
+        overdue_task.is_completed = True
+        overdue_task.save()
+        output = StringIO()
+        call_command('refresh_task_snapshots', stdout=output)
+        self.assertIn(
+            'Обработано поручений: 1',
+            output.getvalue(),
+            'Обработаны неизмененные поручения!'
+        )
+        self.assertEqual(
+            get_trend(department=ReportTests.department_1.id)[-1],
+            (today, 1, 0, 0),
+            'Повторный снимок за дату не перезаписан!'
+        )
+
+        self.assertEqual(
+            ReportTests.auth_director.get(
+                ReportTests.trend_url, {'days': 0}
+            ).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(
+            ReportTests.auth_employee.get(ReportTests.trend_url).status_code,
+            status.HTTP_403_FORBIDDEN
+        )
+
+
+    def test_task_snapshots_safety_lag(self):
+        """
+        Проверка обновления состояний поручений, измененных
+        после начала предыдущего снимка (долгие транзакции).
+        """
+
+        employee_1 = ReportTests.employees[0]
+        task = self.create_task(
+            'late commit task', [employee_1],
+            timezone.localdate() + timedelta(days=10)
+        )
+        call_command('refresh_task_snapshots', stdout=StringIO())
+        refreshed_at = RefreshMark.objects.get(name=TASK_SNAPSHOTS).refreshed_at
+
+        Task.objects.filter(pk=task.pk).update(
+            is_completed=True,
+            updated_at=refreshed_at - timedelta(seconds=30)
+        )
+
+        output = StringIO()
+        call_command('refresh_task_snapshots', stdout=output)
+        self.assertIn('Обработано поручений: 1', output.getvalue())
+        self.assertFalse(
+            TaskSnapshot.objects.filter(
+                date=timezone.localdate(), employee=employee_1
+            ).exists(),
+            'Изменение долгой транзакции не учтено в снимке!'
+        )
@@ -0,0 +1,27 @@
+from django.urls import include, path
+
+from rest_framework import routers
+
+from reports.views import DepartmentReportViewSet, TaskTrendViewSet
+
+
+app_name = 'reports'
+
+router_reports_v1 = routers.DefaultRouter()
+
+
+router_reports_v1.register(
+    'reports/departments',
+    DepartmentReportViewSet,
+    basename='department-report'
+)
+router_reports_v1.register(
+    'reports/trends',
+    TaskTrendViewSet,
+    basename='task-trend'
+)
+
+
+urlpatterns = [
+    path('', include(router_reports_v1.urls)),
+]
@@ -0,0 +1,165 @@
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.utils import timezone
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+from drf_spectacular.utils import extend_schema, extend_schema_view
+
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+
+from reports.filters import DepartmentStatisticsFilterSet
+from reports.models import DepartmentStatistics, RefreshMark, TaskSnapshot
+from reports.permissions import IsAdminOrDirectorate
+from reports.rollup import DEPARTMENT_STATISTICS
+from reports.serializers import (
+    DepartmentReportSerializer,
+    TaskTrendQuerySerializer,
+    TaskTrendSerializer
+)
+
+
+STATISTICS_FIELDS = (
+    'total',
+    'open',
+    'overdue',
+    'completed',
+    'completed_on_time',
+    'delay_days'
+)
+
+
+def get_indicators(totals):
+    """Показатели исполнения из сумм сводной таблицы."""
+
+    late = totals['completed'] - totals['completed_on_time']
+    return {
+        'total': totals['total'],
+        'open': totals['open'],
+        'overdue': totals['overdue'],
+        'completed': totals['completed'],
+        'completed_on_time': totals['completed_on_time'],
+        'on_time_rate': (
+            round(totals['completed_on_time'] / totals['completed'], 4)
+            if totals['completed'] else None
+        ),
+        'average_delay': (
+            round(totals['delay_days'] / late, 1) if late else None
+        )
+    }
+
+
+@extend_schema(tags=['Отчеты'])
+@extend_schema_view(
+    list=extend_schema(
+        summary='Статистика исполнения поручений по подразделениям',
+        responses=DepartmentReportSerializer
+    ),
+)
+class DepartmentReportViewSet(viewsets.GenericViewSet):
+    """
+    Вьюсет отчета по подразделениям.
+
+    Читает только сводную таблицу DepartmentStatistics,
+    без обращения к таблице поручений.
+    """
+
+    queryset = DepartmentStatistics.objects.all()
+    serializer_class = DepartmentReportSerializer
+    permission_classes = (IsAdminOrDirectorate,)
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = DepartmentStatisticsFilterSet
+    pagination_class = None
+
+    def list(self, request):
+        rows = self.filter_queryset(self.get_queryset()).values(
+            'department',
+            'department__name',
+            'group',
+            'group__name'
+        ).annotate(
+            **{field: Sum(field) for field in STATISTICS_FIELDS}
+        ).order_by('department__name', 'department', 'group__name', 'group')
+
+        departments = {}
+        for row in rows:
+            department = departments.setdefault(
+                row['department'],
+                {
+                    'department': row['department'],
+                    'department_name': row['department__name'],
+                    'totals': dict.fromkeys(STATISTICS_FIELDS, 0),
+                    'groups': []
+                }
+            )
+            for field in STATISTICS_FIELDS:
+                department['totals'][field] += row[field]
+            department['groups'].append({
+                'group': row['group'],
+                'group_name': row['group__name'],
+                **get_indicators(row)
+            })
+
+        mark = RefreshMark.objects.filter(name=DEPARTMENT_STATISTICS).first()
+        serializer = self.get_serializer({
+            'refreshed_at': mark.refreshed_at if mark else None,
+            'results': [
+                {
+                    'department': department['department'],
+                    'department_name': department['department_name'],
+                    **get_indicators(department['totals']),
+                    'groups': department['groups']
+                }
+                for department in departments.values()
+            ]
+        })
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=['Отчеты'])
+class TaskTrendViewSet(viewsets.GenericViewSet):
+    """
+    Вьюсет динамики поручений на исполнении по ежедневным снимкам.
+
+    С параметром employee - показатели исполнителя,
+    с department - подразделения, без них - сумма по подразделениям.
+    """
+
+    queryset = TaskSnapshot.objects.all()
+    serializer_class = TaskTrendSerializer
+    permission_classes = (IsAdminOrDirectorate,)
+    pagination_class = None
+
+    @extend_schema(
+        summary='Динамика поручений на исполнении по дням',
+        parameters=[TaskTrendQuerySerializer],
+        responses=TaskTrendSerializer(many=True)
+    )
+    def list(self, request):
+        params = TaskTrendQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+
+        queryset = self.get_queryset().filter(
+            date__gt=timezone.localdate() - timedelta(days=params['days'])
+        )
+        if 'employee' in params:
+            queryset = queryset.filter(employee=params['employee'])
+        else:
+            queryset = queryset.filter(employee__isnull=True)
+            if 'department' in params:
+                queryset = queryset.filter(department=params['department'])
+        if 'group' in params:
+            queryset = queryset.filter(group=params['group'])
+
+        serializer = self.get_serializer(
+            queryset.values('date').annotate(
+                open=Sum('open'),
+                urgent=Sum('urgent'),
+                overdue=Sum('overdue')
+            ).order_by('date'),
+            many=True
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
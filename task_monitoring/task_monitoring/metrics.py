@@ -0,0 +1,138 @@
+import os
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+from django.http import HttpResponse
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+
+
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+UNRESOLVED_VIEW = 'unresolved'
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Время обработки запроса.',
+    ['view']
+)
+REQUEST_SQL_QUERIES = Histogram(
+    'http_request_sql_queries',
+    'Количество SQL-запросов за запрос.',
+    ['view'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, float('inf'))
+)
+REQUEST_SQL_DURATION = Histogram(
+    'http_request_sql_duration_seconds',
+    'Суммарное время SQL-запросов за запрос.',
+    ['view']
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Размер тела ответа.',
+    ['view'],
+    buckets=(
+        100, 1000, 10_000, 100_000, 1_000_000, 10_000_000, float('inf')
+    )
+)
+
+
+def get_view_name(view_func, method):
+    """
+    Имя обработчика для меток: "TaskViewSet.get_urgent_tasks"
+    для вьюсетов, "Класс.метод" для APIView, имя функции для остальных.
+    """
+
+    view_class = getattr(view_func, 'cls', None) or getattr(
+        view_func, 'view_class', None
+    )
+    if view_class is None:
+        return getattr(view_func, '__name__', UNRESOLVED_VIEW)
+    actions = getattr(view_func, 'actions', None) or {}
+    return '{}.{}'.format(
+        view_class.__name__,
+        actions.get(method, method)
+    )
+
+
+class QueryTracker:
+    """Счетчик SQL-запросов и их суммарного времени (execute_wrapper)."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    Гистограммы времени ответа, количества и времени SQL-запросов
+    и размера ответа с меткой обработчика запроса.
+
+    Для потоковых ответов размер и запросы, выполненные
+    при чтении тела, не учитываются.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path_info == '/metrics':
+            return self.get_response(request)
+
+        request.metrics_view = UNRESOLVED_VIEW
+        tracker = QueryTracker()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(tracker))
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        view = request.metrics_view
+        REQUEST_DURATION.labels(view).observe(duration)
+        REQUEST_SQL_QUERIES.labels(view).observe(tracker.count)
+        REQUEST_SQL_DURATION.labels(view).observe(tracker.duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(view).observe(len(response.content))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics_view = get_view_name(view_func, request.method.lower())
+
+
+def get_registry():
+    """
+    Реестр метрик: при заданном PROMETHEUS_MULTIPROC_DIR значения
+    собираются из файлов всех процессов gunicorn.
+    """
+
+    if not os.getenv(MULTIPROCESS_DIR_ENV):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    """Метрики в текстовом формате Prometheus."""
+
+    return HttpResponse(
+        generate_latest(get_registry()),
+        content_type=CONTENT_TYPE_LATEST
+    )
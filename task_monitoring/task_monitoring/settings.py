@@ -43,9 +43,11 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'departments.apps.DepartmentsConfig',
     'tasks.apps.TasksConfig',
     'users.apps.UsersConfig',
+    'reports.apps.ReportsConfig',
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt',
@@ -55,6 +57,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'task_monitoring.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -106,6 +109,29 @@ else:
         }
     }
 
+# По умолчанию кэш хранится в таблице базы данных (создается миграцией
+# tasks 0009) и общий для всех процессов gunicorn. Для нагруженных
+# установок - CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# и CACHE_LOCATION=redis://... (требуется пакет redis).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.db.DatabaseCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', default='django_cache'),
+    }
+}
+
+# Кэш, общий для всех процессов gunicorn (база данных, Redis, Memcached).
+# LocMemCache у каждого процесса свой, и сброс кэша в одном процессе
+# не виден остальным, поэтому с ним кэш аутентификации по токену,
+# кэш ответов поручений и версии для ETag не используются.
+SHARED_CACHE = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache'
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -129,8 +155,8 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.EmployeeTokenAuthentication',
+        'users.authentication.EmployeeJWTAuthentication',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
@@ -199,3 +225,42 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 APPEND_SLASH = False
 
 URGENT_EXECUTION_PERIOD = timedelta(days=3)
+
+# Действия TaskViewSet, которые отдаются через values()-проекции
+# вместо TaskGetSerializer (например: "list retrieve get_urgent_tasks").
+TASK_PROJECTION_ACTIONS = os.getenv(
+    'TASK_PROJECTION_ACTIONS', default=''
+).split()
+
+TASK_SUMMARY_CACHE_TIMEOUT = int(
+    os.getenv('TASK_SUMMARY_CACHE_TIMEOUT', default=300)
+)
+
+TOKEN_AUTH_CACHE_TIMEOUT = int(
+    os.getenv('TOKEN_AUTH_CACHE_TIMEOUT', default=300)
+)
+
+TASK_RESPONSE_CACHE = bool(os.getenv('TASK_RESPONSE_CACHE') == 'True')
+
+TASK_RESPONSE_CACHE_TIMEOUT = int(
+    os.getenv('TASK_RESPONSE_CACHE_TIMEOUT', default=300)
+)
+
+# Токен ленты изменений не продвигается дальше now() - задержка,
+# а инкрементальные отчеты перечитывают изменения за задержку
+# до предыдущего запуска, чтобы не пропустить поручения из долгих транзакций.
+TASK_CHANGES_SAFETY_LAG = timedelta(
+    seconds=int(os.getenv('TASK_CHANGES_SAFETY_LAG', default=60))
+)
+
+TASK_BULK_MAX_ITEMS = int(os.getenv('TASK_BULK_MAX_ITEMS', default=1000))
+
+TASK_EXPORT_CHUNK_SIZE = int(os.getenv('TASK_EXPORT_CHUNK_SIZE', default=2000))
+
+EMPLOYEE_LOOKUP_LIMIT = int(os.getenv('EMPLOYEE_LOOKUP_LIMIT', default=20))
+
+REPORT_TREND_MAX_DAYS = int(os.getenv('REPORT_TREND_MAX_DAYS', default=365))
+
+EMPLOYEE_RECENT_TASKS_LIMIT = int(
+    os.getenv('EMPLOYEE_RECENT_TASKS_LIMIT', default=10)
+)
@@ -9,11 +9,15 @@ from drf_spectacular.views import (
     SpectacularSwaggerView
 )
 
+from task_monitoring.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('api/', include('departments.urls', namespace='departments')),
     path('api/', include('tasks.urls', namespace='tasks')),
     path('api/', include('users.urls', namespace='users')),
+    path('api/', include('reports.urls', namespace='reports')),
 
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/',
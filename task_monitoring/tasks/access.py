@@ -0,0 +1,66 @@
+from django.db import transaction
+
+from tasks.models import EXECUTOR, INITIATOR, Task, TaskAccess, TaskTombstone
+
+
+def build_task_access(task_ids):
+    """Строки доступа к поручениям: инициатор и исполнители."""
+
+    accesses = [
+        TaskAccess(employee_id=initiator_id, task_id=task_id, relation=INITIATOR)
+        for task_id, initiator_id in Task.objects.filter(
+            id__in=task_ids
+        ).values_list('id', 'initiator_id')
+    ]
+    accesses += [
+        TaskAccess(employee_id=employee_id, task_id=task_id, relation=EXECUTOR)
+        for task_id, employee_id in Task.executors.through.objects.filter(
+            task_id__in=task_ids
+        ).values_list('task_id', 'employee_id')
+    ]
+    return accesses
+
+
+def get_access_employee_ids(task_ids):
+    """Идентификаторы сотрудников с доступом к поручениям."""
+
+    return set(
+        TaskAccess.objects.filter(
+            task_id__in=task_ids
+        ).values_list('employee_id', flat=True)
+    )
+
+
+def rebuild_task_access(task_ids):
+    """
+    Пересборка доступа к поручениям.
+    Утраченный доступ отмечается в ленте изменений.
+    Возвращает идентификаторы сотрудников, чей доступ мог измениться.
+    """
+
+    task_ids = set(task_ids)
+
+    with transaction.atomic():
+        old_accesses = TaskAccess.objects.filter(task_id__in=task_ids)
+        old_rows = set(
+            old_accesses.values_list('employee_id', 'relation', 'task_id')
+        )
+        old_accesses.delete()
+        accesses = TaskAccess.objects.bulk_create(build_task_access(task_ids))
+        new_rows = {
+            (access.employee_id, access.relation, access.task_id)
+            for access in accesses
+        }
+        TaskTombstone.objects.bulk_create(
+            TaskTombstone(
+                employee_id=employee_id,
+                relation=relation,
+                task_id=task_id
+            )
+            for employee_id, relation, task_id in old_rows - new_rows
+        )
+
+    return (
+        {row[0] for row in old_rows}
+        | {access.employee_id for access in accesses}
+    )
@@ -1,9 +1,6 @@
-from datetime import date
-
-from django.conf import settings
 from django.contrib import admin
 
-from tasks.models import Group, Task
+from tasks.models import STATUS_CHOICES, Group, Task
 
 
 class StatusListFilter(admin.SimpleListFilter):
@@ -13,31 +10,11 @@ class StatusListFilter(admin.SimpleListFilter):
     parameter_name = 'execution_status'
 
     def lookups(self, request, model_admin):
-        return [
-            ('on_execution', 'На исполнении'),
-            ('overdue', 'Просроченные'),
-            ('completed', 'Исполненные'),
-            ('closed', 'Закрытые')
-        ]
+        return STATUS_CHOICES
 
     def queryset(self, request, queryset):
-        if self.value() == 'on_execution':
-            return queryset.filter(is_completed=False)
-        if self.value() == 'completed':
-            return queryset.filter(is_completed=True)
-        if self.value() == 'closed':
-            return queryset.filter(is_closed=True)
-        if self.value() == 'urgent':
-            return queryset.filter(
-                is_completed=False,
-                execution_date__gte=date.today(),
-                execution_date__lte=date.today() + settings.URGENT_EXECUTION_PERIOD,
-            )
-        if self.value() == 'overdue':
-            return queryset.filter(
-                is_completed=False,
-                execution_date__lt=date.today()
-            )
+        if self.value():
+            return queryset.filter(status=self.value())
 
 
 @admin.register(Group)
@@ -72,7 +49,8 @@ class TaskAdmin(admin.ModelAdmin):
         'tasks_application',
         'executions_application',
         'is_closed',
-        'is_completed'
+        'is_completed',
+        'status'
     )
     search_fields = (
         'title',
@@ -0,0 +1,187 @@
+from datetime import date
+
+from django.db import transaction
+from django.utils import timezone
+
+from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
+
+from tasks.access import get_access_employee_ids, rebuild_task_access
+from tasks.cache import invalidate_tasks_cache
+from tasks.models import Group, Task, TaskAccess
+from tasks.serializers import TaskBulkCreateSerializer
+
+from departments.models import Employee
+
+
+UNIQUE_FIELDS = ('title', 'number', 'initiator', 'assignment_date')
+
+
+def does_not_exist(pk):
+    return serializers.PrimaryKeyRelatedField.default_error_messages[
+        'does_not_exist'
+    ].format(pk_value=pk)
+
+
+def add_error(errors, index, field, message):
+    errors[index].setdefault(field, []).append(message)
+
+
+def get_existing_ids(queryset, ids):
+    ids = set(ids) - {None}
+    if not ids:
+        return set()
+    return set(queryset.filter(pk__in=ids).values_list('pk', flat=True))
+
+
+def validate_tasks(items, request_user):
+    """
+    Проверка списка поручений для массового создания.
+
+    Поля каждого элемента проверяются одним экземпляром сериализатора,
+    как в ListSerializer, а связанные
+    объекты, исполнители и уникальность - запросами по всему списку.
+    Возвращает проверенные данные и ошибки по каждому элементу.
+    """
+
+    errors = [{} for _ in items]
+    validated = [None] * len(items)
+    serializer = TaskBulkCreateSerializer()
+    for index, item in enumerate(items):
+        try:
+            validated[index] = serializer.run_validation(item)
+        except serializers.ValidationError as error:
+            errors[index] = error.detail
+
+    valid = [
+        (index, data) for index, data in enumerate(validated) if data is not None
+    ]
+    groups = get_existing_ids(
+        Group.objects, (data.get('group') for _, data in valid)
+    )
+    initiators = get_existing_ids(
+        Employee.objects, (data['initiator'] for _, data in valid)
+    )
+    parent_tasks = get_existing_ids(
+        Task.objects, (data.get('parent_task') for _, data in valid)
+    )
+    executors = get_existing_ids(
+        Employee.objects.assignable_by(request_user.employee),
+        (pk for _, data in valid for pk in data['executors'])
+    )
+
+    for index, data in valid:
+        if data.get('group') is not None and data['group'] not in groups:
+            add_error(errors, index, 'group', does_not_exist(data['group']))
+        if data['initiator'] not in initiators:
+            add_error(errors, index, 'initiator', does_not_exist(data['initiator']))
+        if (data.get('parent_task') is not None
+            and data['parent_task'] not in parent_tasks):
+            add_error(
+                errors, index, 'parent_task', does_not_exist(data['parent_task'])
+            )
+        for pk in data['executors']:
+            if pk not in executors:
+                add_error(errors, index, 'executors', does_not_exist(pk))
+
+    validate_unique(valid, errors)
+    return validated, errors
+
+
+def validate_unique(valid, errors):
+    """Уникальность поручений внутри списка и среди созданных сегодня."""
+
+    today = date.today()
+    keys = {
+        index: (data['title'], data['number'], data['initiator'], today)
+        for index, data in valid
+        if data.get('number') is not None
+    }
+    if not keys:
+        return
+
+    existing = set(
+        Task.objects.filter(
+            assignment_date=today,
+            initiator__in={key[2] for key in keys.values()},
+            title__in={key[0] for key in keys.values()}
+        ).values_list(*UNIQUE_FIELDS)
+    )
+    message = UniqueTogetherValidator.message.format(
+        field_names=', '.join(UNIQUE_FIELDS)
+    )
+    seen = set()
+    for index, key in keys.items():
+        if key in existing or key in seen:
+            add_error(errors, index, 'non_field_errors', message)
+        seen.add(key)
+
+
+def create_tasks(items):
+    """
+    Массовое создание проверенных поручений одной транзакцией:
+    поручения, исполнители, доступ и инвалидация кэша, в том числе
+    участников вышестоящих поручений.
+    Возвращает созданные поручения.
+    """
+
+    with transaction.atomic():
+        tasks = []
+        for data in items:
+            task = Task(
+                title=data['title'],
+                number=data.get('number'),
+                group_id=data.get('group'),
+                parent_task_id=data.get('parent_task'),
+                resolution=data['resolution'],
+                initiator_id=data['initiator'],
+                execution_date=data['execution_date']
+            )
+            task.status = task.get_status()
+            tasks.append(task)
+        tasks = Task.objects.bulk_create(tasks)
+
+        Task.executors.through.objects.bulk_create(
+            Task.executors.through(task_id=task.id, employee_id=employee_id)
+            for task, data in zip(tasks, items)
+            for employee_id in dict.fromkeys(data['executors'])
+        )
+
+        employee_ids = rebuild_task_access(task.id for task in tasks)
+
+        parent_ids = {task.parent_task_id for task in tasks} - {None}
+        if parent_ids:
+            Task.objects.filter(pk__in=parent_ids).touch()
+            employee_ids |= get_access_employee_ids(parent_ids)
+
+    invalidate_tasks_cache(employee_ids)
+    return tasks
+
+
+def update_tasks(queryset, ids, **values):
+    """
+    Массовое изменение поручений из списка, допустимых queryset,
+    одним условным UPDATE с отметкой об изменении и инвалидацией кэша.
+    Возвращает идентификаторы измененных поручений.
+    """
+
+    with transaction.atomic():
+        updated = list(
+            queryset.filter(id__in=ids).select_for_update().order_by(
+                'id'
+            ).values_list('id', flat=True)
+        )
+        if not updated:
+            return []
+        queryset.filter(id__in=updated).update(
+            updated_at=timezone.now(),
+            **values
+        )
+        employee_ids = set(
+            TaskAccess.objects.filter(
+                task_id__in=updated
+            ).values_list('employee_id', flat=True)
+        )
+
+    invalidate_tasks_cache(employee_ids)
+    return updated
@@ -0,0 +1,212 @@
+from functools import wraps
+from hashlib import sha256
+from time import time_ns
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.http import parse_http_date_safe
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from tasks.conditional import conditional_response
+
+
+GENERATION_KEY = 'tasks:generation:{}'
+MODIFIED_KEY = 'tasks:modified:{}'
+EPOCH = 'epoch'
+ALL_TASKS = 'all'
+DIRECTORY = 'directory'
+
+RESPONSE_KEY = 'tasks:response:{}'
+RESPONSE_STATS_KEY = 'tasks:response:stats:{}'
+HIT = 'hit'
+MISS = 'miss'
+
+
+def get_generation(name):
+    """
+    Поколение кэшированных данных. Без общего кэша (SHARED_CACHE)
+    увеличение поколения в одном процессе не видно остальным,
+    поэтому каждый вызов возвращает новое значение.
+    """
+
+    if not settings.SHARED_CACHE:
+        return time_ns()
+    return cache.get_or_set(GENERATION_KEY.format(name), time_ns, timeout=None)
+
+
+def get_modified(name):
+    """
+    Время последнего изменения поколения. При вытеснении из кэша
+    или без общего кэша считается равным текущему, что исключает
+    ложные ответы 304.
+    """
+
+    if not settings.SHARED_CACHE:
+        return timezone.now()
+    return cache.get_or_set(
+        MODIFIED_KEY.format(name), timezone.now, timeout=None
+    )
+
+
+def bump_generation(name):
+    try:
+        cache.incr(GENERATION_KEY.format(name))
+    except ValueError:
+        cache.set(GENERATION_KEY.format(name), time_ns(), timeout=None)
+    cache.set(MODIFIED_KEY.format(name), timezone.now(), timeout=None)
+
+
+def get_tasks_version(employee_id=None):
+    """
+    Версия кэшированных данных о поручениях сотрудника.
+    Без сотрудника - версия данных обо всех поручениях.
+    """
+
+    return '{}.{}'.format(
+        get_generation(EPOCH),
+        get_generation(ALL_TASKS if employee_id is None else employee_id)
+    )
+
+
+def get_tasks_modified(employee_id=None):
+    """Время последнего изменения поручений сотрудника."""
+
+    return max(
+        get_modified(EPOCH),
+        get_modified(ALL_TASKS if employee_id is None else employee_id)
+    )
+
+
+def get_directory_version():
+    return get_generation(DIRECTORY)
+
+
+def get_directory_modified():
+    return get_modified(DIRECTORY)
+
+
+def invalidate_tasks_cache(employee_ids=None):
+    """
+    Инвалидация кэша поручений указанных сотрудников.
+    Без сотрудников - инвалидация всего кэша поручений.
+    """
+
+    if employee_ids is None:
+        bump_generation(EPOCH)
+        return
+    for name in {ALL_TASKS, *employee_ids}:
+        bump_generation(name)
+
+
+def invalidate_directory_cache():
+    """
+    Инвалидация кэша ответов при изменении справочных данных:
+    пользователей, сотрудников, подразделений и типов поручений.
+    """
+
+    bump_generation(DIRECTORY)
+
+
+def count_response(result):
+    key = RESPONSE_STATS_KEY.format(result)
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def get_response_cache_stats():
+    """Количество попаданий и промахов кэша ответов."""
+
+    return {
+        result: cache.get(RESPONSE_STATS_KEY.format(result), 0)
+        for result in (HIT, MISS)
+    }
+
+
+def get_response_cache_key(request, action, kwargs):
+    """
+    Ключ кэша ответа: пользователь, роль, действие, параметры
+    запроса и версия поручений, видимых пользователю.
+    """
+
+    user = request.user
+    if user.is_staff:
+        role, employee_id = 'staff', None
+    else:
+        employee = user.employee
+        role = employee.role
+        employee_id = None if employee.is_director() else employee.id
+
+    params = urlencode(
+        sorted(
+            (name, sorted(values))
+            for name, values in request.query_params.lists()
+        ),
+        doseq=True
+    )
+    request_key = '|'.join((
+        role,
+        request.get_host(),
+        request.accepted_renderer.format,
+        action,
+        urlencode(sorted(kwargs.items())),
+        params
+    ))
+    return RESPONSE_KEY.format(':'.join((
+        str(user.pk),
+        sha256(request_key.encode()).hexdigest(),
+        get_tasks_version(employee_id),
+        str(get_directory_version())
+    )))
+
+
+def cache_response(handler):
+    """
+    Кэширование успешных ответов действий чтения поручений.
+    Включается настройкой TASK_RESPONSE_CACHE и только с общим
+    для процессов кэшем (SHARED_CACHE).
+    """
+
+    @wraps(handler)
+    def wrapper(view, request, *args, **kwargs):
+        if not (settings.TASK_RESPONSE_CACHE and settings.SHARED_CACHE):
+            return handler(view, request, *args, **kwargs)
+
+        key = get_response_cache_key(request, view.action, kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            count_response(HIT)
+            data, etag, last_modified = cached
+            response = conditional_response(
+                request,
+                etag,
+                last_modified,
+                lambda: Response(data, status=status.HTTP_200_OK)
+            )
+            response['X-Cache'] = 'HIT'
+            return response
+
+        count_response(MISS)
+        response = handler(view, request, *args, **kwargs)
+        if (response.status_code == status.HTTP_200_OK
+            and isinstance(response, Response)):
+            cache.set(
+                key,
+                (
+                    response.data,
+                    response.get('ETag'),
+                    parse_http_date_safe(response.get('Last-Modified', ''))
+                ),
+                settings.TASK_RESPONSE_CACHE_TIMEOUT
+            )
+        response['X-Cache'] = 'MISS'
+        return response
+
+    return wrapper
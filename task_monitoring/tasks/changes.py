@@ -0,0 +1,110 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from rest_framework.exceptions import ValidationError
+
+from tasks.models import TaskTombstone
+
+
+INVALID_TOKEN_MESSAGE = 'Некорректный токен синхронизации.'
+
+
+def encode_token(updated_at, task_id, tombstone_id):
+    position = '{}|{}|{}'.format(
+        updated_at.isoformat() if updated_at is not None else '',
+        task_id,
+        tombstone_id
+    )
+    return urlsafe_b64encode(position.encode('ascii')).decode('ascii')
+
+
+def decode_token(token):
+    try:
+        position = urlsafe_b64decode(token.encode('ascii')).decode('ascii')
+        updated_at, task_id, tombstone_id = position.split('|')
+        return (
+            datetime.fromisoformat(updated_at) if updated_at else None,
+            int(task_id),
+            int(tombstone_id)
+        )
+    except (TypeError, ValueError):
+        raise ValidationError({'since': INVALID_TOKEN_MESSAGE})
+
+
+def get_changes(queryset, tombstones, since, page_size):
+    """
+    Страница ленты изменений поручений.
+
+    Измененные поручения выбираются по ключу (updated_at, id),
+    удаленные - по идентификатору отметки об удалении.
+    Без токена возвращаются все поручения без удалений.
+    Возвращает поручения, идентификаторы удаленных поручений,
+    токен продолжения и признак наличия следующей страницы.
+
+    updated_at и id присваиваются при сохранении, а не при фиксации
+    транзакции, поэтому токен не продвигается дальше
+    now() - TASK_CHANGES_SAFETY_LAG: изменения последних секунд
+    возвращаются повторно, но поздно зафиксированные не теряются.
+    """
+
+    horizon = timezone.now() - settings.TASK_CHANGES_SAFETY_LAG
+
+    if since:
+        updated_at, task_id, tombstone_id = decode_token(since)
+    else:
+        updated_at, task_id = None, 0
+        tombstone_id = TaskTombstone.objects.filter(
+            deleted_at__lte=horizon
+        ).aggregate(
+            last_id=Max('id')
+        )['last_id'] or 0
+
+    changed = queryset.order_by('updated_at', 'id')
+    if updated_at is not None:
+        changed = changed.filter(
+            Q(updated_at__gt=updated_at)
+            | Q(updated_at=updated_at, id__gt=task_id)
+        )
+    tasks = list(changed[:page_size + 1])
+
+    deleted = list(
+        tombstones.filter(
+            id__gt=tombstone_id
+        ).order_by('id').values_list(
+            'id', 'task_id', 'deleted_at'
+        )[:page_size + 1]
+    )
+
+    has_more = len(tasks) > page_size or len(deleted) > page_size
+    tasks = tasks[:page_size]
+    deleted = deleted[:page_size]
+
+    for task in tasks:
+        if task.updated_at > horizon:
+            has_more = False
+            break
+        updated_at, task_id = task.updated_at, task.id
+    for deleted_id, _, deleted_at in deleted:
+        if deleted_at > horizon:
+            has_more = False
+            break
+        tombstone_id = deleted_id
+
+    deleted_ids = list(dict.fromkeys(deleted_id for _, deleted_id, _ in deleted))
+    visible_ids = set(
+        queryset.filter(id__in=deleted_ids).values_list('id', flat=True)
+    )
+
+    return (
+        tasks,
+        [
+            deleted_id for deleted_id in deleted_ids
+            if deleted_id not in visible_ids
+        ],
+        encode_token(updated_at, task_id, tombstone_id),
+        has_more
+    )
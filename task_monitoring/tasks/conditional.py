@@ -0,0 +1,113 @@
+from hashlib import sha256
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def get_etag(*parts):
+    """Строгий ETag из версий и отметок времени ресурса."""
+
+    return quote_etag(
+        sha256('|'.join(str(part) for part in parts).encode()).hexdigest()
+    )
+
+
+def get_timestamp(*datetimes):
+    """Время последнего изменения ресурса в секундах для Last-Modified."""
+
+    datetimes = [value for value in datetimes if value is not None]
+    return int(max(datetimes).timestamp()) if datetimes else None
+
+
+def conditional_response(request, etag, last_modified, get_response):
+    """
+    Ответ 304 при совпадении If-None-Match или If-Modified-Since,
+    иначе ответ get_response() с заголовками ETag и Last-Modified.
+    """
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified
+    )
+    if response is None:
+        response = get_response()
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        if etag:
+            response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Условные GET-запросы к list и retrieve вьюсета.
+
+    Валидаторы рассчитываются до сериализации, и неизмененный
+    ресурс возвращается ответом 304 без тела.
+    """
+
+    def get_list_validators(self, queryset):
+        """
+        ETag и Last-Modified списка: (etag, timestamp).
+        По умолчанию валидаторов нет, и список отдается полностью.
+        """
+
+        return None, None
+
+    def get_object_validators(self, instance):
+        """
+        ETag и Last-Modified объекта: (etag, timestamp).
+        По умолчанию валидаторов нет, и объект отдается полностью.
+        """
+
+        return None, None
+
+    def get_representation_etag(self, etag):
+        """
+        ETag конкретного представления: адрес запроса (?fields=,
+        ?expand=, фильтры) и формат ответа меняют тело ответа.
+        """
+
+        if etag is None:
+            return None
+        return get_etag(
+            etag,
+            self.request.get_full_path(),
+            self.request.accepted_renderer.format
+        )
+
+    def get_list_response(self, queryset):
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def get_object_response(self, instance):
+        return Response(self.get_serializer(instance).data)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        etag, last_modified = self.get_list_validators(queryset)
+        return conditional_response(
+            request,
+            self.get_representation_etag(etag),
+            last_modified,
+            lambda: self.get_list_response(queryset)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = self.get_object_validators(instance)
+        return conditional_response(
+            request,
+            self.get_representation_etag(etag),
+            last_modified,
+            lambda: self.get_object_response(instance)
+        )
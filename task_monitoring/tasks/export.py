@@ -0,0 +1,116 @@
+import csv
+from itertools import islice
+
+from tasks.models import STATUS_CHOICES, Task
+
+
+EXPORT_VALUES = (
+    'id',
+    'number',
+    'title',
+    'group__name',
+    'assignment_date',
+    'execution_date',
+    'initiator__user__last_name',
+    'initiator__user__first_name',
+    'initiator__department__name',
+    'parent_task_id',
+    'resolution',
+    'status',
+    'is_completed',
+    'is_closed',
+    'executions_comment'
+)
+
+EXPORT_HEADER = (
+    'ID',
+    'Номер поручения',
+    'Заголовок',
+    'Тип поручения',
+    'Дата поручения',
+    'Дата исполнения',
+    'Инициатор',
+    'Подразделение инициатора',
+    'Исполнители',
+    'Родительское поручение',
+    'Резолюция',
+    'Статус исполнения',
+    'Исполнено исполнителем',
+    'Закрыто инициатором',
+    'Комментарий к исполнению'
+)
+
+STATUS_LABELS = dict(STATUS_CHOICES)
+
+
+class Echo:
+    """Буфер, возвращающий записанную строку вместо хранения."""
+
+    def write(self, value):
+        return value
+
+
+def iter_chunks(queryset, chunk_size):
+    """
+    Чтение выборки частями через серверный курсор.
+    Память не зависит от общего количества строк.
+    """
+
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_executor_names(task_ids):
+    """Исполнители части поручений одним запросом."""
+
+    executors = {task_id: [] for task_id in task_ids}
+    for task_id, last_name, first_name in Task.executors.through.objects.filter(
+        task_id__in=task_ids
+    ).order_by(
+        'employee__user__last_name', 'employee_id'
+    ).values_list(
+        'task_id', 'employee__user__last_name', 'employee__user__first_name'
+    ):
+        executors[task_id].append(f'{last_name} {first_name}')
+    return executors
+
+
+def iter_tasks_csv(queryset, chunk_size):
+    """
+    Строки CSV-выгрузки поручений: заголовок с BOM для Excel
+    и по строке на поручение. Исполнители загружаются
+    одним запросом на часть выборки.
+    """
+
+    writer = csv.writer(Echo())
+    yield '\ufeff' + writer.writerow(EXPORT_HEADER)
+    for chunk in iter_chunks(
+        queryset.prefetch_related(None).values(*EXPORT_VALUES),
+        chunk_size
+    ):
+        executors = get_executor_names([row['id'] for row in chunk])
+        yield ''.join(
+            writer.writerow((
+                row['id'],
+                row['number'],
+                row['title'],
+                row['group__name'],
+                row['assignment_date'],
+                row['execution_date'],
+                f'{row["initiator__user__last_name"]} '
+                f'{row["initiator__user__first_name"]}',
+                row['initiator__department__name'],
+                '; '.join(executors[row['id']]),
+                row['parent_task_id'],
+                row['resolution'],
+                STATUS_LABELS[row['status']],
+                row['is_completed'],
+                row['is_closed'],
+                row['executions_comment']
+            ))
+            for row in chunk
+        )
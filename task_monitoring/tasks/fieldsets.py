@@ -0,0 +1,130 @@
+from django.core.exceptions import FieldDoesNotExist
+
+from rest_framework import permissions, serializers
+
+
+FIELDS_QUERY_PARAM = 'fields'
+EXPAND_QUERY_PARAM = 'expand'
+
+
+def parse_names(value):
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Выбор полей (?fields=) и развертывание связей (?expand=).
+
+    Параметры передаются в контексте ключом sparse_fieldset
+    и применяются только к корневому сериализатору. При переданных
+    параметрах связи из expandable_fields без ?expand= представляются
+    первичными ключами.
+    """
+
+    expandable_fields = ()
+    # Столбцы модели для полей без собственного источника (SerializerMethodField).
+    field_columns = {}
+
+    def get_sparse_fieldset(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+        return self.context.get('sparse_fieldset')
+
+    def is_expanded(self, name):
+        sparse_fieldset = self.get_sparse_fieldset()
+        return sparse_fieldset is None or name in sparse_fieldset[1]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        sparse_fieldset = self.get_sparse_fieldset()
+        if sparse_fieldset is None:
+            return fields
+
+        requested, expanded = sparse_fieldset
+        if requested is not None:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in requested
+            }
+        for name in self.expandable_fields:
+            if name in fields and name not in expanded:
+                fields[name] = serializers.PrimaryKeyRelatedField(
+                    read_only=True,
+                    many=isinstance(fields[name], serializers.ListSerializer)
+                    or isinstance(fields[name], serializers.ManyRelatedField)
+                )
+        return fields
+
+    def get_sparse_columns(self):
+        """Столбцы модели, необходимые выбранным полям, для only()."""
+
+        model = self.Meta.model
+        columns = {model._meta.pk.name}
+        for name, field in self.fields.items():
+            columns.update(self.field_columns.get(name, ()))
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete and not model_field.many_to_many:
+                columns.add(model_field.name)
+        return columns
+
+
+class SparseFieldsetMixin:
+    """
+    Поддержка ?fields= и ?expand= во вьюсете для GET-запросов.
+
+    Неиспользуемые столбцы откладываются через only(), а связи
+    загружаются вьюсетом только для запрошенных полей
+    (is_field_requested и is_field_expanded в get_queryset).
+    """
+
+    def get_sparse_fieldset(self):
+        """(запрошенные поля или None, развернутые связи) или None."""
+
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return None
+        params = request.query_params
+        if FIELDS_QUERY_PARAM not in params and EXPAND_QUERY_PARAM not in params:
+            return None
+        return (
+            parse_names(params[FIELDS_QUERY_PARAM])
+            if FIELDS_QUERY_PARAM in params else None,
+            parse_names(params.get(EXPAND_QUERY_PARAM, ''))
+        )
+
+    def is_field_requested(self, name):
+        sparse_fieldset = self.get_sparse_fieldset()
+        return (
+            sparse_fieldset is None
+            or sparse_fieldset[0] is None
+            or name in sparse_fieldset[0]
+        )
+
+    def is_field_expanded(self, name):
+        sparse_fieldset = self.get_sparse_fieldset()
+        return self.is_field_requested(name) and (
+            sparse_fieldset is None or name in sparse_fieldset[1]
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['sparse_fieldset'] = self.get_sparse_fieldset()
+        return context
+
+    def defer_sparse_columns(self, queryset):
+        """Отложенная загрузка столбцов, не нужных выбранным полям."""
+
+        if self.get_sparse_fieldset() is None:
+            return queryset
+        serializer = self.get_serializer_class()(
+            context=self.get_serializer_context()
+        )
+        if not isinstance(serializer, SparseFieldsetSerializerMixin):
+            return queryset
+        return queryset.only(*serializer.get_sparse_columns())
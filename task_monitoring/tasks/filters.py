@@ -1,32 +1,35 @@
-from django.contrib.auth import get_user_model
+from django.db.models import Case, IntegerField, Value, When
 
 from django_filters.rest_framework import (
     FilterSet,
     BooleanFilter,
+    CharFilter,
     ModelMultipleChoiceFilter,
     AllValuesMultipleFilter,
-    DateFromToRangeFilter
+    DateFromToRangeFilter,
+    MultipleChoiceFilter
 )
 
-from tasks.models import Task
+from rest_framework.filters import OrderingFilter
 
+from tasks.models import STATUS_CHOICES, STATUS_ORDER, Task
+from tasks.search import search_tasks
 
-User = get_user_model()
+from departments.models import Employee
 
 
 class TaskFilterSet(FilterSet):
 
     group = AllValuesMultipleFilter(field_name='group')
     initiator = ModelMultipleChoiceFilter(
-        field_name='author__id',
-        to_field_name='id',
+        field_name='initiator',
         label='Инициатор',
-        queryset=User.objects.all()
+        queryset=Employee.objects.all()
     )
     executors = ModelMultipleChoiceFilter(
         field_name='executors',
         label='Исполнители',
-        queryset=User.objects.all()
+        queryset=Employee.objects.all()
     )
     assignment_date = DateFromToRangeFilter(
         label='Дата поручения'
@@ -40,6 +43,14 @@ class TaskFilterSet(FilterSet):
     is_completed = BooleanFilter(
         label='Исполненные'
     )
+    status = MultipleChoiceFilter(
+        choices=STATUS_CHOICES,
+        label='Статус исполнения'
+    )
+    search = CharFilter(
+        method='filter_search',
+        label='Поиск по заголовку, резолюции и комментарию'
+    )
 
     class Meta:
         model = Task
@@ -50,5 +61,43 @@ class TaskFilterSet(FilterSet):
             'assignment_date',
             'execution_date',
             'is_closed',
-            'is_completed'
+            'is_completed',
+            'status',
+            'search'
         )
+
+    def filter_search(self, queryset, name, value):
+        return search_tasks(queryset, value)
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """
+    Сортировка поручений. ?ordering=status сортирует по срочности
+    статуса (STATUS_ORDER), а не по алфавиту кодов статусов.
+    """
+
+    status_field = 'status'
+    status_rank_field = 'status_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+        if not any(
+            field.lstrip('-') == self.status_field for field in ordering
+        ):
+            return queryset.order_by(*ordering)
+        return queryset.alias(
+            **{self.status_rank_field: Case(
+                *(
+                    When(status=status, then=Value(rank))
+                    for rank, status in enumerate(STATUS_ORDER)
+                ),
+                output_field=IntegerField()
+            )}
+        ).order_by(*(
+            field.replace(self.status_field, self.status_rank_field)
+            if field.lstrip('-') == self.status_field else field
+            for field in ordering
+        ))
+
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tasks.access import build_task_access
+from tasks.cache import invalidate_tasks_cache
+from tasks.models import Task, TaskAccess
+
+
+class Command(BaseCommand):
+    """Полная пересборка таблицы доступа к поручениям пакетами."""
+
+    help = 'Пересборка доступа сотрудников к поручениям.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Количество поручений в одном пакете.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        total = 0
+
+        while True:
+            task_ids = list(
+                Task.objects.filter(
+                    id__gt=last_id
+                ).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not task_ids:
+                break
+
+            with transaction.atomic():
+                TaskAccess.objects.filter(task_id__in=task_ids).delete()
+                TaskAccess.objects.bulk_create(
+                    build_task_access(task_ids),
+                    batch_size=batch_size
+                )
+
+            last_id = task_ids[-1]
+            total += len(task_ids)
+            self.stdout.write(f'Обработано поручений: {total}')
+
+        invalidate_tasks_cache()
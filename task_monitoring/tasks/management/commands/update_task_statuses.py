@@ -0,0 +1,48 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+from django.utils import timezone
+
+from tasks.cache import invalidate_tasks_cache
+from tasks.models import ON_EXECUTION, URGENT, Task
+
+
+class Command(BaseCommand):
+    """
+    Ежедневный пересчет статусов исполнения поручений.
+
+    Переводит поручения из "на исполнении" в "срочные" и из "срочных"
+    в "просроченные" при наступлении соответствующих дат.
+    Запускается раз в сутки после полуночи.
+    """
+
+    help = 'Пересчет статусов исполнения поручений на текущую дату.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Пересчитать статусы всех поручений.'
+        )
+
+    def handle(self, *args, **options):
+        today = date.today()
+        status = Task.status_expression(today)
+
+        if options['all']:
+            queryset = Task.objects.alias(
+                actual_status=status
+            ).exclude(status=F('actual_status'))
+        else:
+            queryset = Task.objects.filter(
+                Q(status=ON_EXECUTION,
+                  execution_date__lte=today + settings.URGENT_EXECUTION_PERIOD)
+                | Q(status=URGENT, execution_date__lt=today)
+            )
+
+        updated = queryset.update(status=status, updated_at=timezone.now())
+        if updated:
+            invalidate_tasks_cache()
+        self.stdout.write(f'Обновлено статусов поручений: {updated}')
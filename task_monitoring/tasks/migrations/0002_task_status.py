@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-18 08:48
+
+from datetime import date
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_task_status(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    today = date.today()
+    Task.objects.update(
+        status=models.Case(
+            models.When(is_closed=True, then=models.Value('closed')),
+            models.When(is_completed=True, then=models.Value('completed')),
+            models.When(execution_date__lt=today, then=models.Value('overdue')),
+            models.When(
+                execution_date__lte=today + settings.URGENT_EXECUTION_PERIOD,
+                then=models.Value('urgent')
+            ),
+            default=models.Value('on_execution'),
+            output_field=models.CharField()
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('on_execution', 'На исполнении'), ('urgent', 'Срочные'), ('overdue', 'Просроченные'), ('completed', 'Исполненные'), ('closed', 'Закрытые')], default='on_execution', editable=False, max_length=16, verbose_name='Статус исполнения'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'execution_date'], name='task_status_idx'),
+        ),
+        migrations.RunPython(fill_task_status, migrations.RunPython.noop),
+    ]
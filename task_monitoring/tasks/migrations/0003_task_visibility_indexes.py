@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 08:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('tasks', '0002_task_status'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX task_executors_employee_idx '
+            'ON tasks_task_executors (employee_id, task_id);',
+            'DROP INDEX task_executors_employee_idx;'
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['initiator', 'execution_date'], name='task_initiator_idx'),
+        ),
+    ]
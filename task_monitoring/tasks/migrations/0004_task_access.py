@@ -0,0 +1,60 @@
+# Generated by Django 5.2 on 2026-10-18 08:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_task_access(apps, schema_editor):
+    """
+    Доступ инициаторов и исполнителей к существующим поручениям.
+    Доступ участников вышестоящих поручений заполняет
+    команда rebuild_task_access.
+    """
+
+    Task = apps.get_model('tasks', 'Task')
+    TaskAccess = apps.get_model('tasks', 'TaskAccess')
+
+    TaskAccess.objects.bulk_create(
+        (
+            TaskAccess(employee_id=initiator_id, task_id=task_id, relation='initiator')
+            for task_id, initiator_id in Task.objects.values_list(
+                'id', 'initiator_id'
+            ).iterator()
+        ),
+        batch_size=1000
+    )
+    TaskAccess.objects.bulk_create(
+        (
+            TaskAccess(employee_id=employee_id, task_id=task_id, relation='executor')
+            for task_id, employee_id in Task.executors.through.objects.values_list(
+                'task_id', 'employee_id'
+            ).iterator()
+        ),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('tasks', '0003_task_visibility_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('relation', models.CharField(choices=[('initiator', 'Инициатор'), ('executor', 'Исполнитель'), ('redirect_ancestor', 'Участник вышестоящего поручения')], max_length=32, verbose_name='Основание доступа')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_accesses', to='departments.employee', verbose_name='Сотрудник')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accesses', to='tasks.task', verbose_name='Поручение')),
+            ],
+            options={
+                'verbose_name': 'Доступ к поручению',
+                'verbose_name_plural': 'Доступы к поручениям',
+                'constraints': [models.UniqueConstraint(fields=('employee', 'relation', 'task'), name='unique_task_access')],
+            },
+        ),
+        migrations.RunPython(fill_task_access, migrations.RunPython.noop),
+    ]
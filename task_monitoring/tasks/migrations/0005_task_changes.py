@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-18 08:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('tasks', '0004_task_access'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.BigIntegerField(verbose_name='Поручение')),
+                ('relation', models.CharField(choices=[('initiator', 'Инициатор'), ('executor', 'Исполнитель'), ('redirect_ancestor', 'Участник вышестоящего поручения')], max_length=32, verbose_name='Основание доступа')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата удаления')),
+            ],
+            options={
+                'verbose_name': 'Удаленное поручение',
+                'verbose_name_plural': 'Удаленные поручения',
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Дата изменения'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['updated_at', 'id'], name='task_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='tasktombstone',
+            name='employee',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='departments.employee', verbose_name='Сотрудник'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['employee', 'id'], name='task_tombstone_employee_idx'),
+        ),
+    ]
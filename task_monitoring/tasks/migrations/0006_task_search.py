@@ -0,0 +1,107 @@
+from django.db import migrations
+
+
+POSTGRESQL_SEARCH_SQL = (
+    """
+    ALTER TABLE tasks_task ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(resolution, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce(executions_comment, '')), 'C')
+    ) STORED;
+    """,
+    'CREATE INDEX task_search_idx ON tasks_task USING GIN (search_vector);'
+)
+
+POSTGRESQL_SEARCH_REVERSE_SQL = (
+    'DROP INDEX IF EXISTS task_search_idx;',
+    'ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector;'
+)
+
+SQLITE_SEARCH_SQL = (
+    """
+    CREATE VIRTUAL TABLE tasks_task_search USING fts5(
+        title, resolution, executions_comment,
+        content='tasks_task', content_rowid='id'
+    );
+    """,
+    """
+    CREATE TRIGGER tasks_task_search_insert AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO tasks_task_search(rowid, title, resolution, executions_comment)
+        VALUES (new.id, new.title, new.resolution, new.executions_comment);
+    END;
+    """,
+    """
+    CREATE TRIGGER tasks_task_search_delete AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO tasks_task_search(
+            tasks_task_search, rowid, title, resolution, executions_comment
+        )
+        VALUES (
+            'delete', old.id, old.title, old.resolution, old.executions_comment
+        );
+    END;
+    """,
+    """
+    CREATE TRIGGER tasks_task_search_update
+    AFTER UPDATE OF title, resolution, executions_comment ON tasks_task BEGIN
+        INSERT INTO tasks_task_search(
+            tasks_task_search, rowid, title, resolution, executions_comment
+        )
+        VALUES (
+            'delete', old.id, old.title, old.resolution, old.executions_comment
+        );
+        INSERT INTO tasks_task_search(rowid, title, resolution, executions_comment)
+        VALUES (new.id, new.title, new.resolution, new.executions_comment);
+    END;
+    """,
+    "INSERT INTO tasks_task_search(tasks_task_search) VALUES ('rebuild');"
+)
+
+SQLITE_SEARCH_REVERSE_SQL = (
+    'DROP TRIGGER IF EXISTS tasks_task_search_insert;',
+    'DROP TRIGGER IF EXISTS tasks_task_search_delete;',
+    'DROP TRIGGER IF EXISTS tasks_task_search_update;',
+    'DROP TABLE IF EXISTS tasks_task_search;'
+)
+
+
+def has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options;')
+        return ('ENABLE_FTS5',) in cursor.fetchall()
+
+
+def get_search_sql(schema_editor, reverse=False):
+    """
+    Полнотекстовый поиск создается средствами СУБД:
+    в PostgreSQL - вычисляемый столбец tsvector с индексом GIN,
+    в SQLite (режим DEBUG) - таблица FTS5 с триггерами.
+    """
+
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        return POSTGRESQL_SEARCH_REVERSE_SQL if reverse else POSTGRESQL_SEARCH_SQL
+    if connection.vendor == 'sqlite' and has_fts5(connection):
+        return SQLITE_SEARCH_REVERSE_SQL if reverse else SQLITE_SEARCH_SQL
+    return ()
+
+
+def create_search(apps, schema_editor):
+    for sql in get_search_sql(schema_editor):
+        schema_editor.execute(sql)
+
+
+def drop_search(apps, schema_editor):
+    for sql in get_search_sql(schema_editor, reverse=True):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_changes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search, drop_search),
+    ]
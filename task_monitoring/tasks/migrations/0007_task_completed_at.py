@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Дата отметки об исполнении'),
+        ),
+        migrations.AddField(
+            model_name='tasktombstone',
+            name='assignment_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Дата удаленного поручения'),
+        ),
+    ]
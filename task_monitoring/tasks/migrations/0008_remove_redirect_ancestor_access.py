@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+def delete_redirect_ancestor_access(apps, schema_editor):
+    """Доступ участников вышестоящих поручений не влияет на видимость."""
+
+    TaskAccess = apps.get_model('tasks', 'TaskAccess')
+    TaskTombstone = apps.get_model('tasks', 'TaskTombstone')
+
+    TaskAccess.objects.filter(relation='redirect_ancestor').delete()
+    TaskTombstone.objects.filter(relation='redirect_ancestor').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_task_completed_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_redirect_ancestor_access, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='taskaccess',
+            name='relation',
+            field=models.CharField(choices=[('initiator', 'Инициатор'), ('executor', 'Исполнитель')], max_length=32, verbose_name='Основание доступа'),
+        ),
+        migrations.AlterField(
+            model_name='tasktombstone',
+            name='relation',
+            field=models.CharField(choices=[('initiator', 'Инициатор'), ('executor', 'Исполнитель')], max_length=32, verbose_name='Основание доступа'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    """
+    Таблица кэша в базе данных (DatabaseCache по умолчанию),
+    общего для всех процессов. Для других бэкендов ничего не создается.
+    """
+
+    call_command(
+        'createcachetable',
+        database=schema_editor.connection.alias,
+        verbosity=0
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_remove_redirect_ancestor_access'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,39 @@
+from datetime import date
+
+from django.conf import settings
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.utils import timezone
 
 from departments.models import Employee
 
 
+ON_EXECUTION = 'on_execution'
+URGENT = 'urgent'
+OVERDUE = 'overdue'
+COMPLETED = 'completed'
+CLOSED = 'closed'
+
+STATUS_CHOICES = [
+    (ON_EXECUTION, 'На исполнении'),
+    (URGENT, 'Срочные'),
+    (OVERDUE, 'Просроченные'),
+    (COMPLETED, 'Исполненные'),
+    (CLOSED, 'Закрытые')
+]
+
+# Порядок статусов по срочности для сортировки ?ordering=status.
+STATUS_ORDER = (OVERDUE, URGENT, ON_EXECUTION, COMPLETED, CLOSED)
+
+INITIATOR = 'initiator'
+EXECUTOR = 'executor'
+
+RELATION_CHOICES = [
+    (INITIATOR, 'Инициатор'),
+    (EXECUTOR, 'Исполнитель')
+]
+
+
 class Document(models.Model):
     """Модель Документа."""
 
@@ -122,6 +152,36 @@ class Group(models.Model):
         return self.name
 
 
+class TaskQuerySet(models.QuerySet):
+    """QuerySet Поручений с фильтрами видимости для сотрудника."""
+
+    def with_access(self, employee, relations):
+        return self.filter(
+            models.Exists(
+                TaskAccess.objects.filter(
+                    task_id=models.OuterRef('pk'),
+                    employee_id=employee.id,
+                    relation__in=relations
+                )
+            )
+        )
+
+    def executed_by(self, employee):
+        """Поручения, исполнителем которых является сотрудник."""
+
+        return self.with_access(employee, [EXECUTOR])
+
+    def visible_to(self, employee):
+        """Поручения, инициатором или исполнителем которых является сотрудник."""
+
+        return self.with_access(employee, [INITIATOR, EXECUTOR])
+
+    def touch(self):
+        """Отметка об изменении поручений для ленты изменений."""
+
+        return self.update(updated_at=timezone.now())
+
+
 class Task(models.Model):
     """Модель Поручения."""
     
@@ -202,12 +262,44 @@ class Task(models.Model):
         default=False,
         db_index=True
     )
-    
+    status = models.CharField(
+        verbose_name='Статус исполнения',
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=ON_EXECUTION,
+        editable=False
+    )
+    completed_at = models.DateTimeField(
+        verbose_name='Дата отметки об исполнении',
+        blank=True,
+        null=True,
+        editable=False
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата изменения',
+        auto_now=True
+    )
+
+    objects = TaskQuerySet.as_manager()
 
     class Meta:
         ordering = ['execution_date']
         verbose_name = 'Поручение'
         verbose_name_plural = 'Поручения'
+        indexes = [
+            models.Index(
+                fields=['status', 'execution_date'],
+                name='task_status_idx'
+            ),
+            models.Index(
+                fields=['initiator', 'execution_date'],
+                name='task_initiator_idx'
+            ),
+            models.Index(
+                fields=['updated_at', 'id'],
+                name='task_updated_idx'
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[
@@ -222,3 +314,137 @@ class Task(models.Model):
 
     def __str__(self):
         return f'{self.pk} - {self.title} - {self.initiator}'
+
+    def save(self, *args, **kwargs):
+        self.status = self.get_status()
+        if not self.is_completed:
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {
+                *kwargs['update_fields'], 'status', 'completed_at'
+            }
+        super().save(*args, **kwargs)
+
+    def get_status(self, today=None):
+        """Статус исполнения поручения на указанную дату."""
+
+        today = today or date.today()
+        if self.is_closed:
+            return CLOSED
+        if self.is_completed:
+            return COMPLETED
+        if self.execution_date < today:
+            return OVERDUE
+        if self.execution_date <= today + settings.URGENT_EXECUTION_PERIOD:
+            return URGENT
+        return ON_EXECUTION
+
+    @staticmethod
+    def status_expression(today=None):
+        """SQL-выражение статуса исполнения для массового пересчета."""
+
+        today = today or date.today()
+        return models.Case(
+            models.When(is_closed=True, then=models.Value(CLOSED)),
+            models.When(is_completed=True, then=models.Value(COMPLETED)),
+            models.When(execution_date__lt=today, then=models.Value(OVERDUE)),
+            models.When(
+                execution_date__lte=today + settings.URGENT_EXECUTION_PERIOD,
+                then=models.Value(URGENT)
+            ),
+            default=models.Value(ON_EXECUTION),
+            output_field=models.CharField()
+        )
+
+
+class TaskAccess(models.Model):
+    """
+    Модель доступа Сотрудника к Поручению.
+
+    Денормализованная выборка инициаторов и исполнителей,
+    поддерживаемая в tasks.access.
+    """
+
+    employee = models.ForeignKey(
+        Employee,
+        verbose_name='Сотрудник',
+        related_name='task_accesses',
+        on_delete=models.CASCADE
+    )
+    task = models.ForeignKey(
+        Task,
+        verbose_name='Поручение',
+        related_name='accesses',
+        on_delete=models.CASCADE
+    )
+    relation = models.CharField(
+        verbose_name='Основание доступа',
+        max_length=32,
+        choices=RELATION_CHOICES
+    )
+
+    class Meta:
+        verbose_name = 'Доступ к поручению'
+        verbose_name_plural = 'Доступы к поручениям'
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'employee',
+                    'relation',
+                    'task'
+                ],
+                name='unique_task_access'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.employee} - {self.task_id} - {self.relation}'
+
+
+class TaskTombstone(models.Model):
+    """
+    Модель отметки об удалении Поручения или утрате доступа к нему.
+
+    Используется лентой изменений поручений. Ссылки без ограничений
+    целостности, так как поручение и сотрудник могут быть удалены.
+    """
+
+    task_id = models.BigIntegerField(
+        verbose_name='Поручение'
+    )
+    employee = models.ForeignKey(
+        Employee,
+        verbose_name='Сотрудник',
+        related_name='+',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False
+    )
+    relation = models.CharField(
+        verbose_name='Основание доступа',
+        max_length=32,
+        choices=RELATION_CHOICES
+    )
+    assignment_date = models.DateField(
+        verbose_name='Дата удаленного поручения',
+        blank=True,
+        null=True
+    )
+    deleted_at = models.DateTimeField(
+        verbose_name='Дата удаления',
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = 'Удаленное поручение'
+        verbose_name_plural = 'Удаленные поручения'
+        indexes = [
+            models.Index(
+                fields=['employee', 'id'],
+                name='task_tombstone_employee_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.employee_id} - {self.task_id} - {self.relation}'
@@ -0,0 +1,138 @@
+from base64 import b64decode, b64encode
+from datetime import date
+
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TaskPagination(PageNumberPagination):
+    """
+    Пагинация поручений.
+
+    По умолчанию постраничная, при передаче ?pagination=cursor -
+    курсорная по ключу (execution_date, id) без COUNT и OFFSET.
+    Другие сортировки (?ordering=status, релевантность поиска)
+    курсорной пагинацией не поддерживаются.
+    """
+
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Некорректный курсор.'
+    invalid_ordering_message = (
+        'Курсорная пагинация поддерживает только сортировку '
+        'по дате исполнения.'
+    )
+    cursor_orderings = ('execution_date', '-execution_date')
+
+    def is_cursor_mode(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode_enabled = self.is_cursor_mode(request)
+        if not self.cursor_mode_enabled:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        order_by = queryset.query.order_by
+        if order_by and (
+            order_by[0] not in self.cursor_orderings
+            or any(field not in ('id', '-id', 'pk', '-pk') for field in order_by[1:])
+        ):
+            raise ValidationError({'ordering': [self.invalid_ordering_message]})
+        is_descending = bool(order_by) and order_by[0] == '-execution_date'
+        is_previous = cursor is not None and cursor[2]
+        descending = is_descending != is_previous
+        ordering = (
+            ('-execution_date', '-id') if descending
+            else ('execution_date', 'id')
+        )
+        queryset = queryset.order_by(*ordering)
+
+        if cursor is not None:
+            execution_date, task_id = cursor[:2]
+            lookup = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'execution_date__{lookup}': execution_date})
+                | Q(execution_date=execution_date, **{f'id__{lookup}': task_id})
+            )
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if is_previous:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.results = results
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode_enabled:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.cursor_mode_enabled:
+            return super().get_next_link()
+        if not self.has_next or not self.results:
+            return None
+        return self.encode_cursor(self.results[-1], is_previous=False)
+
+    def get_previous_link(self):
+        if not self.cursor_mode_enabled:
+            return super().get_previous_link()
+        if not self.has_previous or not self.results:
+            return None
+        return self.encode_cursor(self.results[0], is_previous=True)
+
+    def get_position(self, item):
+        if isinstance(item, dict):
+            return item['execution_date'], item['id']
+        return item.execution_date, item.id
+
+    def encode_cursor(self, item, is_previous):
+        execution_date, task_id = self.get_position(item)
+        position = f'{execution_date.isoformat()}|{task_id}|{int(is_previous)}'
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        url = replace_query_param(url, self.mode_query_param, self.cursor_mode)
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            b64encode(position.encode('ascii')).decode('ascii')
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = b64decode(encoded.encode('ascii')).decode('ascii')
+            execution_date, task_id, is_previous = position.split('|')
+            return (
+                date.fromisoformat(execution_date),
+                int(task_id),
+                bool(int(is_previous))
+            )
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
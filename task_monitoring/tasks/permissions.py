@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from tasks.models import EXECUTOR
+
 
 class IsAdminOrManagerOrReadOnly(permissions.BasePermission):
 
@@ -19,8 +21,11 @@ class IsAdminOrManagerOrReadOnly(permissions.BasePermission):
         return (
             (request.method in permissions.SAFE_METHODS
              and (request.user.is_staff
-                  or request.user.employee in obj.executors.all()))
+                  or obj.accesses.filter(
+                      employee=request.user.employee.id,
+                      relation=EXECUTOR
+                  ).exists()))
             or request.user.is_staff
             or request.user.employee.is_director()
-            or obj.initiator == request.user.employee
+            or obj.initiator_id == request.user.employee.id
         )
@@ -0,0 +1,131 @@
+from tasks.models import OVERDUE, URGENT, Task
+
+
+TASK_VALUES = (
+    'id',
+    'group__name',
+    'title',
+    'number',
+    'assignment_date',
+    'execution_date',
+    'parent_task__id',
+    'parent_task__title',
+    'parent_task__initiator__user__last_name',
+    'parent_task__initiator__user__first_name',
+    'resolution',
+    'initiator__user__last_name',
+    'initiator__user__first_name',
+    'initiator__department__name',
+    'initiator__role',
+    'is_closed',
+    'is_completed',
+    'status',
+    'executions_comment'
+)
+
+REDIRECTED_TASK_VALUES = (
+    'id',
+    'parent_task_id',
+    'title',
+    'initiator__user__last_name',
+    'initiator__user__first_name'
+)
+
+EXECUTOR_VALUES = (
+    'task_id',
+    'employee__user__last_name',
+    'employee__user__first_name',
+    'employee__department__name',
+    'employee__role'
+)
+
+
+def _date(value):
+    return value.isoformat() if value is not None else None
+
+
+def _task_str(task_id, title, last_name, first_name):
+    return f'{task_id} - {title} - {last_name} {first_name}'
+
+
+def _employee(row, prefix):
+    return {
+        'user': f'{row[prefix + "user__last_name"]} '
+                f'{row[prefix + "user__first_name"]}',
+        'department': row[prefix + 'department__name'],
+        'role': row[prefix + 'role']
+    }
+
+
+def get_tasks_projection(task_ids):
+    """
+    Представление поручений в формате TaskGetSerializer,
+    собранное из трех values()-проекций вместо ленивых загрузок.
+    """
+
+    task_ids = list(task_ids)
+    if not task_ids:
+        return []
+
+    unique_ids = set(task_ids)
+    tasks = {
+        row['id']: row for row in Task.objects.filter(
+            id__in=unique_ids
+        ).order_by().values(*TASK_VALUES)
+    }
+
+    redirected_tasks = {task_id: [] for task_id in unique_ids}
+    for row in Task.objects.filter(
+        parent_task__in=unique_ids
+    ).order_by('execution_date', 'id').values(*REDIRECTED_TASK_VALUES):
+        redirected_tasks[row['parent_task_id']].append(
+            _task_str(
+                row['id'],
+                row['title'],
+                row['initiator__user__last_name'],
+                row['initiator__user__first_name']
+            )
+        )
+
+    executors = {task_id: [] for task_id in unique_ids}
+    for row in Task.executors.through.objects.filter(
+        task_id__in=unique_ids
+    ).order_by(
+        'employee__user__last_name', 'employee_id'
+    ).values(*EXECUTOR_VALUES):
+        executors[row['task_id']].append(_employee(row, 'employee__'))
+
+    result = []
+    for task_id in task_ids:
+        row = tasks.get(task_id)
+        if row is None:
+            continue
+        parent_task = None
+        if row['parent_task__id'] is not None:
+            parent_task = _task_str(
+                row['parent_task__id'],
+                row['parent_task__title'],
+                row['parent_task__initiator__user__last_name'],
+                row['parent_task__initiator__user__first_name']
+            )
+        result.append(
+            {
+                'id': row['id'],
+                'group': row['group__name'],
+                'title': row['title'],
+                'number': row['number'],
+                'assignment_date': _date(row['assignment_date']),
+                'execution_date': _date(row['execution_date']),
+                'parent_task': parent_task,
+                'redirected_tasks': redirected_tasks[task_id],
+                'resolution': row['resolution'],
+                'initiator': _employee(row, 'initiator__'),
+                'executors': executors[task_id],
+                'is_closed': row['is_closed'],
+                'is_completed': row['is_completed'],
+                'is_urgent': row['status'] == URGENT,
+                'is_overdue': row['status'] == OVERDUE,
+                'executions_comment': row['executions_comment']
+            }
+        )
+    return result
@@ -0,0 +1,76 @@
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from tasks.export import iter_chunks
+
+
+def dump_line(item):
+    return json.dumps(item, cls=JSONEncoder, ensure_ascii=False) + '\n'
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Рендерер NDJSON: по одному JSON-объекту в строке."""
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, list):
+            data = [data]
+        return ''.join(dump_line(item) for item in data).encode(self.charset)
+
+
+class NDJSONListMixin:
+    """
+    Потоковая выдача списка в формате NDJSON для администраторов:
+    строки сериализуются частями по мере чтения из базы данных,
+    без пагинации и подсчета количества. Остальным действиям
+    формат NDJSON недоступен.
+    """
+
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if getattr(self, 'action', None) == 'list':
+            return renderers
+        return [
+            renderer for renderer in renderers
+            if not isinstance(renderer, NDJSONRenderer)
+        ]
+
+    def is_ndjson(self):
+        renderer = getattr(self.request, 'accepted_renderer', None)
+        return isinstance(renderer, NDJSONRenderer)
+
+    def get_ndjson_chunks(self, queryset):
+        """Части списка в формате сериализатора."""
+
+        for chunk in iter_chunks(queryset, settings.TASK_EXPORT_CHUNK_SIZE):
+            yield self.get_serializer(chunk, many=True).data
+
+    def iter_ndjson(self, queryset):
+        for data in self.get_ndjson_chunks(queryset):
+            yield ''.join(dump_line(item) for item in data)
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_ndjson():
+            return super().list(request, *args, **kwargs)
+        if not request.user.is_staff:
+            raise PermissionDenied(
+                'Потоковая выгрузка доступна только администраторам.'
+            )
+        return StreamingHttpResponse(
+            self.iter_ndjson(self.filter_queryset(self.get_queryset())),
+            content_type=NDJSONRenderer.media_type
+        )
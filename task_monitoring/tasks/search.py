@@ -0,0 +1,168 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVectorField
+)
+from django.db import connections
+from django.db.models import F, FloatField, Q, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Concat
+
+from tasks.models import Task
+
+
+SEARCH_CONFIG = 'russian'
+SEARCH_FIELDS = ('title', 'resolution', 'executions_comment')
+SEARCH_INDEX_TABLE = 'tasks_task_search'
+HEADLINE_START = '<b>'
+HEADLINE_STOP = '</b>'
+HEADLINE_WORDS = 16
+
+
+def get_vendor(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if (connection.vendor == 'sqlite'
+        and SEARCH_INDEX_TABLE in connection.introspection.table_names()):
+        return 'sqlite'
+    return None
+
+
+def get_search_query(value):
+    return SearchQuery(value, config=SEARCH_CONFIG, search_type='websearch')
+
+
+def get_search_vector(queryset):
+    """Столбец search_vector, создаваемый миграцией только в PostgreSQL."""
+
+    quote_name = connections[queryset.db].ops.quote_name
+    return RawSQL(
+        f'{quote_name(Task._meta.db_table)}.{quote_name("search_vector")}',
+        [],
+        output_field=SearchVectorField()
+    )
+
+
+def get_match_query(value):
+    """
+    Запрос FTS5 из слов строки поиска: каждое слово в кавычках
+    и с поиском по префиксу, без операторов синтаксиса FTS5.
+    """
+
+    return ' '.join(
+        '"{}"*'.format(word) for word in re.findall(r'\w+', value.lower())
+    )
+
+
+def search_tasks(queryset, value):
+    """
+    Поиск поручений по заголовку, резолюции и комментарию к исполнению,
+    отсортированных по релевантности.
+
+    PostgreSQL - столбец tsvector с индексом GIN и русской конфигурацией,
+    SQLite - таблица FTS5, иначе - поиск по вхождению подстроки.
+    """
+
+    vendor = get_vendor(queryset)
+
+    if vendor == 'postgresql':
+        query = get_search_query(value)
+        return queryset.alias(
+            search_vector=get_search_vector(queryset)
+        ).filter(
+            search_vector=query
+        ).alias(
+            search_rank=SearchRank(F('search_vector'), query)
+        ).order_by('-search_rank', 'id')
+
+    if vendor == 'sqlite':
+        match = get_match_query(value)
+        if not match:
+            return queryset.none()
+        table = connections[queryset.db].ops.quote_name(Task._meta.db_table)
+        return queryset.filter(
+            id__in=RawSQL(
+                f'SELECT rowid FROM {SEARCH_INDEX_TABLE} '
+                f'WHERE {SEARCH_INDEX_TABLE} MATCH %s',
+                [match]
+            )
+        ).alias(
+            search_rank=RawSQL(
+                f'SELECT -bm25({SEARCH_INDEX_TABLE}) FROM {SEARCH_INDEX_TABLE} '
+                f'WHERE {SEARCH_INDEX_TABLE} MATCH %s '
+                f'AND {SEARCH_INDEX_TABLE}.rowid = {table}.id',
+                [match],
+                output_field=FloatField()
+            )
+        ).order_by('-search_rank', 'id')
+
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f'{field}__icontains': value})
+    return queryset.filter(condition)
+
+
+def get_search_headlines(task_ids, value):
+    """
+    Релевантность и фрагменты текста с выделенными словами поиска
+    для поручений страницы: {id: {'search_rank', 'search_headline'}}.
+    Фрагменты строятся одним запросом только для переданных поручений.
+    """
+
+    task_ids = list(task_ids)
+    queryset = Task.objects.filter(id__in=task_ids).order_by()
+    vendor = get_vendor(queryset)
+    if not task_ids or vendor is None:
+        return {}
+
+    if vendor == 'postgresql':
+        query = get_search_query(value)
+        rows = queryset.annotate(
+            search_rank=SearchRank(get_search_vector(queryset), query),
+            search_headline=SearchHeadline(
+                Concat(
+                    'title',
+                    Value(' '),
+                    'resolution',
+                    Value(' '),
+                    'executions_comment',
+                    output_field=TextField()
+                ),
+                query,
+                config=SEARCH_CONFIG,
+                start_sel=HEADLINE_START,
+                stop_sel=HEADLINE_STOP,
+                max_words=HEADLINE_WORDS * 2,
+                min_words=HEADLINE_WORDS
+            )
+        ).values_list('id', 'search_rank', 'search_headline')
+    else:
+        match = get_match_query(value)
+        if not match:
+            return {}
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid, -bm25({SEARCH_INDEX_TABLE}), '
+                f'snippet({SEARCH_INDEX_TABLE}, -1, %s, %s, %s, %s) '
+                f'FROM {SEARCH_INDEX_TABLE} '
+                f'WHERE {SEARCH_INDEX_TABLE} MATCH %s '
+                f'AND rowid IN ({", ".join(["%s"] * len(task_ids))})',
+                [
+                    HEADLINE_START,
+                    HEADLINE_STOP,
+                    '…',
+                    HEADLINE_WORDS,
+                    match,
+                    *task_ids
+                ]
+            )
+            rows = cursor.fetchall()
+
+    return {
+        task_id: {'search_rank': rank, 'search_headline': headline}
+        for task_id, rank, headline in rows
+    }
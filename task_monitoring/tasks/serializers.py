@@ -8,9 +8,10 @@ from django.forms.models import model_to_dict
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
-from tasks.models import Task, Group
+from tasks.fieldsets import SparseFieldsetSerializerMixin
+from tasks.models import OVERDUE, URGENT, Task, Group
 
-from departments.models import Employee, ROLE_CHOICES
+from departments.models import Employee
 from departments.serializers import (
     EmployeeCreateSerializer,
     EmployeeGetSerializer,
@@ -20,7 +21,10 @@ from departments.serializers import (
 # from users.serializers import CustomUserSerializer, CustomUserContextSerializer
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer
+):
     """Сериализатор Типа задачи."""
 
     class Meta:
@@ -36,26 +40,9 @@ class ExecutorsField(serializers.PrimaryKeyRelatedField):
     """Кастомное поле выбора исполнителя Поручения."""
 
     def get_queryset(self):
-        request_user = self.context['request'].user
-        if request_user.employee.is_director():
-            return Employee.objects.exclude(
-                pk=request_user.employee.id,
-                role=ROLE_CHOICES[0][0]
-            )
-        elif request_user.employee.is_head_department():
-            return Employee.objects.filter(
-                department=request_user.employee.department
-            ).exclude(
-                pk=request_user.employee.id
-            )
-        elif request_user.employee.is_deputy_head_department():
-            return Employee.objects.filter(
-                department=request_user.employee.department,
-                role=ROLE_CHOICES[4][0]
-            ).exclude(
-                pk=request_user.employee.id
-            )
-        return Employee.objects.all()
+        return Employee.objects.assignable_by(
+            self.context['request'].user.employee
+        )
 
 
 class TaskCreateSerializer(serializers.ModelSerializer):
@@ -100,6 +87,74 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return data
     
 
+class TaskBulkCreateSerializer(serializers.Serializer):
+    """
+    Сериализатор элемента массового создания Поручений.
+
+    Связанные объекты, исполнители и уникальность проверяются
+    сразу для всего списка в tasks.bulk.
+    """
+
+    title = serializers.CharField(max_length=512)
+    number = serializers.CharField(
+        max_length=56,
+        required=False,
+        allow_null=True,
+        allow_blank=True
+    )
+    group = serializers.IntegerField(required=False, allow_null=True)
+    parent_task = serializers.IntegerField(required=False, allow_null=True)
+    resolution = serializers.CharField(max_length=10000)
+    initiator = serializers.IntegerField()
+    executors = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False
+    )
+    execution_date = serializers.DateField()
+
+    def validate(self, data):
+        if data['execution_date'] < date.today():
+            raise serializers.ValidationError('Некорректная дата исполнения поручения!')
+        return data
+
+
+class TaskRedirectItemSerializer(serializers.Serializer):
+    """Сериализатор перенаправления в массовом перенаправлении Поручения."""
+
+    executors = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False
+    )
+    execution_date = serializers.DateField(required=False)
+    resolution = serializers.CharField(max_length=10000, required=False)
+
+
+class TaskFanOutSerializer(serializers.Serializer):
+    """Сериализатор массового перенаправления Поручения."""
+
+    redirects = TaskRedirectItemSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=settings.TASK_BULK_MAX_ITEMS
+    )
+
+
+class TaskBulkActionSerializer(serializers.Serializer):
+    """Сериализатор списка Поручений для массовых действий."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=settings.TASK_BULK_MAX_ITEMS
+    )
+    executions_comment = serializers.CharField(
+        max_length=10000,
+        required=False,
+        allow_null=True,
+        allow_blank=True
+    )
+
+
 class TaskExecutorUpdateSerializer(serializers.ModelSerializer):
     """Сериализатор изменения Поручения для исполнителя."""
 
@@ -113,9 +168,24 @@ class TaskExecutorUpdateSerializer(serializers.ModelSerializer):
         )
 
 
-class TaskGetSerializer(serializers.ModelSerializer):
+class TaskGetSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer
+):
     """Контекстный сериализатор Поручения."""
 
+    expandable_fields = (
+        'group',
+        'parent_task',
+        'redirected_tasks',
+        'initiator',
+        'executors'
+    )
+    field_columns = {
+        'is_urgent': ('status',),
+        'is_overdue': ('status',)
+    }
+
     parent_task = serializers.StringRelatedField()
     redirected_tasks = serializers.StringRelatedField(many=True)
     initiator = EmployeeContextSerializer(read_only=True)
@@ -149,18 +219,12 @@ class TaskGetSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        data['group'] = instance.group.name
+        if 'group' in data and self.is_expanded('group'):
+            data['group'] = instance.group.name
         return data
 
     def get_is_urgent(self, task):
-        return all(
-            [task.is_completed==False,
-             task.execution_date >= date.today(),
-             task.execution_date <= date.today() + settings.URGENT_EXECUTION_PERIOD]
-        )
+        return task.status == URGENT
 
     def get_is_overdue(self, task):
-        return all(
-            [task.is_completed==False,
-             task.execution_date < date.today()]
-        )
+        return task.status == OVERDUE
@@ -0,0 +1,143 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save
+)
+from django.dispatch import receiver
+
+from departments.models import Department, Employee
+from tasks.access import get_access_employee_ids, rebuild_task_access
+from tasks.cache import invalidate_directory_cache, invalidate_tasks_cache
+from tasks.models import Group, Task, TaskTombstone
+
+
+User = get_user_model()
+
+
+def refresh_tasks(task_ids):
+    invalidate_tasks_cache(rebuild_task_access(task_ids))
+
+
+ACCESS_FIELDS = {'initiator', 'initiator_id', 'parent_task', 'parent_task_id'}
+
+
+def touch_related_tasks(task, parent_ids):
+    """
+    Отметка об изменении вышестоящих поручений и перенаправлений,
+    в представлении которых отображается поручение.
+    Возвращает идентификаторы отмеченных поручений.
+    """
+
+    related_ids = set(
+        Task.objects.filter(
+            Q(pk__in=parent_ids) | Q(parent_task=task.pk)
+        ).values_list('id', flat=True)
+    )
+    Task.objects.filter(pk__in=related_ids).touch()
+    return related_ids
+
+
+@receiver(pre_save, sender=Task)
+def task_saving(sender, instance, update_fields=None, **kwargs):
+    """Прежние инициатор и вышестоящее поручение сохраняемого поручения."""
+
+    if update_fields is not None and not ACCESS_FIELDS & set(update_fields):
+        instance._previous = {
+            'initiator_id': instance.initiator_id,
+            'parent_task_id': instance.parent_task_id
+        }
+    elif instance.pk is None:
+        instance._previous = None
+    else:
+        instance._previous = Task.objects.filter(pk=instance.pk).values(
+            'initiator_id', 'parent_task_id'
+        ).first()
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, **kwargs):
+    """
+    Доступ к поручению пересобирается только при смене инициатора,
+    кэш инвалидируется для участников поручения и связанных поручений.
+    """
+
+    previous = getattr(instance, '_previous', None) or {}
+    related_ids = touch_related_tasks(
+        instance,
+        {instance.parent_task_id, previous.get('parent_task_id')} - {None}
+    )
+    if previous.get('initiator_id') != instance.initiator_id:
+        employee_ids = (
+            rebuild_task_access({instance.pk})
+            | get_access_employee_ids(related_ids)
+        )
+    else:
+        employee_ids = get_access_employee_ids(related_ids | {instance.pk})
+    invalidate_tasks_cache(employee_ids)
+
+
+@receiver(pre_delete, sender=Task)
+def task_deleting(sender, instance, **kwargs):
+    accesses = list(instance.accesses.values_list('employee_id', 'relation'))
+    TaskTombstone.objects.bulk_create(
+        TaskTombstone(
+            employee_id=employee_id,
+            relation=relation,
+            task_id=instance.pk,
+            assignment_date=instance.assignment_date
+        )
+        for employee_id, relation in accesses
+    )
+    instance._employee_ids = {employee_id for employee_id, _ in accesses}
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    invalidate_tasks_cache(
+        getattr(instance, '_employee_ids', {instance.initiator_id})
+    )
+    if instance.parent_task_id is not None:
+        Task.objects.filter(pk=instance.parent_task_id).touch()
+
+
+@receiver(m2m_changed, sender=Task.executors.through)
+def task_executors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            Task.objects.filter(pk=instance.pk).touch()
+            refresh_tasks({instance.pk})
+        return
+    if action == 'pre_clear':
+        instance._cleared_task_ids = set(
+            instance.execution_tasks.values_list('id', flat=True)
+        )
+    elif action == 'post_clear':
+        task_ids = getattr(instance, '_cleared_task_ids', set())
+        Task.objects.filter(pk__in=task_ids).touch()
+        refresh_tasks(task_ids)
+    elif action.startswith('post_'):
+        Task.objects.filter(pk__in=pk_set).touch()
+        refresh_tasks(pk_set)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    invalidate_directory_cache()
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def directory_changed(sender, instance, **kwargs):
+    invalidate_directory_cache()
@@ -1,12 +1,40 @@
+import csv
+import json
 from datetime import date, timedelta
+from io import StringIO
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-
-from rest_framework.test import APIClient, APITestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 from rest_framework import status
 
+from rest_framework_simplejwt.tokens import AccessToken
+
 from departments.models import Employee, Department, ROLE_CHOICES
-from tasks.models import Task, Group
+from tasks.cache import get_response_cache_stats
+from tasks.models import (
+    CLOSED,
+    COMPLETED,
+    ON_EXECUTION,
+    OVERDUE,
+    URGENT,
+    EXECUTOR,
+    INITIATOR,
+    Task,
+    TaskAccess,
+    TaskTombstone,
+    Group
+)
+from tasks.views import TaskViewSet
 
 
 User = get_user_model()
@@ -178,6 +206,8 @@ class TaskTests(APITestCase):
 
     def setUp(self):
 
+        cache.clear()
+
         task_data_1 = {
             'title': 'test task 1',
             'number': '1',
@@ -945,3 +975,1461 @@ class TaskTests(APITestCase):
                 data[1],
                 f'Статус запроса для "{data[0]}" не соответствует ожидаемому!'
             )
+
+
+    def test_projection_read_engine(self):
+        """
+        Проверка идентичности ответов values()-проекций и TaskGetSerializer
+        и независимости числа запросов от количества поручений.
+        """
+
+        redirected_task = Task.objects.create(
+            title='test task 3',
+            number='3',
+            initiator=TaskTests.deputy_director_employee,
+            group=TaskTests.group,
+            parent_task=self.task_1,
+            execution_date=date.today() + timedelta(days=1),
+            resolution='test resolution 3'
+        )
+        redirected_task.executors.set(
+            [TaskTests.head_department_1_employee, TaskTests.employee_1]
+        )
+
+        urls = [
+            TaskTests.task_url,
+            TaskTests.task_url + f'{self.task_1.id}/',
+            TaskTests.task_url + f'{redirected_task.id}/',
+            TaskTests.task_url + 'get_on_execution_tasks/',
+            TaskTests.task_url + 'get_outgoing_tasks/',
+            TaskTests.task_url + 'get_urgent_tasks/',
+        ]
+        projection_actions = [
+            'list',
+            'retrieve',
+            'get_on_execution_tasks',
+            'get_outgoing_tasks',
+            'get_urgent_tasks'
+        ]
+
+        for client in (TaskTests.auth_admin,
+                       TaskTests.auth_director,
+                       TaskTests.auth_head_department_1):
+            for url in urls:
+                serializer_response = client.get(url)
+                with override_settings(
+                    TASK_PROJECTION_ACTIONS=projection_actions
+                ):
+                    projection_response = client.get(url)
+                self.assertEqual(
+                    projection_response.content,
+                    serializer_response.content,
+                    f'Ответ проекции для "{url}" не соответствует ожидаемому!'
+                )
+
+        with override_settings(TASK_PROJECTION_ACTIONS=projection_actions):
+            with CaptureQueriesContext(connection) as queries_before:
+                TaskTests.auth_admin.get(TaskTests.task_url)
+            for i in range(10):
+                task = Task.objects.create(
+                    title=f'test projection task {i}',
+                    number=f'p{i}',
+                    initiator=TaskTests.director_employee,
+                    group=TaskTests.group,
+                    parent_task=redirected_task,
+                    execution_date=date.today() + timedelta(days=i),
+                    resolution='test resolution'
+                )
+                task.executors.set([TaskTests.employee_1, TaskTests.employee_2])
+            with CaptureQueriesContext(connection) as queries_after:
+                TaskTests.auth_admin.get(TaskTests.task_url)
+
+        self.assertEqual(
+            len(queries_after),
+            len(queries_before),
+            'Количество запросов проекции зависит от количества поручений!'
+        )
+
+
+    def test_cursor_pagination(self):
+        """
+        Проверка курсорной пагинации по (execution_date, id)
+        и ее устойчивости к добавлению новых поручений.
+        """
+
+        for i in range(60):
+            task = Task.objects.create(
+                title=f'test cursor task {i}',
+                number=f'c{i}',
+                initiator=TaskTests.director_employee,
+                group=TaskTests.group,
+                execution_date=date.today() + timedelta(days=i % 7),
+                resolution='test resolution'
+            )
+            task.executors.set([TaskTests.deputy_director_employee,])
+
+        for url in (
+            TaskTests.task_url + '?pagination=cursor',
+            TaskTests.task_url + 'get_on_execution_tasks/?pagination=cursor'
+        ):
+            expected_ids = list(
+                Task.objects.order_by(
+                    'execution_date', 'id'
+                ).values_list('id', flat=True)
+            )
+            response = TaskTests.auth_admin.get(url)
+            self.assertNotIn('count', response.data)
+            self.assertIsNone(response.data['previous'])
+            first_page_ids = [task['id'] for task in response.data['results']]
+
+            Task.objects.create(
+                title=f'test cursor task {url}',
+                initiator=TaskTests.director_employee,
+                group=TaskTests.group,
+                execution_date=date.today(),
+                resolution='test resolution'
+            )
+
+            received_ids = list(first_page_ids)
+            next_url = response.data['next']
+            while next_url:
+                response = TaskTests.auth_admin.get(next_url)
+                received_ids += [task['id'] for task in response.data['results']]
+                next_url = response.data['next']
+
+            self.assertEqual(
+                received_ids,
+                expected_ids,
+                f'Курсорная пагинация для "{url}" не соответствует ожидаемой!'
+            )
+
+            previous_response = TaskTests.auth_admin.get(response.data['previous'])
+            self.assertEqual(
+                previous_response.data['results'][-1]['id'],
+                expected_ids[-len(response.data['results']) - 1],
+                'Предыдущая страница курсора не соответствует ожидаемой!'
+            )
+
+        self.assertEqual(
+            TaskTests.auth_admin.get(
+                TaskTests.task_url + '?cursor=invalid'
+            ).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        self.assertIn(
+            'count',
+            TaskTests.auth_admin.get(TaskTests.task_url).data
+        )
+
+
+    def test_task_status(self):
+        """Проверка расчета и ежедневного пересчета статуса исполнения."""
+
+        self.assertEqual(self.task_1.status, ON_EXECUTION)
+
+        self.task_1.execution_date = date.today() + timedelta(days=1)
+        self.task_1.save()
+        self.assertEqual(self.task_1.status, URGENT)
+
+        self.task_1.is_completed = True
+        self.task_1.save(update_fields=['is_completed'])
+        self.task_1.refresh_from_db()
+        self.assertEqual(self.task_1.status, COMPLETED)
+
+        self.task_1.is_closed = True
+        self.task_1.save()
+        self.assertEqual(self.task_1.status, CLOSED)
+
+        Task.objects.filter(pk=self.task_2.pk).update(
+            execution_date=date.today() - timedelta(days=1)
+        )
+        call_command('update_task_statuses', stdout=StringIO())
+        self.task_2.refresh_from_db()
+        self.assertEqual(self.task_2.status, OVERDUE)
+
+        Task.objects.filter(pk=self.task_1.pk).update(status=ON_EXECUTION)
+        call_command('update_task_statuses', '--all', stdout=StringIO())
+        self.task_1.refresh_from_db()
+        self.assertEqual(self.task_1.status, CLOSED)
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url, {'status': OVERDUE}
+        )
+        self.assertEqual(
+            [task['id'] for task in response.data['results']],
+            [self.task_2.id]
+        )
+        self.assertTrue(response.data['results'][0]['is_overdue'])
+
+
+    def test_tasks_summary(self):
+        """
+        Проверка счетчиков разделов поручений одним запросом
+        и инвалидации их кэша при изменении поручений.
+        """
+
+        url = TaskTests.task_url + 'summary/'
+
+        self.task_1.execution_date = date.today() + timedelta(days=1)
+        self.task_1.save()
+        self.task_2.is_completed = True
+        self.task_2.save()
+
+        clients = [
+            TaskTests.auth_admin,
+            TaskTests.auth_director,
+            TaskTests.auth_deputy_director,
+            TaskTests.auth_head_department_1,
+            TaskTests.auth_employee_1
+        ]
+        inboxes = [
+            'on_execution',
+            'outgoing',
+            'on_close',
+            'urgent',
+            'overdue'
+        ]
+        inbox_urls = {
+            'on_execution': 'get_on_execution_tasks/',
+            'outgoing': 'get_outgoing_tasks/',
+            'on_close': 'get_on_close_tasks/',
+            'urgent': 'get_urgent_tasks/',
+            'overdue': 'get_overdue_tasks/'
+        }
+
+        for client in clients:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                len([query for query in queries
+                     if 'tasks_task' in query['sql']]),
+                1,
+                'Счетчики рассчитываются не одним запросом!'
+            )
+            for inbox in inboxes:
+                self.assertEqual(
+                    response.data[inbox],
+                    client.get(
+                        TaskTests.task_url + inbox_urls[inbox]
+                    ).data['count'],
+                    f'Счетчик "{inbox}" не соответствует разделу!'
+                )
+
+        with CaptureQueriesContext(connection) as queries:
+            TaskTests.auth_deputy_director.get(url)
+        self.assertFalse(
+            [query for query in queries if 'tasks_task' in query['sql']],
+            'Счетчики не закэшированы!'
+        )
+
+        self.task_1.is_completed = True
+        self.task_1.save()
+        response = TaskTests.auth_deputy_director.get(url)
+        self.assertEqual(response.data['on_execution'], 0)
+        self.assertEqual(response.data['urgent'], 0)
+
+        with override_settings(SHARED_CACHE=False):
+            for _ in range(2):
+                with CaptureQueriesContext(connection) as queries:
+                    TaskTests.auth_deputy_director.get(url)
+                self.assertFalse(
+                    [query for query in queries
+                     if 'tasks:summary' in query['sql']],
+                    'Счетчики кэшируются без общего кэша процессов!'
+                )
+                self.assertTrue(
+                    [query for query in queries if 'tasks_task' in query['sql']]
+                )
+
+        self.assertEqual(
+            TaskTests.guest_client.get(url).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+
+    def test_visible_tasks_without_duplicates(self):
+        """
+        Проверка, что поручение, где руководитель одновременно инициатор
+        и исполнитель, возвращается один раз в списке, просмотре и изменении.
+        """
+
+        task = Task.objects.create(
+            title='test task 3',
+            number='3',
+            initiator=TaskTests.deputy_director_employee,
+            group=TaskTests.group,
+            execution_date=date.today() + timedelta(days=10),
+            resolution='test resolution 3'
+        )
+        task.executors.set([
+            TaskTests.deputy_director_employee,
+            TaskTests.head_department_1_employee,
+            TaskTests.employee_1
+        ])
+
+        url = TaskTests.task_url + f'{task.id}/'
+
+        response = TaskTests.auth_deputy_director.get(TaskTests.task_url)
+        self.assertEqual(
+            sorted(result['id'] for result in response.data['results']),
+            [self.task_1.id, self.task_2.id, task.id]
+        )
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            TaskTests.auth_deputy_director.get(url).status_code,
+            status.HTTP_200_OK
+        )
+        self.assertEqual(
+            TaskTests.auth_deputy_director.patch(
+                url,
+                {'resolution': 'changed resolution',
+                 'execution_date': date.today() + timedelta(days=11)}
+            ).status_code,
+            status.HTTP_200_OK
+        )
+
+
+    def test_task_access(self):
+        """
+        Проверка таблицы доступа к поручениям при перенаправлении,
+        смене исполнителей и инициатора и полной пересборке.
+        """
+
+        redirected_task = Task.objects.create(
+            title='test task 3',
+            number='3',
+            initiator=TaskTests.deputy_director_employee,
+            group=TaskTests.group,
+            parent_task=self.task_1,
+            execution_date=date.today() + timedelta(days=5),
+            resolution='test resolution 3'
+        )
+        redirected_task.executors.set([TaskTests.head_department_1_employee,])
+
+        def get_accesses():
+            return set(
+                TaskAccess.objects.filter(
+                    task__in=[self.task_1, redirected_task]
+                ).values_list('employee_id', 'task_id', 'relation')
+            )
+
+        expected_accesses = {
+            (TaskTests.director_employee.id, self.task_1.id, INITIATOR),
+            (TaskTests.deputy_director_employee.id, self.task_1.id, EXECUTOR),
+            (TaskTests.deputy_director_employee.id, redirected_task.id, INITIATOR),
+            (TaskTests.head_department_1_employee.id, redirected_task.id, EXECUTOR),
+        }
+        self.assertEqual(get_accesses(), expected_accesses)
+
+        access_ids = set(TaskAccess.objects.values_list('id', flat=True))
+        redirected_task.title = 'changed title'
+        redirected_task.parent_task = self.task_2
+        redirected_task.save()
+        self.assertEqual(
+            set(TaskAccess.objects.values_list('id', flat=True)),
+            access_ids,
+            'Доступ пересобран без смены инициатора!'
+        )
+
+        redirected_task.initiator = TaskTests.director_employee
+        redirected_task.save()
+        self.assertIn(
+            (TaskTests.director_employee.id, redirected_task.id, INITIATOR),
+            get_accesses()
+        )
+        self.assertTrue(
+            TaskTombstone.objects.filter(
+                employee=TaskTests.deputy_director_employee,
+                task_id=redirected_task.id,
+                relation=INITIATOR
+            ).exists(),
+            'Утраченный доступ прежнего инициатора не отмечен!'
+        )
+        redirected_task.initiator = TaskTests.deputy_director_employee
+        redirected_task.parent_task = self.task_1
+        redirected_task.save()
+        self.assertEqual(get_accesses(), expected_accesses)
+
+        self.task_1.executors.add(TaskTests.employee_1)
+        self.assertEqual(
+            TaskTests.auth_employee_1.get(TaskTests.task_url).data['count'],
+            1,
+            'Доступ участника вышестоящего поручения расширяет видимость!'
+        )
+
+        self.task_1.executors.remove(TaskTests.employee_1)
+        TaskAccess.objects.all().delete()
+        call_command('rebuild_task_access', '--batch-size', '1', stdout=StringIO())
+        self.assertEqual(get_accesses(), expected_accesses)
+
+
+    def test_request_employee_loaded_once(self):
+        """
+        Проверка загрузки пользователя, сотрудника и подразделения
+        одним запросом аутентификации на всех эндпоинтах поручений.
+        """
+
+        self.task_1.execution_date = date.today() + timedelta(days=1)
+        self.task_1.save()
+
+        user = TaskTests.deputy_director_user
+        token_client = APIClient()
+        token_client.credentials(
+            HTTP_AUTHORIZATION='Token {}'.format(
+                Token.objects.create(user=user).key
+            )
+        )
+        jwt_client = APIClient()
+        jwt_client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}'
+        )
+        preloaded_client = APIClient()
+        preloaded_client.force_authenticate(
+            User.objects.select_related('employee__department').get(pk=user.pk)
+        )
+
+        def get_queries(client, method, url, data=None):
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = getattr(client, method)(url, data)
+            self.assertLess(
+                response.status_code,
+                status.HTTP_400_BAD_REQUEST,
+                f'Статус запроса "{method} {url}" не соответствует ожидаемому!'
+            )
+            self.assertFalse(
+                [query for query in queries
+                 if f'"departments_employee"."user_id" = {user.pk} '
+                 in query['sql']],
+                f'Повторная загрузка сотрудника для "{method} {url}"!'
+            )
+            # Запросы к таблице кэша (DatabaseCache) и точки сохранения
+            # его транзакций не учитываются.
+            return len([
+                query for query in queries
+                if settings.CACHES['default']['LOCATION'] not in query['sql']
+                and 'SAVEPOINT' not in query['sql']
+            ])
+
+        read_urls = [
+            TaskTests.task_url,
+            TaskTests.task_url + f'{self.task_1.id}/',
+            TaskTests.task_url + 'get_on_execution_tasks/',
+            TaskTests.task_url + 'get_outgoing_tasks/',
+            TaskTests.task_url + 'get_on_close_tasks/',
+            TaskTests.task_url + 'get_urgent_tasks/',
+            TaskTests.task_url + 'get_overdue_tasks/',
+            TaskTests.task_url + 'summary/',
+        ]
+        for client in (token_client, jwt_client):
+            for url in read_urls:
+                self.assertEqual(
+                    get_queries(client, 'get', url),
+                    get_queries(preloaded_client, 'get', url) + 1,
+                    f'Лишние запросы аутентификации для "{url}"!'
+                )
+
+            get_queries(client, 'post', TaskTests.task_url, {
+                'title': 'test task 3',
+                'number': '3',
+                'group': TaskTests.group.id,
+                'execution_date': date.today() + timedelta(days=10),
+                'resolution': 'test resolution 3',
+                'executors': [TaskTests.head_department_1_employee.id,]
+            })
+            get_queries(client, 'patch', TaskTests.task_url + f'{self.task_2.id}/', {
+                'resolution': 'changed resolution',
+                'execution_date': date.today() + timedelta(days=11)
+            })
+            get_queries(
+                client, 'patch', TaskTests.task_url + f'{self.task_1.id}/complete_task/'
+            )
+            Task.objects.filter(pk=self.task_2.pk).update(is_completed=True)
+            get_queries(
+                client, 'patch', TaskTests.task_url + f'{self.task_2.id}/close_task/'
+            )
+
+            self.task_1.is_completed = False
+            self.task_1.save()
+            self.task_2.save()
+            Task.objects.filter(title='test task 3').delete()
+
+
+    @override_settings(TASK_RESPONSE_CACHE=True)
+    def test_response_cache(self):
+        """
+        Проверка кэширования ответов на чтение поручений
+        и сброса кэша при изменении поручений исполнителя.
+        """
+
+        url = TaskTests.task_url + 'get_on_execution_tasks/'
+
+        def get_cache_status(client, url):
+            response = client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response['X-Cache'], response.data
+
+        miss, data = get_cache_status(TaskTests.auth_head_department_1, url)
+        hit, cached_data = get_cache_status(TaskTests.auth_head_department_1, url)
+        self.assertEqual((miss, hit), ('MISS', 'HIT'))
+        self.assertEqual(cached_data, data, 'Кэшированный ответ отличается!')
+        self.assertEqual(get_response_cache_stats(), {'hit': 1, 'miss': 1})
+
+        with override_settings(SHARED_CACHE=False):
+            self.assertNotIn(
+                'X-Cache',
+                TaskTests.auth_head_department_1.get(url),
+                'Кэш ответов используется без общего кэша процессов!'
+            )
+
+        self.assertEqual(
+            get_cache_status(TaskTests.auth_head_department_2, url)[0],
+            'MISS',
+            'Ответ одного пользователя выдан другому!'
+        )
+        self.assertEqual(
+            get_cache_status(
+                TaskTests.auth_head_department_1,
+                url + '?ordering=execution_date&page=1'
+            )[0],
+            'MISS'
+        )
+        self.assertEqual(
+            get_cache_status(
+                TaskTests.auth_head_department_1,
+                url + '?page=1&ordering=execution_date'
+            )[0],
+            'HIT',
+            'Параметры запроса не нормализованы!'
+        )
+
+        self.task_1.executors.add(TaskTests.head_department_1_employee)
+        miss, data = get_cache_status(TaskTests.auth_head_department_1, url)
+        self.assertEqual(miss, 'MISS', 'Кэш не сброшен при изменении поручения!')
+        self.assertEqual(data['count'], 2)
+
+        self.assertEqual(
+            get_cache_status(TaskTests.auth_employee_1, url)[0], 'MISS'
+        )
+        self.assertEqual(
+            get_cache_status(TaskTests.auth_employee_1, url)[0],
+            'HIT',
+            'Кэш сброшен для сотрудника без изменений!'
+        )
+
+        TaskTests.group.name = 'changed group'
+        TaskTests.group.save()
+        self.assertEqual(
+            get_cache_status(TaskTests.auth_head_department_1, url)[0],
+            'MISS',
+            'Кэш не сброшен при изменении справочника!'
+        )
+
+        self.task_1.executors.add(TaskTests.employee_1)
+        get_cache_status(TaskTests.auth_employee_1, TaskTests.task_url)
+        TaskTests.auth_deputy_director.post(
+            TaskTests.task_url + f'{self.task_1.id}/fan_out_redirect/',
+            {'redirects': [
+                {'executors': [TaskTests.head_department_1_employee.id]}
+            ]},
+            format='json'
+        )
+        miss, data = get_cache_status(TaskTests.auth_employee_1, TaskTests.task_url)
+        self.assertEqual(
+            miss,
+            'MISS',
+            'Кэш участника вышестоящего поручения не сброшен при перенаправлении!'
+        )
+        self.assertEqual(len(data['results'][0]['redirected_tasks']), 1)
+
+
+    @override_settings(TASK_CHANGES_SAFETY_LAG=timedelta(0))
+    def test_task_changes(self):
+        """
+        Проверка ленты изменений поручений: измененные поручения,
+        удаленные поручения и утраченный доступ с токеном продолжения.
+        """
+
+        url = TaskTests.task_url + 'changes/'
+        client = TaskTests.auth_head_department_1
+
+        def get_changes(client, since):
+            response = client.get(url, {'since': since} if since else None)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return (
+                [task['id'] for task in response.data['changed']],
+                response.data['deleted'],
+                response.data['since']
+            )
+
+        changed, deleted, since = get_changes(client, None)
+        self.assertEqual((changed, deleted), ([self.task_2.id], []))
+        self.assertEqual(
+            get_changes(client, since)[:2],
+            ([], []),
+            'Лента возвращает неизмененные поручения!'
+        )
+
+        self.task_2.resolution = 'changed resolution'
+        self.task_2.save()
+        self.task_1.executors.add(TaskTests.head_department_1_employee)
+        changed, deleted, since = get_changes(client, since)
+        self.assertEqual((changed, deleted), ([self.task_2.id, self.task_1.id], []))
+
+        self.task_1.executors.remove(TaskTests.head_department_1_employee)
+        employee_since = get_changes(TaskTests.auth_employee_1, None)[2]
+        task_2_id = self.task_2.id
+        self.task_2.delete()
+        changed, deleted, since = get_changes(client, since)
+        self.assertEqual(
+            (changed, deleted),
+            ([], [self.task_1.id, task_2_id]),
+            'Удаления не отражены в ленте изменений!'
+        )
+        self.assertEqual(
+            get_changes(TaskTests.auth_employee_1, employee_since)[:2],
+            ([], []),
+            'Удаление чужого поручения отражено в ленте изменений!'
+        )
+        self.assertEqual(
+            get_changes(TaskTests.auth_admin, employee_since)[1],
+            [task_2_id]
+        )
+
+        self.assertEqual(
+            client.get(url, {'since': 'invalid'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+
+    def test_task_changes_safety_lag(self):
+        """
+        Проверка, что токен ленты не продвигается за задержку фиксации:
+        поручение с более ранним updated_at, зафиксированное после
+        выдачи токена, не теряется.
+        """
+
+        url = TaskTests.task_url + 'changes/'
+
+        def get_changes(since):
+            response = TaskTests.auth_admin.get(
+                url, {'since': since} if since else None
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return (
+                [task['id'] for task in response.data['changed']],
+                response.data['since']
+            )
+
+        changed, since = get_changes(None)
+        self.assertEqual(set(changed), {self.task_1.id, self.task_2.id})
+
+        late_task = Task.objects.create(
+            title='late task',
+            initiator=TaskTests.director_employee,
+            group=TaskTests.group,
+            execution_date=date.today() + timedelta(days=10),
+            resolution='late resolution'
+        )
+        Task.objects.filter(pk=late_task.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=30)
+        )
+        changed, since = get_changes(since)
+        self.assertIn(
+            late_task.id,
+            changed,
+            'Поздно зафиксированное поручение пропущено лентой!'
+        )
+
+        Task.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        changed, since = get_changes(since)
+        self.assertEqual(
+            get_changes(since)[0],
+            [],
+            'Токен не продвигается за пределами задержки фиксации!'
+        )
+
+
+    def test_conditional_get(self):
+        """
+        Проверка условных запросов к поручениям: ответ 304
+        для неизмененных поручений и списков без сериализации.
+        """
+
+        task_url = TaskTests.task_url + f'{self.task_2.id}/'
+        client = TaskTests.auth_head_department_1
+
+        for url in (task_url, TaskTests.task_url):
+            response = client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            with CaptureQueriesContext(connection) as queries:
+                not_modified = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(not_modified['ETag'], response['ETag'])
+            self.assertFalse(
+                [query for query in queries
+                 if 'tasks_task_executors' in query['sql']],
+                f'Ответ 304 для "{url}" сериализован!'
+            )
+
+        list_etag = client.get(TaskTests.task_url)['ETag']
+        task_etag = client.get(task_url)['ETag']
+        self.task_1.executors.add(TaskTests.head_department_1_employee)
+        self.assertEqual(
+            client.get(TaskTests.task_url, HTTP_IF_NONE_MATCH=list_etag).status_code,
+            status.HTTP_200_OK,
+            'Изменение видимых поручений не отражено в ETag списка!'
+        )
+        self.assertEqual(
+            client.get(task_url, HTTP_IF_NONE_MATCH=task_etag).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.task_2.resolution = 'changed resolution'
+        self.task_2.save()
+        self.assertEqual(
+            client.get(task_url, HTTP_IF_NONE_MATCH=task_etag).status_code,
+            status.HTTP_200_OK,
+            'Изменение поручения не отражено в ETag!'
+        )
+
+        task_etag = client.get(task_url)['ETag']
+        for params in ({'fields': 'id,title'}, {'format': 'api'}):
+            self.assertEqual(
+                client.get(
+                    task_url, params, HTTP_IF_NONE_MATCH=task_etag
+                ).status_code,
+                status.HTTP_200_OK,
+                f'ETag представления {params} совпадает с полным ответом!'
+            )
+
+        with override_settings(TASK_RESPONSE_CACHE=True):
+            response = client.get(TaskTests.task_url)
+            cached = client.get(TaskTests.task_url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(
+                (cached.status_code, cached['X-Cache']),
+                (status.HTTP_304_NOT_MODIFIED, 'HIT')
+            )
+
+
+    def test_task_tree(self):
+        """
+        Проверка дерева перенаправлений поручения
+        с постоянным числом запросов.
+        """
+
+        def redirect(parent, title, executor):
+            task = Task.objects.create(
+                title=title,
+                initiator=parent.executors.first(),
+                group=TaskTests.group,
+                parent_task=parent,
+                execution_date=parent.execution_date - timedelta(days=1),
+                resolution='redirected resolution'
+            )
+            task.executors.set([executor])
+            return task
+
+        child_1 = redirect(self.task_1, 'child 1', TaskTests.head_department_1_employee)
+        child_2 = redirect(self.task_1, 'child 2', TaskTests.head_department_2_employee)
+        grandchild = redirect(child_1, 'grandchild', TaskTests.employee_1)
+
+        url = TaskTests.task_url + '{}/tree/'
+        with CaptureQueriesContext(connection) as queries:
+            response = TaskTests.auth_director.get(url.format(child_1.id))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task['id'] for task in response.data['ancestors']],
+            [self.task_1.id]
+        )
+        self.assertEqual(response.data['tree']['id'], child_1.id)
+        self.assertEqual(
+            [task['id'] for task in response.data['tree']['children']],
+            [grandchild.id]
+        )
+        self.assertEqual(
+            response.data['tree']['children'][0]['executors'][0]['user'],
+            f'{TaskTests.employee_1_user.last_name} {TaskTests.employee_1_user.first_name}'
+        )
+
+        response = TaskTests.auth_director.get(url.format(self.task_1.id))
+        self.assertEqual(response.data['ancestors'], [])
+        self.assertEqual(
+            [task['id'] for task in response.data['tree']['children']],
+            [child_1.id, child_2.id]
+        )
+        self.assertEqual(
+            response.data['tree']['children'][0]['children'][0]['id'],
+            grandchild.id
+        )
+
+        great_grandchild = redirect(
+            grandchild, 'great-grandchild', TaskTests.employee_2
+        )
+        with CaptureQueriesContext(connection) as deeper_queries:
+            TaskTests.auth_director.get(url.format(child_1.id))
+        self.assertEqual(
+            len(deeper_queries),
+            len(queries),
+            'Число запросов зависит от размера дерева!'
+        )
+
+        tests_data = {
+            TaskTests.auth_employee_1: ['employee_1', status.HTTP_200_OK],
+            TaskTests.auth_employee_2: ['employee_2', status.HTTP_404_NOT_FOUND]
+        }
+        for client, data in tests_data.items():
+            self.assertEqual(
+                client.get(url.format(grandchild.id)).status_code,
+                data[1],
+                f'Статус запроса для "{data[0]}" не соответствует ожидаемому!'
+            )
+
+        response = TaskTests.auth_employee_1.get(url.format(grandchild.id))
+        self.assertEqual(
+            response.data['ancestors'],
+            [
+                {'id': self.task_1.id, 'parent_task': None},
+                {'id': child_1.id, 'parent_task': self.task_1.id}
+            ],
+            'Вышестоящие поручения переданы пользователю без доступа!'
+        )
+        self.assertEqual(response.data['tree']['id'], grandchild.id)
+        self.assertEqual(
+            response.data['tree']['resolution'],
+            'redirected resolution'
+        )
+        self.assertEqual(
+            response.data['tree']['children'][0],
+            {
+                'id': great_grandchild.id,
+                'parent_task': grandchild.id,
+                'children': []
+            },
+            'Перенаправление передано пользователю без доступа!'
+        )
+
+
+    def test_bulk_create_tasks(self):
+        """
+        Проверка массового создания поручений: постоянное число
+        запросов, доступ исполнителей и ошибки по элементам.
+        """
+
+        url = TaskTests.task_url + 'bulk/'
+        client = TaskTests.auth_head_department_1
+
+        def get_items(prefix, count):
+            return [
+                {
+                    'title': f'{prefix} {number}',
+                    'number': str(number),
+                    'group': TaskTests.group.id,
+                    'execution_date': str(date.today() + timedelta(days=10)),
+                    'resolution': 'bulk resolution',
+                    'executors': [TaskTests.employee_1.id]
+                }
+                for number in range(count)
+            ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(url, get_items('small', 2), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        with CaptureQueriesContext(connection) as bulk_queries:
+            response = client.post(url, get_items('large', 40), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            len(bulk_queries),
+            len(queries),
+            'Число запросов зависит от количества поручений!'
+        )
+
+        task = Task.objects.get(id=response.data[0]['id'])
+        self.assertEqual(task.initiator, TaskTests.head_department_1_employee)
+        self.assertEqual(list(task.executors.all()), [TaskTests.employee_1])
+        self.assertEqual(task.status, ON_EXECUTION)
+        self.assertEqual(
+            Task.objects.executed_by(TaskTests.employee_1).count(),
+            42,
+            'Доступ исполнителей не сформирован!'
+        )
+
+        items = get_items('invalid', 3)
+        items[0].update(title='small 1', number='1')
+        items[1]['executors'] = [TaskTests.employee_2.id]
+        items[2]['execution_date'] = str(date.today() - timedelta(days=1))
+        response = client.post(url, items, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [sorted(errors) for errors in response.data['errors']],
+            [['non_field_errors'], ['executors'], ['non_field_errors']],
+            'Ошибки элементов не соответствуют ожидаемым!'
+        )
+        self.assertFalse(
+            Task.objects.filter(title__startswith='invalid').exists(),
+            'Поручения созданы при ошибках в списке!'
+        )
+
+        tests_data = {
+            TaskTests.auth_employee_1: ['employee', status.HTTP_403_FORBIDDEN],
+            TaskTests.guest_client: ['guest_client', status.HTTP_401_UNAUTHORIZED]
+        }
+        for client, data in tests_data.items():
+            self.assertEqual(
+                client.post(url, get_items('forbidden', 1), format='json').status_code,
+                data[1],
+                f'Статус запроса для "{data[0]}" не соответствует ожидаемому!'
+            )
+
+
+    def test_bulk_complete_and_close_tasks(self):
+        """
+        Проверка массовых отметок об исполнении с правами
+        одиночных действий и одним запросом изменения.
+        """
+
+        complete_url = TaskTests.task_url + 'bulk_complete/'
+        close_url = TaskTests.task_url + 'bulk_close/'
+        ids = [self.task_1.id, self.task_2.id]
+
+        response = TaskTests.auth_head_department_1.patch(
+            complete_url,
+            {'ids': ids, 'executions_comment': 'done'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            (response.data['updated'], response.data['rejected']),
+            ([self.task_2.id], [self.task_1.id]),
+            'Права исполнителя не учтены!'
+        )
+        self.task_2.refresh_from_db()
+        self.assertEqual(
+            (self.task_2.is_completed, self.task_2.status, self.task_2.executions_comment),
+            (True, COMPLETED, 'done')
+        )
+        self.assertEqual(
+            TaskTests.auth_head_department_1.get(
+                TaskTests.task_url + 'get_on_execution_tasks/'
+            ).data['count'],
+            0,
+            'Кэш не сброшен после массового изменения!'
+        )
+
+        response = TaskTests.auth_director.patch(close_url, {'ids': ids}, format='json')
+        self.assertEqual(response.data['updated'], ids)
+
+        for task in (self.task_1, self.task_2):
+            task.refresh_from_db()
+            self.assertEqual((task.is_closed, task.status), (True, CLOSED))
+
+        Task.objects.filter(id__in=ids).update(is_closed=False)
+        with CaptureQueriesContext(connection) as queries:
+            response = TaskTests.auth_deputy_director.patch(
+                close_url, {'ids': ids}, format='json'
+            )
+        self.assertEqual(
+            (response.data['updated'], response.data['rejected']),
+            ([self.task_2.id], [self.task_1.id]),
+            'Права инициатора не учтены!'
+        )
+        self.assertEqual(
+            len([query for query in queries
+                 if query['sql'].startswith('UPDATE "tasks_task"')]),
+            1
+        )
+
+        self.assertEqual(
+            TaskTests.auth_head_department_1.patch(
+                close_url, {'ids': []}, format='json'
+            ).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+
+    def test_fan_out_redirect(self):
+        """
+        Проверка массового перенаправления поручения
+        с проверкой исполнителей одним запросом.
+        """
+
+        url = TaskTests.task_url + '{}/fan_out_redirect/'
+        execution_date = self.task_1.execution_date - timedelta(days=1)
+        redirects = [
+            {'executors': [TaskTests.head_department_1_employee.id]},
+            {
+                'executors': [TaskTests.head_department_2_employee.id],
+                'execution_date': str(execution_date),
+                'resolution': 'fan-out resolution'
+            }
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = TaskTests.auth_deputy_director.post(
+                url.format(self.task_1.id), {'redirects': redirects}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        children = Task.objects.filter(parent_task=self.task_1).order_by('id')
+        self.assertEqual(
+            [
+                (
+                    list(task.executors.all()),
+                    task.initiator,
+                    task.execution_date,
+                    task.resolution
+                )
+                for task in children
+            ],
+            [
+                (
+                    [TaskTests.head_department_1_employee],
+                    TaskTests.deputy_director_employee,
+                    self.task_1.execution_date,
+                    self.task_1.resolution
+                ),
+                (
+                    [TaskTests.head_department_2_employee],
+                    TaskTests.deputy_director_employee,
+                    execution_date,
+                    'fan-out resolution'
+                )
+            ]
+        )
+        self.assertTrue(
+            TaskAccess.objects.filter(
+                task=children[0],
+                employee=TaskTests.deputy_director_employee,
+                relation=INITIATOR
+            ).exists(),
+            'Доступ инициатора перенаправления не сформирован!'
+        )
+
+        with CaptureQueriesContext(connection) as fan_out_queries:
+            TaskTests.auth_deputy_director.post(
+                url.format(self.task_1.id), {'redirects': redirects * 5}, format='json'
+            )
+        self.assertEqual(
+            len(fan_out_queries),
+            len(queries),
+            'Число запросов зависит от количества перенаправлений!'
+        )
+
+        response = TaskTests.auth_head_department_1.post(
+            url.format(self.task_2.id),
+            {'redirects': [
+                {'executors': [TaskTests.employee_2.id]},
+                {'executors': [TaskTests.employee_1.id]}
+            ]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [sorted(errors) for errors in response.data['redirects']],
+            [['executors'], []],
+            'Исполнитель вне подразделения не отклонен!'
+        )
+        self.assertFalse(Task.objects.filter(parent_task=self.task_2).exists())
+
+        self.assertEqual(
+            TaskTests.auth_head_department_1.post(
+                url.format(self.task_1.id), {'redirects': redirects}, format='json'
+            ).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+
+
+    def test_export_tasks(self):
+        """
+        Проверка потоковой CSV-выгрузки поручений с учетом
+        фильтров, видимости и без запросов на каждую строку.
+        """
+
+        url = TaskTests.task_url + 'export/'
+
+        def export(client, params=None):
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url, params)
+                content = b''.join(response.streaming_content).decode('utf-8-sig')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+            return list(csv.reader(StringIO(content)))[1:], len(queries)
+
+        rows, queries = export(TaskTests.auth_admin)
+        self.assertEqual([row[0] for row in rows], [str(self.task_1.id), str(self.task_2.id)])
+        self.assertEqual(
+            rows[1][6:9],
+            [
+                f'{TaskTests.deputy_director_user.last_name} '
+                f'{TaskTests.deputy_director_user.first_name}',
+                '',
+                f'{TaskTests.head_department_1_user.last_name} '
+                f'{TaskTests.head_department_1_user.first_name}'
+            ]
+        )
+
+        self.assertEqual(
+            [row[0] for row in export(TaskTests.auth_head_department_1)[0]],
+            [str(self.task_2.id)],
+            'Выгрузка не учитывает видимость поручений!'
+        )
+
+        self.task_1.is_completed = True
+        self.task_1.save()
+        self.assertEqual(
+            [row[0] for row in export(TaskTests.auth_admin, {'status': COMPLETED})[0]],
+            [str(self.task_1.id)],
+            'Выгрузка не учитывает фильтры!'
+        )
+
+        for number in range(20):
+            task = Task.objects.create(
+                title=f'export task {number}',
+                initiator=TaskTests.director_employee,
+                group=TaskTests.group,
+                execution_date=date.today() + timedelta(days=10),
+                resolution='export resolution'
+            )
+            task.executors.set([TaskTests.employee_1, TaskTests.employee_2])
+        rows, more_queries = export(TaskTests.auth_admin)
+        self.assertEqual(len(rows), 22)
+        self.assertEqual(
+            more_queries,
+            queries,
+            'Число запросов зависит от количества строк!'
+        )
+
+
+    def test_ndjson_tasks(self):
+        """
+        Проверка потоковой выдачи списка поручений в формате NDJSON
+        только для администраторов.
+        """
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url, HTTP_ACCEPT='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        tasks = [
+            json.loads(line) for line in
+            b''.join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(
+            tasks,
+            json.loads(json.dumps(TaskTests.auth_admin.get(TaskTests.task_url).data['results'])),
+            'Строки NDJSON не соответствуют списку поручений!'
+        )
+
+        self.assertEqual(
+            TaskTests.auth_director.get(
+                TaskTests.task_url, {'format': 'ndjson'}
+            ).status_code,
+            status.HTTP_403_FORBIDDEN,
+            'Потоковая выгрузка доступна не администратору!'
+        )
+
+        detail_url = f'{TaskTests.task_url}{self.task_1.id}/'
+        self.assertEqual(
+            TaskTests.auth_admin.get(
+                detail_url, {'format': 'ndjson'}
+            ).status_code,
+            status.HTTP_404_NOT_FOUND,
+            'Формат NDJSON доступен не для списка!'
+        )
+        self.assertEqual(
+            TaskTests.auth_admin.get(
+                detail_url, HTTP_ACCEPT='application/x-ndjson'
+            ).status_code,
+            status.HTTP_406_NOT_ACCEPTABLE,
+            'Формат NDJSON доступен не для списка!'
+        )
+        self.assertEqual(
+            TaskTests.auth_admin.get(
+                f'{TaskTests.task_url}get_urgent_tasks/', {'format': 'ndjson'}
+            ).status_code,
+            status.HTTP_404_NOT_FOUND,
+            'Формат NDJSON доступен для дополнительного действия!'
+        )
+
+    def test_search_tasks(self):
+        """
+        Проверка полнотекстового поиска поручений по заголовку,
+        резолюции и комментарию с учетом видимости и релевантности.
+        """
+
+        self.task_1.title = 'Подготовить договор аренды'
+        self.task_1.save()
+        self.task_2.resolution = 'Согласовать договор поставки'
+        self.task_2.executions_comment = 'Договор направлен на подпись'
+        self.task_2.save()
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url, {'search': 'договор'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {task['id'] for task in response.data['results']},
+            {self.task_1.id, self.task_2.id}
+        )
+        ranks = [task['search_rank'] for task in response.data['results']]
+        self.assertEqual(
+            ranks,
+            sorted(ranks, reverse=True),
+            'Результаты поиска не отсортированы по релевантности!'
+        )
+        self.assertIn(
+            '<b>договор</b>',
+            response.data['results'][0]['search_headline'].lower(),
+            'Фрагмент не содержит выделенного слова поиска!'
+        )
+        self.assertGreater(
+            response.data['results'][0]['search_rank'],
+            response.data['results'][1]['search_rank']
+        )
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url, {'search': 'аренды'}
+        )
+        self.assertEqual(
+            [task['id'] for task in response.data['results']],
+            [self.task_1.id]
+        )
+
+        response = TaskTests.auth_head_department_1.get(
+            TaskTests.task_url, {'search': 'договор'}
+        )
+        self.assertEqual(
+            [task['id'] for task in response.data['results']],
+            [self.task_2.id],
+            'Поиск не учитывает видимость поручений!'
+        )
+
+        Task.objects.filter(pk=self.task_2.pk).update(
+            executions_comment='', resolution='test resolution 2'
+        )
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url, {'search': 'поставки'}
+        )
+        self.assertEqual(
+            response.data['results'],
+            [],
+            'Индекс поиска не обновлен после изменения поручения!'
+        )
+
+
+    def test_sparse_fieldsets(self):
+        """
+        Проверка выбора полей (?fields=) и развертывания связей (?expand=):
+        лишние столбцы и связи не загружаются.
+        """
+
+        group_name = Group.objects.get(pk=TaskTests.group.id).name
+
+        with CaptureQueriesContext(connection) as full_queries:
+            response = TaskTests.auth_admin.get(TaskTests.task_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0]['group'],
+            group_name,
+            'Изменено представление поручения без параметров!'
+        )
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as sparse_queries:
+            response = TaskTests.auth_admin.get(
+                TaskTests.task_url,
+                {'fields': 'id,title,group,executors'}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task = next(
+            task for task in response.data['results']
+            if task['id'] == self.task_1.id
+        )
+        self.assertEqual(
+            task,
+            {
+                'id': self.task_1.id,
+                'title': self.task_1.title,
+                'group': TaskTests.group.id,
+                'executors': [TaskTests.deputy_director_employee.id]
+            },
+            'Возвращены незапрошенные поля!'
+        )
+        self.assertLess(len(sparse_queries), len(full_queries))
+        task_queries = [
+            query['sql'] for query in sparse_queries
+            if query['sql'].startswith('SELECT')
+            and 'resolution' in query['sql']
+        ]
+        self.assertEqual(
+            task_queries,
+            [],
+            'Загружены столбцы незапрошенных полей!'
+        )
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url + f'{self.task_1.id}/',
+            {'fields': 'id,group,initiator', 'expand': 'group,initiator'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['group'], group_name)
+        self.assertEqual(
+            set(response.data['initiator']),
+            {'user', 'department', 'role'},
+            'Связь не развернута!'
+        )
+
+        response = TaskTests.auth_admin.get(
+            '/api/employees/', {'fields': 'department,execution_tasks_count'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data['results'][0]),
+            {'department', 'execution_tasks_count'}
+        )
+
+
+    def test_request_metrics(self):
+        """
+        Проверка метрик Prometheus с меткой обработчика запроса.
+        """
+
+        TaskTests.auth_admin.get(TaskTests.task_url + 'get_urgent_tasks/')
+        TaskTests.auth_admin.get('/api/employees/')
+
+        response = TaskTests.guest_client.get('/metrics')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = response.content.decode()
+        for line in (
+            'http_request_duration_seconds_count{view="TaskViewSet.get_urgent_tasks"}',
+            'http_request_sql_queries_count{view="EmployeeViewSet.list"}',
+            'http_request_sql_duration_seconds_count{view="EmployeeViewSet.list"}',
+            'http_response_size_bytes_count{view="TaskViewSet.get_urgent_tasks"}'
+        ):
+            self.assertIn(line, metrics, f'Нет метрики {line}!')
+        self.assertNotIn(
+            'view="metrics_view"',
+            metrics,
+            'Запросы метрик учтены в метриках!'
+        )
+
+
+    def test_task_indexes(self):
+        """
+        Проверка планов (EXPLAIN) запросов вьюсета поручений:
+        видимость (visible_to, executed_by) проверяется по индексу
+        таблицы доступа, изменение - по индексу инициатора.
+        В PostgreSQL план строится по собранной статистике таблиц
+        с поручениями других сотрудников и без последовательного чтения.
+        """
+
+        # Индексы таблицы доступа, начинающиеся с employee_id.
+        access_indexes = ('unique_task_access', 'tasks_taskaccess_employee_id')
+        if connection.vendor == 'postgresql':
+            tasks = Task.objects.bulk_create(
+                Task(
+                    title=f'other task {number}',
+                    initiator=TaskTests.director_employee,
+                    group=TaskTests.group,
+                    execution_date=date.today() + timedelta(days=number % 30),
+                    resolution='other resolution'
+                )
+                for number in range(1000)
+            )
+            TaskAccess.objects.bulk_create(
+                TaskAccess(
+                    employee=TaskTests.director_employee,
+                    task=task,
+                    relation=INITIATOR
+                )
+                for task in tasks
+            )
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE tasks_task, tasks_taskaccess')
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        else:
+            # SQLite создает индекс ограничения уникальности вместе с таблицей.
+            access_indexes = ('sqlite_autoindex_tasks_taskaccess',)
+
+        def get_view_queryset(user, action):
+            request = Request(APIRequestFactory().get(TaskTests.task_url))
+            request.user = user
+            view = TaskViewSet(
+                request=request, action=action, format_kwarg=None, kwargs={}
+            )
+            return view.get_queryset()
+
+        for name, queryset, indexes in (
+            (
+                'visible_to',
+                get_view_queryset(TaskTests.deputy_director_user, 'list'),
+                access_indexes
+            ),
+            (
+                'executed_by',
+                get_view_queryset(TaskTests.employee_1_user, 'retrieve'),
+                access_indexes
+            ),
+            (
+                'initiator',
+                get_view_queryset(TaskTests.deputy_director_user, 'partial_update'),
+                ('task_initiator_idx',)
+            )
+        ):
+            with self.subTest(queryset=name):
+                plan = queryset.explain()
+                self.assertTrue(
+                    any(index in plan for index in indexes),
+                    f'Запрос "{name}" не использует индексы {indexes}:\n{plan}'
+                )
+
+
+    def test_ordering_by_status(self):
+        """Проверка сортировки поручений по срочности статуса."""
+
+        Task.objects.filter(pk=self.task_1.pk).update(status=COMPLETED)
+        Task.objects.filter(pk=self.task_2.pk).update(status=OVERDUE)
+
+        for ordering, expected in (
+            ('status', [self.task_2.id, self.task_1.id]),
+            ('-status', [self.task_1.id, self.task_2.id])
+        ):
+            response = TaskTests.auth_admin.get(
+                TaskTests.task_url, {'ordering': ordering}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [task['id'] for task in response.data['results']],
+                expected,
+                'Поручения отсортированы по коду статуса, а не по срочности!'
+            )
+
+
+    def test_cursor_pagination_ordering(self):
+        """
+        Проверка отказа курсорной пагинации от сортировок,
+        не совпадающих с ключом курсора.
+        """
+
+        for params in (
+            {'ordering': 'status'},
+            {'search': 'test'}
+        ):
+            self.assertEqual(
+                TaskTests.auth_admin.get(
+                    TaskTests.task_url, {'pagination': 'cursor', **params}
+                ).status_code,
+                status.HTTP_400_BAD_REQUEST,
+                f'Сортировка {params} проигнорирована курсорной пагинацией!'
+            )
+
+        response = TaskTests.auth_admin.get(
+            TaskTests.task_url,
+            {'pagination': 'cursor', 'ordering': '-execution_date'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task['id'] for task in response.data['results']],
+            [self.task_2.id, self.task_1.id]
+        )
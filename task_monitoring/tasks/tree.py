@@ -0,0 +1,100 @@
+from django.db import connection
+
+from tasks.models import Task
+from tasks.projections import get_tasks_projection
+
+
+TREE_SQL = '''
+WITH RECURSIVE
+ancestors(id, parent_task_id) AS (
+    SELECT id, parent_task_id FROM {table} WHERE id = %s
+    UNION
+    SELECT task.id, task.parent_task_id FROM {table} task
+    INNER JOIN ancestors ON task.id = ancestors.parent_task_id
+),
+descendants(id, parent_task_id) AS (
+    SELECT id, parent_task_id FROM {table} WHERE id = %s
+    UNION
+    SELECT task.id, task.parent_task_id FROM {table} task
+    INNER JOIN descendants ON task.parent_task_id = descendants.id
+)
+SELECT id, parent_task_id FROM ancestors
+UNION
+SELECT id, parent_task_id FROM descendants
+'''
+
+
+def get_tree_rows(task_id):
+    """
+    Поручение, его вышестоящие поручения и все перенаправления
+    одним рекурсивным запросом (PostgreSQL и SQLite).
+    UNION вместо UNION ALL защищает от зацикленных цепочек.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            TREE_SQL.format(table=connection.ops.quote_name(Task._meta.db_table)),
+            [task_id, task_id]
+        )
+        return dict(cursor.fetchall())
+
+
+def get_task_tree(task_id, visible_tasks=None):
+    """
+    Дерево перенаправлений поручения: цепочка вышестоящих поручений
+    от корневого и вложенное дерево перенаправлений.
+    Узлы в формате TaskGetSerializer, постоянное число запросов.
+
+    Поручения вне visible_tasks (queryset видимых пользователю
+    поручений) сокращаются до id и parent_task.
+    """
+
+    parents = get_tree_rows(task_id)
+    if visible_tasks is None:
+        visible_ids = set(parents)
+    else:
+        visible_ids = set(
+            visible_tasks.filter(pk__in=parents).order_by().values_list(
+                'id', flat=True
+            )
+        )
+    nodes = {
+        node_id: {
+            'id': node_id,
+            'parent_task': parents[node_id],
+            'children': []
+        }
+        for node_id in set(parents) - visible_ids
+    }
+    nodes.update(
+        (node['id'], {**node, 'children': []})
+        for node in get_tasks_projection(sorted(visible_ids))
+    )
+
+    ancestors = []
+    parent_id = parents[task_id]
+    while parent_id not in (None, task_id) and parent_id not in ancestors:
+        ancestors.append(parent_id)
+        parent_id = parents.get(parent_id)
+
+    descendant_ids = set(parents) - set(ancestors) - {task_id}
+    for node_id in sorted(
+        descendant_ids,
+        key=lambda node_id: (
+            node_id not in visible_ids,
+            nodes[node_id].get('execution_date') or '',
+            node_id
+        )
+    ):
+        nodes[parents[node_id]]['children'].append(nodes[node_id])
+
+    return {
+        'ancestors': [
+            {
+                key: value for key, value in nodes[ancestor_id].items()
+                if key != 'children'
+            }
+            for ancestor_id in reversed(ancestors)
+        ],
+        'tree': nodes[task_id]
+    }
@@ -2,7 +2,22 @@ from datetime import date
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    Value,
+    When,
+    prefetch_related_objects
+)
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -17,15 +32,44 @@ from rest_framework import (
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from tasks.filters import TaskFilterSet
-from tasks.models import Group, Task
+from tasks.bulk import create_tasks, update_tasks, validate_tasks
+from tasks.cache import (
+    cache_response,
+    get_directory_modified,
+    get_directory_version,
+    get_tasks_version
+)
+from tasks.changes import get_changes
+from tasks.conditional import ConditionalGetMixin, get_etag, get_timestamp
+from tasks.export import iter_chunks, iter_tasks_csv
+from tasks.fieldsets import SparseFieldsetMixin
+from tasks.filters import TaskFilterSet, TaskOrderingFilter
+from tasks.models import (
+    CLOSED,
+    COMPLETED,
+    EXECUTOR,
+    INITIATOR,
+    OVERDUE,
+    URGENT,
+    Group,
+    Task,
+    TaskTombstone
+)
+from tasks.pagination import TaskPagination
 from tasks.permissions import IsAdminOrManagerOrReadOnly
+from tasks.projections import get_tasks_projection
+from tasks.renderers import NDJSONListMixin
+from tasks.search import get_search_headlines
 from tasks.serializers import (
     GroupSerializer,
+    TaskBulkActionSerializer,
+    TaskBulkCreateSerializer,
     TaskCreateSerializer,
+    TaskFanOutSerializer,
     TaskGetSerializer,
     TaskExecutorUpdateSerializer
 )
+from tasks.tree import get_task_tree
 
 from departments.models import Employee, ROLE_CHOICES
 
@@ -42,7 +86,7 @@ User = get_user_model()
     partial_update=extend_schema(summary='Частичное изменение типа поручения'),
     destroy=extend_schema(summary='Удаление типа поручения'),
 )
-class GroupViewSet(viewsets.ModelViewSet):
+class GroupViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """Вьюсет Типа поручения."""
 
     queryset = Group.objects.all()
@@ -51,6 +95,14 @@ class GroupViewSet(viewsets.ModelViewSet):
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     ordering_fields = ['name',]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.is_field_requested('tasks'):
+            queryset = queryset.prefetch_related(
+                Prefetch('tasks', queryset=Task.objects.only('id', 'group_id'))
+            )
+        return self.defer_sparse_columns(queryset)
+
 
 @extend_schema(tags=['Поручения'])
 @extend_schema_view(
@@ -61,7 +113,12 @@ class GroupViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary='Частичное изменение поручения'),
     destroy=extend_schema(summary='Удаление поручения'),
 )
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(
+    SparseFieldsetMixin,
+    NDJSONListMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     """Вьюсет Поручения."""
 
     queryset = Task.objects.select_related(
@@ -69,13 +126,15 @@ class TaskViewSet(viewsets.ModelViewSet):
     ).prefetch_related(
         'executors'
     ).order_by(
-        'execution_date'
+        'execution_date',
+        'id'
     ).all()
     serializer_class = TaskCreateSerializer
     permission_classes = (IsAdminOrManagerOrReadOnly,)
-    filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
+    pagination_class = TaskPagination
+    filter_backends = (DjangoFilterBackend, TaskOrderingFilter)
     filterset_class = TaskFilterSet
-    ordering_fields = ('execution_date',)
+    ordering_fields = ('execution_date', 'status')
 
     def create(self, request, *args, **kwargs):
         data = request.data
@@ -88,72 +147,190 @@ class TaskViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ['retrieve', 'tree']:
+            queryset = queryset.prefetch_related(None)
+        if self.action in ['list', 'retrieve']:
+            queryset = self.get_sparse_queryset(queryset)
+
+        if (self.request.user.is_staff
+            or self.request.user.employee.is_director()):
+            return queryset
+
+        current_employee = self.request.user.employee
+
+        if (current_employee.is_deputy_director()
+            or current_employee.is_head_department()
+            or current_employee.is_deputy_head_department()):
 
-        if (not self.request.user.is_staff
-            and not self.request.user.employee.is_director()):
-
-            current_employee = self.request.user.employee
-
-            if (current_employee.is_deputy_director()
-                or current_employee.is_head_department()
-                or current_employee.is_deputy_head_department()):
-
-                if self.action in ['update', 'partial_update', 'delete']:
-                    queryset = Task.objects.filter(
-                        initiator=current_employee.id
-                    ).select_related(
-                        'group'
-                    ).prefetch_related(
-                        'executors'
-                    ).all()
-
-                    return queryset
-
-                if self.action in ['list', 'retrieve']:
-                    authors_queryset = Task.objects.filter(
-                        initiator=current_employee.id
-                    ).select_related(
-                        'group'
-                    ).prefetch_related(
-                        'executors'
-                    ).order_by(
-                        'execution_date'
-                    ).all()
-
-                    executors_queryset = Task.objects.filter(
-                        executors__id=current_employee.id
-                    ).select_related(
-                        'group'
-                    ).prefetch_related(
-                        'executors'
-                    ).order_by(
-                        'execution_date'
-                    ).all()
-
-                    result_queryset = authors_queryset | executors_queryset
-
-                    return result_queryset
-
-            else:
-                executors_queryset = Task.objects.filter(
-                    executors__id=current_employee.id
-                ).select_related(
-                    'group'
-                ).prefetch_related(
-                    'executors'
-                ).order_by(
-                    'execution_date'
-                ).all()
-
-                return executors_queryset
-
-        return super().get_queryset()
+            if self.action in ['update', 'partial_update', 'delete']:
+                return queryset.filter(initiator=current_employee.id)
+
+            if self.action in ['list', 'retrieve', 'changes', 'tree', 'export']:
+                return queryset.visible_to(current_employee)
+
+            return queryset
+
+        return queryset.executed_by(current_employee)
 
     def get_serializer_class(self):
         if self.action in ['list', 'retrieve']:
             return TaskGetSerializer
         return super().get_serializer_class()
 
+    def use_projection(self):
+        return (
+            self.action in settings.TASK_PROJECTION_ACTIONS
+            and self.get_sparse_fieldset() is None
+        )
+
+    def get_sparse_queryset(self, queryset):
+        """
+        Загрузка только запрошенных полей поручения (?fields=)
+        и связей: развернутых (?expand=) или в виде идентификаторов.
+        """
+
+        if self.get_sparse_fieldset() is None:
+            return queryset
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if self.is_field_expanded('group'):
+            queryset = queryset.select_related('group')
+        if self.is_field_expanded('initiator'):
+            queryset = queryset.select_related(
+                'initiator__user', 'initiator__department'
+            )
+        if self.is_field_expanded('parent_task'):
+            queryset = queryset.select_related('parent_task__initiator__user')
+
+        if self.is_field_expanded('executors'):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'executors',
+                    queryset=Employee.objects.select_related('user', 'department')
+                )
+            )
+        elif self.is_field_requested('executors'):
+            queryset = queryset.prefetch_related(
+                Prefetch('executors', queryset=Employee.objects.only('id'))
+            )
+        if self.is_field_expanded('redirected_tasks'):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'redirected_tasks',
+                    queryset=Task.objects.select_related('initiator__user')
+                )
+            )
+        elif self.is_field_requested('redirected_tasks'):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'redirected_tasks',
+                    queryset=Task.objects.only('id', 'parent_task_id')
+                )
+            )
+        return self.defer_sparse_columns(queryset)
+
+    def get_tasks_response(self, queryset):
+        """Постраничный ответ со списком поручений."""
+
+        if not self.use_projection():
+            queryset = self.get_sparse_queryset(queryset)
+            tasks = self.paginate_queryset(queryset)
+            if tasks is None:
+                return Response(self.get_serializer(queryset, many=True).data)
+            serializer = self.get_serializer(tasks, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        queryset = queryset.prefetch_related(None).values('id', 'execution_date')
+        rows = self.paginate_queryset(queryset)
+        if rows is None:
+            return Response(
+                get_tasks_projection(row['id'] for row in queryset)
+            )
+        return self.get_paginated_response(
+            get_tasks_projection(row['id'] for row in rows)
+        )
+
+    def get_list_validators(self, queryset):
+        tasks = queryset.order_by().aggregate(
+            updated_at=Max('updated_at'),
+            count=Count('id')
+        )
+        tombstone = self.get_tombstones().order_by(
+            '-id'
+        ).values_list('id', 'deleted_at').first() or (None, None)
+        return (
+            get_etag(
+                'tasks',
+                self.request.user.pk,
+                self.request.get_full_path(),
+                tasks['updated_at'],
+                tasks['count'],
+                tombstone[0],
+                get_directory_version()
+            ),
+            get_timestamp(
+                tasks['updated_at'],
+                tombstone[1],
+                get_directory_modified()
+            )
+        )
+
+    def get_object_validators(self, instance):
+        return (
+            get_etag(
+                'task',
+                instance.pk,
+                instance.updated_at,
+                get_directory_version()
+            ),
+            get_timestamp(instance.updated_at, get_directory_modified())
+        )
+
+    def get_list_response(self, queryset):
+        response = self.get_tasks_response(queryset)
+        search = self.request.query_params.get('search')
+        if search:
+            tasks = response.data
+            if isinstance(tasks, dict):
+                tasks = tasks['results']
+            headlines = get_search_headlines(
+                (task['id'] for task in tasks), search
+            )
+            for task in tasks:
+                task.update(
+                    headlines.get(
+                        task['id'],
+                        {'search_rank': None, 'search_headline': None}
+                    )
+                )
+        return response
+
+    def get_ndjson_chunks(self, queryset):
+        if self.get_sparse_fieldset() is not None:
+            yield from super().get_ndjson_chunks(queryset)
+            return
+        for chunk in iter_chunks(
+            queryset.prefetch_related(None).values_list('id', flat=True),
+            settings.TASK_EXPORT_CHUNK_SIZE
+        ):
+            yield get_tasks_projection(chunk)
+
+    def get_object_response(self, instance):
+        if not self.use_projection():
+            if self.get_sparse_fieldset() is None:
+                prefetch_related_objects([instance], 'executors')
+            return super().get_object_response(instance)
+        return Response(get_tasks_projection([instance.pk])[0])
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 
     @extend_schema(summary='Поручения на исполнении')
     @action(
@@ -161,17 +338,15 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(permissions.IsAuthenticated,),
         serializer_class=TaskGetSerializer
     )
+    @cache_response
     def get_on_execution_tasks(self, request):
         if request.user.is_staff:
             queryset = Task.objects.filter(is_completed=False)
         else:
-            queryset = Task.objects.filter(
-                executors__id=request.user.employee.id,
-                is_completed=False
-            )
-        tasks = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(tasks, many=True)
-        return self.get_paginated_response(serializer.data)
+            queryset = Task.objects.executed_by(
+                request.user.employee
+            ).filter(is_completed=False)
+        return self.get_tasks_response(queryset)
 
 
     @extend_schema(summary='Исходящие поручения')
@@ -180,6 +355,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(permissions.IsAuthenticated,),
         serializer_class=TaskGetSerializer
     )
+    @cache_response
     def get_outgoing_tasks(self, request):
         if request.user.is_staff:
             queryset = Task.objects.filter(
@@ -192,9 +368,7 @@ class TaskViewSet(viewsets.ModelViewSet):
                 is_completed=False,
                 is_closed=False
             )
-        tasks = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(tasks, many=True)
-        return self.get_paginated_response(serializer.data)
+        return self.get_tasks_response(queryset)
 
 
     @extend_schema(summary='Поручения на закрытие')
@@ -203,6 +377,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(permissions.IsAuthenticated,),
         serializer_class=TaskGetSerializer
     )
+    @cache_response
     def get_on_close_tasks(self, request):
         if request.user.is_staff:
             queryset = Task.objects.filter(
@@ -215,9 +390,7 @@ class TaskViewSet(viewsets.ModelViewSet):
                 is_completed=True,
                 is_closed=False
             )
-        tasks = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(tasks, many=True)
-        return self.get_paginated_response(serializer.data)
+        return self.get_tasks_response(queryset)
     
 
     @extend_schema(summary='Поручения на срочное закрытие')
@@ -226,23 +399,15 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(permissions.IsAuthenticated,),
         serializer_class=TaskGetSerializer
     )
+    @cache_response
     def get_urgent_tasks(self, request):
         if request.user.is_staff:
-            queryset = Task.objects.filter(
-                is_completed=False,
-                execution_date__gte=date.today(),
-                execution_date__lte=date.today() + settings.URGENT_EXECUTION_PERIOD
-            )
+            queryset = Task.objects.filter(status=URGENT)
         else:
-            queryset = Task.objects.filter(
-                executors__id=request.user.employee.id,
-                is_completed=False,
-                execution_date__gte=date.today(),
-                execution_date__lte=date.today() + settings.URGENT_EXECUTION_PERIOD
-            )
-        tasks = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(tasks, many=True)
-        return self.get_paginated_response(serializer.data)
+            queryset = Task.objects.executed_by(
+                request.user.employee
+            ).filter(status=URGENT)
+        return self.get_tasks_response(queryset)
     
 
     @extend_schema(summary='Просроченные поручения')
@@ -251,21 +416,210 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(permissions.IsAuthenticated,),
         serializer_class=TaskGetSerializer
     )
+    @cache_response
     def get_overdue_tasks(self, request):
         if request.user.is_staff:
-            queryset = Task.objects.filter(
-                is_completed=False,
-                execution_date__lt=date.today()
+            queryset = Task.objects.filter(status=OVERDUE)
+        else:
+            queryset = Task.objects.executed_by(
+                request.user.employee
+            ).filter(status=OVERDUE)
+        return self.get_tasks_response(queryset)
+
+
+    @extend_schema(
+        summary='Массовое создание поручений',
+        request=TaskBulkCreateSerializer(many=True)
+    )
+    @action(
+        methods=['POST'],
+        detail=False,
+        permission_classes=(IsAdminOrManagerOrReadOnly,)
+    )
+    def bulk(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            return Response(
+                {'non_field_errors': ['Ожидается список поручений.']},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        if len(items) > settings.TASK_BULK_MAX_ITEMS:
+            return Response(
+                {'non_field_errors': [
+                    f'Не более {settings.TASK_BULK_MAX_ITEMS} поручений за запрос.'
+                ]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not request.user.is_staff:
+            items = [
+                {**item, 'initiator': request.user.employee.id}
+                if isinstance(item, dict) else item
+                for item in items
+            ]
+
+        validated, errors = validate_tasks(items, request.user)
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        tasks = create_tasks(validated)
+        return Response(
+            get_tasks_projection(task.id for task in tasks),
+            status=status.HTTP_201_CREATED
+        )
+
+
+    @extend_schema(summary='Выгрузка поручений в CSV')
+    @action(
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def export(self, request):
+        response = StreamingHttpResponse(
+            iter_tasks_csv(
+                self.filter_queryset(self.get_queryset()),
+                settings.TASK_EXPORT_CHUNK_SIZE
+            ),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = 'attachment; filename="tasks.csv"'
+        return response
+
+
+    @extend_schema(summary='Дерево перенаправлений поручения')
+    @action(
+        detail=True,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def tree(self, request, pk):
+        visible_tasks = self.get_queryset()
+        if request.user.is_staff:
+            visible_tasks = None
+        return Response(
+            get_task_tree(self.get_object().pk, visible_tasks),
+            status=status.HTTP_200_OK
+        )
+
+
+    @extend_schema(summary='Лента изменений поручений')
+    @action(
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,),
+        serializer_class=TaskGetSerializer
+    )
+    def changes(self, request):
+        tasks, deleted, token, has_more = get_changes(
+            self.get_queryset(),
+            self.get_tombstones(),
+            request.query_params.get('since'),
+            self.paginator.get_page_size(request)
+        )
+        if self.use_projection():
+            changed = get_tasks_projection(task.id for task in tasks)
         else:
-            queryset = Task.objects.filter(
-                executors__id=request.user.employee.id,
-                is_completed=False,
-                execution_date__lt=date.today()
+            changed = self.get_serializer(tasks, many=True).data
+        return Response(
+            {
+                'changed': changed,
+                'deleted': deleted,
+                'since': token,
+                'has_more': has_more
+            },
+            status=status.HTTP_200_OK
+        )
+
+    def get_tombstones(self):
+        """Отметки об удалении поручений, видимых пользователю."""
+
+        tombstones = TaskTombstone.objects.all()
+        if (self.request.user.is_staff
+            or self.request.user.employee.is_director()):
+            return tombstones
+
+        current_employee = self.request.user.employee
+
+        if (current_employee.is_deputy_director()
+            or current_employee.is_head_department()
+            or current_employee.is_deputy_head_department()):
+            return tombstones.filter(
+                employee=current_employee.id,
+                relation__in=[INITIATOR, EXECUTOR]
+            )
+
+        return tombstones.filter(employee=current_employee.id, relation=EXECUTOR)
+
+
+    @extend_schema(summary='Количество поручений по разделам')
+    @action(
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def summary(self, request):
+        # Без общего кэша версия поручений меняется при каждом запросе,
+        # и сохраненные счетчики никогда не были бы прочитаны.
+        if not settings.SHARED_CACHE:
+            return Response(self.get_summary(request), status=status.HTTP_200_OK)
+
+        if request.user.is_staff:
+            cache_key = f'tasks:summary:{request.user.pk}:{get_tasks_version()}'
+        else:
+            cache_key = 'tasks:summary:{}:{}'.format(
+                request.user.pk,
+                get_tasks_version(request.user.employee.id)
             )
-        tasks = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(tasks, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_summary(request)
+            cache.set(cache_key, data, settings.TASK_SUMMARY_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_summary(self, request):
+        """
+        Количество поручений в разделах get_*_tasks,
+        рассчитанное одним запросом с условной агрегацией.
+        """
+
+        if request.user.is_staff:
+            queryset = Task.objects.alias(
+                is_executor=Value(True),
+                is_initiator=Value(True)
+            )
+        else:
+            current_employee = request.user.employee
+            queryset = Task.objects.alias(
+                is_executor=Exists(
+                    Task.executors.through.objects.filter(
+                        task_id=OuterRef('pk'),
+                        employee_id=current_employee.id
+                    )
+                ),
+                is_initiator=Q(initiator=current_employee.id)
+            ).filter(
+                Q(is_executor=True) | Q(is_initiator=True)
+            )
+
+        return queryset.order_by().aggregate(
+            on_execution=Count(
+                'id',
+                filter=Q(is_executor=True, is_completed=False)
+            ),
+            outgoing=Count(
+                'id',
+                filter=Q(is_initiator=True, is_completed=False, is_closed=False)
+            ),
+            on_close=Count(
+                'id',
+                filter=Q(is_initiator=True, is_completed=True, is_closed=False)
+            ),
+            urgent=Count(
+                'id',
+                filter=Q(is_executor=True, status=URGENT)
+            ),
+            overdue=Count(
+                'id',
+                filter=Q(is_executor=True, status=OVERDUE)
+            )
+        )
 
 
     @extend_schema(summary='Перенаправление поручения')
@@ -275,16 +629,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         permission_classes=(IsAdminOrManagerOrReadOnly,)
     )
     def redirect_task(self, request, pk):
-        if request.user.is_staff or request.user.employee.is_director():
-            current_task = get_object_or_404(Task, pk=pk)
-        else:
-            current_task = get_object_or_404(
-                Task,
-                pk=pk,
-                executors__id=request.user.employee.id,
-                is_closed=False,
-                execution_date__gt=date.today() + settings.URGENT_EXECUTION_PERIOD
-            )
+        current_task = self.get_redirected_task(request, pk)
 
         request_data = {
             'title': current_task.title,
@@ -301,6 +646,62 @@ class TaskViewSet(viewsets.ModelViewSet):
             serializer.save()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors,status=status.HTTP_400_BAD_REQUEST)
+
+
+    @extend_schema(
+        summary='Массовое перенаправление поручения',
+        request=TaskFanOutSerializer
+    )
+    @action(
+        methods=['POST'],
+        detail=True,
+        permission_classes=(IsAdminOrManagerOrReadOnly,)
+    )
+    def fan_out_redirect(self, request, pk):
+        current_task = self.get_redirected_task(request, pk)
+
+        serializer = TaskFanOutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        items = [
+            {
+                'title': current_task.title,
+                'group': current_task.group_id,
+                'parent_task': current_task.id,
+                'resolution': redirect.get('resolution', current_task.resolution),
+                'initiator': request.user.employee.id,
+                'executors': redirect['executors'],
+                'execution_date': redirect.get(
+                    'execution_date', current_task.execution_date
+                )
+            }
+            for redirect in serializer.validated_data['redirects']
+        ]
+        validated, errors = validate_tasks(items, request.user)
+        if any(errors):
+            return Response(
+                {'redirects': errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        tasks = create_tasks(validated)
+        return Response(
+            get_tasks_projection(task.id for task in tasks),
+            status=status.HTTP_201_CREATED
+        )
+
+    def get_redirected_task(self, request, pk):
+        """Поручение, которое пользователь может перенаправить."""
+
+        if request.user.is_staff or request.user.employee.is_director():
+            return get_object_or_404(Task, pk=pk)
+        return get_object_or_404(
+            Task,
+            pk=pk,
+            executors__id=request.user.employee.id,
+            is_closed=False,
+            execution_date__gt=date.today() + settings.URGENT_EXECUTION_PERIOD
+        )
     
 
     @extend_schema(summary='Отметка об исполнении поручения исполнителем')
@@ -367,3 +768,89 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(current_task)
 
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+    @extend_schema(
+        summary='Массовая отметка об исполнении поручений исполнителем',
+        request=TaskBulkActionSerializer
+    )
+    @action(
+        methods=['PATCH'],
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def bulk_complete(self, request):
+        serializer = TaskBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if request.user.is_staff or request.user.employee.is_director():
+            queryset = Task.objects.filter(is_completed=False)
+        else:
+            queryset = Task.objects.executed_by(
+                request.user.employee
+            ).filter(is_completed=False)
+
+        values = {
+            'is_completed': True,
+            'completed_at': timezone.now(),
+            'status': Case(
+                When(is_closed=True, then=Value(CLOSED)),
+                default=Value(COMPLETED)
+            )
+        }
+        if 'executions_comment' in serializer.validated_data:
+            values['executions_comment'] = serializer.validated_data[
+                'executions_comment'
+            ]
+        return self.get_bulk_response(
+            serializer.validated_data['ids'],
+            update_tasks(queryset, serializer.validated_data['ids'], **values)
+        )
+
+
+    @extend_schema(
+        summary='Массовая отметка об исполнении поручений инициатором',
+        request=TaskBulkActionSerializer
+    )
+    @action(
+        methods=['PATCH'],
+        detail=False,
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def bulk_close(self, request):
+        serializer = TaskBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if request.user.is_staff or request.user.employee.is_director():
+            queryset = Task.objects.filter(is_closed=False)
+        else:
+            queryset = Task.objects.filter(
+                initiator=request.user.employee.id,
+                is_completed=True,
+                is_closed=False
+            )
+
+        return self.get_bulk_response(
+            serializer.validated_data['ids'],
+            update_tasks(
+                queryset,
+                serializer.validated_data['ids'],
+                is_closed=True,
+                status=CLOSED
+            )
+        )
+
+    def get_bulk_response(self, ids, updated):
+        """Ответ массового действия: измененные и отклоненные поручения."""
+
+        updated_ids = set(updated)
+        return Response(
+            {
+                'updated': updated,
+                'rejected': [
+                    task_id for task_id in dict.fromkeys(ids)
+                    if task_id not in updated_ids
+                ]
+            },
+            status=status.HTTP_200_OK
+        )
@@ -0,0 +1,104 @@
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+EMPLOYEE_RELATED = 'employee__department'
+
+TOKEN_CACHE_KEY = 'auth:token:{}'
+
+
+def get_token_cache_key(key):
+    return TOKEN_CACHE_KEY.format(sha256(key.encode()).hexdigest())
+
+
+def invalidate_token_cache(keys):
+    """Удаление из кэша результатов аутентификации по токенам."""
+
+    cache.delete_many([get_token_cache_key(key) for key in keys])
+
+
+class EmployeeTokenAuthentication(TokenAuthentication):
+    """
+    Аутентификация по токену, загружающая пользователя,
+    профиль сотрудника и подразделение одним запросом.
+
+    Результат кэшируется на TOKEN_AUTH_CACHE_TIMEOUT секунд
+    и сбрасывается сигналами users.signals. Без общего для процессов
+    кэша (SHARED_CACHE) сброс не дошел бы до других процессов,
+    и кэш не используется.
+    """
+
+    def authenticate_credentials(self, key):
+        if not settings.SHARED_CACHE:
+            return self.get_credentials(key)
+        cache_key = get_token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = self.get_credentials(key)
+            cache.set(cache_key, credentials, settings.TOKEN_AUTH_CACHE_TIMEOUT)
+        return credentials
+
+    def get_credentials(self, key):
+        model = self.get_model()
+        try:
+            token = model.objects.select_related(
+                f'user__{EMPLOYEE_RELATED}'
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
+
+
+class EmployeeJWTAuthentication(JWTAuthentication):
+    """
+    JWT-аутентификация, загружающая пользователя,
+    профиль сотрудника и подразделение одним запросом.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        try:
+            user = self.user_model.objects.select_related(
+                EMPLOYEE_RELATED
+            ).get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."),
+                    code='password_changed'
+                )
+
+        return user
+
+
+class EmployeeJWTScheme(SimpleJWTScheme):
+    target_class = EmployeeJWTAuthentication
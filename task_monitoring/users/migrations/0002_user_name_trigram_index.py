@@ -0,0 +1,35 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def create_name_index(apps, schema_editor):
+    """
+    Триграммный индекс GIN по фамилии, имени и отчеству
+    для поиска сотрудников через ILIKE (только PostgreSQL).
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX user_name_trgm_idx ON users_customuser USING GIN ('
+        'last_name gin_trgm_ops, first_name gin_trgm_ops, second_name gin_trgm_ops'
+        ');'
+    )
+
+
+def drop_name_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_name_trgm_idx;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_name_index, drop_name_index),
+    ]
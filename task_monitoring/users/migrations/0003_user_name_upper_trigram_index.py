@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+def create_upper_name_index(apps, schema_editor):
+    """
+    Триграммный индекс GIN по UPPER(фамилия, имя, отчество).
+    В PostgreSQL icontains компилируется в UPPER(поле::text) LIKE UPPER(%s),
+    поэтому индекс по самим столбцам этим условием не используется.
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_name_trgm_idx;')
+    schema_editor.execute(
+        'CREATE INDEX user_name_trgm_idx ON users_customuser USING GIN ('
+        'UPPER(last_name) gin_trgm_ops, '
+        'UPPER(first_name) gin_trgm_ops, '
+        'UPPER(second_name) gin_trgm_ops'
+        ');'
+    )
+
+
+def create_name_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_name_trgm_idx;')
+    schema_editor.execute(
+        'CREATE INDEX user_name_trgm_idx ON users_customuser USING GIN ('
+        'last_name gin_trgm_ops, first_name gin_trgm_ops, second_name gin_trgm_ops'
+        ');'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_name_index, create_name_index),
+    ]
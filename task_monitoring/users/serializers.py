@@ -4,6 +4,8 @@ from djoser.serializers import UserSerializer, UserCreateSerializer
 
 from rest_framework import serializers
 
+from tasks.fieldsets import SparseFieldsetSerializerMixin
+
 
 User = get_user_model()
 
@@ -32,7 +34,7 @@ class RegisterUserSerializer(UserCreateSerializer):
         return value
 
 
-class CustomUserSerializer(UserSerializer):
+class CustomUserSerializer(SparseFieldsetSerializerMixin, UserSerializer):
     """Кастомный сериализатор Пользователя."""
 
     class Meta:
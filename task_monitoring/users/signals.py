@@ -0,0 +1,44 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from departments.models import Department, Employee
+from users.authentication import invalidate_token_cache
+
+
+User = get_user_model()
+
+
+def invalidate_user_tokens(user_id):
+    invalidate_token_cache(
+        Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    invalidate_token_cache([instance.key])
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_user_tokens(instance.pk)
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def employee_changed(sender, instance, **kwargs):
+    invalidate_user_tokens(instance.user_id)
+
+
+@receiver(post_save, sender=Department)
+def department_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_token_cache(
+            Token.objects.filter(
+                user__employee__department=instance
+            ).values_list('key', flat=True)
+        )
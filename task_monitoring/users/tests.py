@@ -1,9 +1,15 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
-from departments.models import ROLE_CHOICES
+from departments.models import Department, Employee, ROLE_CHOICES
+from users.authentication import get_token_cache_key
 
 
 User = get_user_model()
@@ -180,3 +186,63 @@ class CustomUserTests(APITestCase):
                 response_status[1],
                 f'Статус запроса для "{response_status[0]}" не соответствует ожидаемому!'
             )
+
+
+    def test_cached_token_authentication(self):
+        """Проверка кэширования и сброса аутентификации по токену."""
+
+        cache.clear()
+        token = Token.objects.create(user=CustomUserTests.director_user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        current_user_url = f'/api/users/{CustomUserTests.director_user.id}/'
+
+        self.assertEqual(client.get(current_user_url).status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(current_user_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any('authtoken_token' in query['sql'] for query in context.captured_queries),
+            'Токен повторно загружается из базы данных!'
+        )
+
+        CustomUserTests.director_user.is_active = False
+        CustomUserTests.director_user.save()
+        self.assertEqual(
+            client.get(current_user_url).status_code,
+            status.HTTP_401_UNAUTHORIZED,
+            'Деактивированный пользователь аутентифицирован из кэша!'
+        )
+
+        CustomUserTests.director_user.is_active = True
+        CustomUserTests.director_user.save()
+        self.assertEqual(client.get(current_user_url).status_code, status.HTTP_200_OK)
+
+        department = Department.objects.create(name='test department')
+        Employee.objects.create(
+            user=CustomUserTests.director_user,
+            department=department
+        )
+        client.get(current_user_url)
+        department.name = 'renamed department'
+        department.save()
+        self.assertIsNone(
+            cache.get(get_token_cache_key(token.key)),
+            'Переименование подразделения не сбросило кэш аутентификации!'
+        )
+
+        with override_settings(SHARED_CACHE=False):
+            client.get(current_user_url)
+            with CaptureQueriesContext(connection) as context:
+                client.get(current_user_url)
+            self.assertTrue(
+                any('authtoken_token' in query['sql'] for query in context.captured_queries),
+                'Кэш аутентификации используется без общего кэша процессов!'
+            )
+
+        token.delete()
+        self.assertEqual(
+            client.get(current_user_url).status_code,
+            status.HTTP_401_UNAUTHORIZED,
+            'Удаленный токен принят из кэша!'
+        )
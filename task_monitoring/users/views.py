@@ -11,6 +11,7 @@ from rest_framework.response import Response
 
 from rest_framework.authtoken.models import Token
 
+from tasks.fieldsets import SparseFieldsetMixin
 from users.serializers import CustomUserSerializer
 
 
@@ -26,7 +27,7 @@ User = get_user_model()
     partial_update=extend_schema(summary='Частичное изменение данных данных пользователя'),
     destroy=extend_schema(summary='Удаление данных пользователя'),
 )
-class CustomUserViewSet(UserViewSet):
+class CustomUserViewSet(SparseFieldsetMixin, UserViewSet):
     """Кастомный вьюсет для пользователей."""
 
     queryset = User.objects.all()
@@ -44,7 +45,7 @@ class CustomUserViewSet(UserViewSet):
         if (self.action == 'list'
             and not self.request.user.is_staff):
             queryset = queryset.filter(pk=self.request.user.pk)
-        return queryset
+        return self.defer_sparse_columns(queryset)
     
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()